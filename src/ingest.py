@@ -102,6 +102,24 @@ def load_leie(con: duckdb.DuckDBPyConnection, data_dir: str) -> None:
             END AS rein_date
         FROM read_csv('{path}', header=true, auto_detect=true, all_varchar=true)
     """)
+    _materialize_leie_valid(con)
+
+
+def _materialize_leie_valid(con: duckdb.DuckDBPyConnection) -> None:
+    """Pre-filter LEIE to rows with a usable NPI and exclusion date (signal 1).
+
+    Most LEIE entries have no NPI, so filtering once here keeps the
+    TRIM/placeholder checks out of the per-row spending scan.
+    """
+    con.execute("""
+        CREATE TABLE leie_valid AS
+        SELECT npi, excl_date, excl_type, rein_date, lastname, firstname, busname
+        FROM leie
+        WHERE npi IS NOT NULL
+          AND TRIM(npi) != ''
+          AND npi != '0000000000'
+          AND excl_date IS NOT NULL
+    """)
 
 
 def load_nppes(con: duckdb.DuckDBPyConnection, data_dir: str) -> None:
@@ -201,6 +219,24 @@ def load_nppes(con: duckdb.DuckDBPyConnection, data_dir: str) -> None:
     )
 
 
+def _add_nppes_derived_columns(con: duckdb.DuckDBPyConnection) -> None:
+    """Add per-row NPPES columns that several signals would otherwise recompute.
+
+    display_name — organization name, else "first last" for individuals
+    auth_official_{last,first}_norm — upper-cased, trimmed official names
+    (NULL when blank) used to group NPIs by authorized official.
+    """
+    con.execute("""
+        ALTER TABLE nppes ADD COLUMN display_name VARCHAR;
+        ALTER TABLE nppes ADD COLUMN auth_official_last_norm VARCHAR;
+        ALTER TABLE nppes ADD COLUMN auth_official_first_norm VARCHAR;
+        UPDATE nppes SET
+            display_name = COALESCE(org_name, first_name || ' ' || last_name),
+            auth_official_last_norm = NULLIF(UPPER(TRIM(auth_official_last)), ''),
+            auth_official_first_norm = NULLIF(UPPER(TRIM(auth_official_first)), '');
+    """)
+
+
 def _build_slim_parquet_from_zip(zip_path: str, output_path: str) -> None:
     """Extract only needed columns from NPPES zip into a slim parquet file."""
     import subprocess
@@ -266,8 +302,12 @@ def _materialize_aggregations(con: duckdb.DuckDBPyConnection) -> None:
     """Pre-compute aggregation tables reused by multiple signals.
 
     provider_totals  — per-NPI billing totals (signals 2, 5, 7, report output)
+    provider_enriched — provider_totals joined to NPPES with a display name
     provider_monthly — per-NPI per-month totals (signals 3, 4)
-    spending_em      — E&M code subset of spending (signal 8 upcoding)
+    provider_first_bill — per-NPI first billing month (signal 3)
+    official_networks — NPPES NPIs keyed by normalized authorized official (signals 5, 11, 13)
+    network_totals   — official_networks billing totals per network (signals 11, 13)
+    spending_em      — E&M code subset of spending, with is_high_em flag (signal 8 upcoding)
     spending_hh      — home health HCPCS subset (signal 6 geographic)
     serv_state_monthly — billing_npi × claim_month × servicing state (signal 9)
     """
@@ -286,6 +326,27 @@ def _materialize_aggregations(con: duckdb.DuckDBPyConnection) -> None:
         GROUP BY billing_npi
     """)
 
+    print("  Pre-computing provider_enriched (signals 2, 3, 4, 6, 8)...")
+    con.execute("""
+        CREATE TABLE provider_enriched AS
+        SELECT
+            pt.npi,
+            pt.total_paid,
+            pt.total_claims,
+            pt.total_beneficiaries,
+            n.taxonomy_code,
+            n.state,
+            n.entity_type_code,
+            n.zip_code,
+            n.enumeration_date,
+            n.auth_official_first,
+            n.auth_official_last,
+            n.org_name,
+            n.display_name AS provider_name
+        FROM provider_totals pt
+        LEFT JOIN nppes n ON pt.npi = n.npi
+    """)
+
     print("  Pre-computing provider_code_totals (signals 15, 16, 18)...")
     con.execute("""
         CREATE TABLE provider_code_totals AS
@@ -312,10 +373,52 @@ def _materialize_aggregations(con: duckdb.DuckDBPyConnection) -> None:
         GROUP BY billing_npi, claim_month
     """)
 
+    print("  Pre-computing provider_first_bill (signal 3)...")
+    con.execute("""
+        CREATE TABLE provider_first_bill AS
+        SELECT npi, MIN(claim_month) AS first_bill_month
+        FROM provider_monthly
+        GROUP BY npi
+    """)
+
+    print("  Pre-computing official_networks (signals 5, 11, 13)...")
+    con.execute("""
+        CREATE TABLE official_networks AS
+        SELECT
+            auth_official_last_norm || '|' || auth_official_first_norm AS network_key,
+            auth_official_first_norm AS official_first,
+            auth_official_last_norm AS official_last,
+            npi,
+            org_name,
+            state
+        FROM nppes
+        WHERE auth_official_last_norm IS NOT NULL
+          AND auth_official_first_norm IS NOT NULL
+    """)
+
+    print("  Pre-computing network_totals (signals 11, 13)...")
+    con.execute("""
+        CREATE TABLE network_totals AS
+        SELECT
+            on_net.network_key,
+            on_net.official_first,
+            on_net.official_last,
+            COUNT(DISTINCT on_net.npi) AS npi_count,
+            LIST(DISTINCT on_net.npi) AS npi_list,
+            LIST(DISTINCT on_net.org_name) AS org_names,
+            SUM(pt.total_paid) AS combined_paid,
+            SUM(pt.total_claims) AS combined_claims,
+            SUM(pt.total_beneficiaries) AS combined_beneficiaries
+        FROM official_networks on_net
+        JOIN provider_totals pt ON on_net.npi = pt.npi
+        GROUP BY on_net.network_key, on_net.official_first, on_net.official_last
+    """)
+
     print("  Pre-computing spending_em (E&M codes)...")
     con.execute("""
         CREATE TABLE spending_em AS
-        SELECT billing_npi, hcpcs_code, total_claims, total_paid
+        SELECT billing_npi, hcpcs_code, total_claims, total_paid,
+               hcpcs_code IN ('99215','99205','99223','99233','99245','99255') AS is_high_em
         FROM spending
         WHERE hcpcs_code IN (
             '99201','99202','99203','99204','99205',
@@ -393,7 +496,7 @@ def _materialize_aggregations(con: duckdb.DuckDBPyConnection) -> None:
             n.state,
             n.npi,
             n.entity_type_code,
-            COALESCE(n.org_name, n.first_name || ' ' || n.last_name) AS provider_name,
+            n.display_name AS provider_name,
             SUM(sh.total_paid) AS hh_paid,
             SUM(sh.total_claims) AS hh_claims,
             SUM(sh.unique_beneficiaries) AS hh_beneficiaries
@@ -401,7 +504,7 @@ def _materialize_aggregations(con: duckdb.DuckDBPyConnection) -> None:
         JOIN nppes n ON sh.billing_npi = n.npi
         WHERE n.zip_code IS NOT NULL AND TRIM(n.zip_code) != ''
         GROUP BY n.zip_code, n.state, n.npi, n.entity_type_code,
-                 COALESCE(n.org_name, n.first_name || ' ' || n.last_name)
+                 n.display_name
     """)
 
     elapsed = time.time() - t0
@@ -410,6 +513,20 @@ def _materialize_aggregations(con: duckdb.DuckDBPyConnection) -> None:
     print(f"  provider_totals: {pt_count:,} providers, provider_monthly: {pm_count:,} rows ({elapsed:.1f}s)")
 
 
+def _create_lookup_indexes(con: duckdb.DuckDBPyConnection) -> None:
+    """Build ART indexes for the point lookups signals issue per row.
+
+    DuckDB plans equi-joins as hash joins whether or not an index exists,
+    so only keys probed with ``WHERE key = ?`` get one: signal 19 looks up
+    each flagged hub's billing NPIs by servicing_npi.
+    """
+    print("  Indexing servicing_hub_totals(servicing_npi) (signal 19 lookups)...")
+    con.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sht_servicing_npi
+        ON servicing_hub_totals(servicing_npi)
+    """)
+
+
 def load_all(data_dir: str, memory_limit: str = "2GB") -> duckdb.DuckDBPyConnection:
     """Load all three datasets and return the connection."""
     con = get_connection(data_dir, memory_limit)
@@ -422,6 +539,7 @@ def load_all(data_dir: str, memory_limit: str = "2GB") -> duckdb.DuckDBPyConnect
 
     print("Loading NPPES NPI registry...")
     load_nppes(con, data_dir)
+    _add_nppes_derived_columns(con)
 
     # Print summary stats (fast now that spending is a table)
     spending_count = con.execute("SELECT COUNT(*) FROM spending").fetchone()[0]
@@ -434,6 +552,7 @@ def load_all(data_dir: str, memory_limit: str = "2GB") -> duckdb.DuckDBPyConnect
 
     print("Materializing aggregation tables...")
     _materialize_aggregations(con)
+    _create_lookup_indexes(con)
 
     # Optional: Census ACS ZCTA data for caregiver density signal enrichment
     load_census_zcta(con, data_dir)
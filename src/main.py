@@ -1,6 +1,7 @@
 """Main entry point for the Medicaid Fraud Signal Detection Engine."""
 
 import argparse
+import gc
 import sys
 import time
 import os
@@ -10,7 +11,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.ingest import load_all
 from src.signals import run_all_signals
-from src.output import generate_report, write_report, write_html_report, write_fof_report, write_fof_html_report
+from src.output import generate_report, write_all_reports
 
 
 def main():
@@ -42,6 +43,16 @@ def main():
         default=None,
         help="Output path for Feeding Our Future network fraud HTML report (optional)",
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent JSON outputs for human reading (default: compact)",
+    )
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Gzip the JSON and HTML outputs, appending .gz to their paths",
+    )
     parser.add_argument(
         "--memory-limit",
         default="2GB",
@@ -63,6 +74,10 @@ def main():
 
     con = load_all(args.data_dir, args.memory_limit)
 
+    # Move import-time objects (frozen METHODOLOGY, lookup tables) out of
+    # the collector's reach before allocating per-provider records
+    gc.freeze()
+
     # Get total unique providers scanned
     total_providers = con.execute("""
         SELECT COUNT(DISTINCT billing_npi) FROM spending
@@ -77,18 +92,23 @@ def main():
     print("\nGenerating report...")
     report = generate_report(signal_results, con, total_providers)
 
-    # Write JSON output
-    write_report(report, args.output)
-
-    # Write HTML output if requested
-    if args.html:
-        write_html_report(report, args.html)
-
-    # Write FOF network fraud reports if requested
-    if args.fof_json:
-        write_fof_report(report, args.fof_json)
-    if args.fof_html:
-        write_fof_html_report(report, args.fof_html)
+    output_path, html_path = args.output, args.html
+    fof_json_path, fof_html_path = args.fof_json, args.fof_html
+    if args.gzip:
+        output_path += ".gz"
+        html_path = html_path and html_path + ".gz"
+        fof_json_path = fof_json_path and fof_json_path + ".gz"
+        fof_html_path = fof_html_path and fof_html_path + ".gz"
+
+    # Write JSON output, plus HTML and FOF network fraud reports if requested
+    write_all_reports(
+        report,
+        output_path,
+        html_path=html_path,
+        fof_json_path=fof_json_path,
+        fof_html_path=fof_html_path,
+        pretty=args.pretty,
+    )
 
     elapsed = time.time() - start_time
     minutes = int(elapsed // 60)
@@ -1,9 +1,29 @@
 """Report generation module — JSON and HTML output with risk scoring."""
 
+import copyreg
+import gzip
+import heapq
+import io
 import json
 import html as html_lib
+import multiprocessing
+import os
 import re
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import redirect_stdout
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import count, islice, repeat
+from sys import intern
+from types import MappingProxyType
+from typing import Final
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
 
 VERSION = "3.0.0"
 
@@ -668,6 +688,41 @@ _LEGITIMATE_ENTITY_SUBSTRINGS = [
 _LEGITIMATE_ENTITY_SUBSTRINGS_LOWER = [s.lower() for s in _LEGITIMATE_ENTITY_SUBSTRINGS]
 
 
+def _combine_patterns(patterns: list[re.Pattern]) -> re.Pattern:
+    """Merge compiled patterns into one alternation, keeping each one's case flag."""
+    return re.compile("|".join(
+        f"(?i:{p.pattern})" if p.flags & re.IGNORECASE else f"(?:{p.pattern})"
+        for p in patterns
+    ))
+
+
+def _trie_pattern(words: list[str]) -> str:
+    """Build a prefix-trie regex matching any of the given literal substrings.
+
+    A flat ``a|b|c`` alternation retries every word at every position; the
+    trie shares common prefixes so each position is tested once per branch.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        if "" in node:
+            return ""  # a shorter word already ends here, which is enough to match
+        alts = [re.escape(ch) + build(child) for ch, child in sorted(node.items())]
+        return alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+
+    return build(trie)
+
+
+_LEGITIMATE_NAME_RE = _combine_patterns(_LEGITIMATE_NAME_PATTERNS)
+_LEGITIMATE_ENTITY_SUBSTRING_RE = re.compile(_trie_pattern(_LEGITIMATE_ENTITY_SUBSTRINGS_LOWER))
+_HIGH_THRESHOLD_RE = _combine_patterns(_HIGH_THRESHOLD_PATTERNS)
+
+
 def is_known_legitimate_entity(provider_name: str) -> bool:
     """Return True if the provider name matches a known legitimate entity pattern.
 
@@ -681,17 +736,11 @@ def is_known_legitimate_entity(provider_name: str) -> bool:
         return True
 
     # Check regex patterns (schools, nonprofits, health system chains)
-    for pattern in _LEGITIMATE_NAME_PATTERNS:
-        if pattern.search(provider_name):
-            return True
+    if _LEGITIMATE_NAME_RE.search(provider_name):
+        return True
 
     # Check known entity substrings
-    name_lower = provider_name.lower()
-    for substring in _LEGITIMATE_ENTITY_SUBSTRINGS_LOWER:
-        if substring in name_lower:
-            return True
-
-    return False
+    return _LEGITIMATE_ENTITY_SUBSTRING_RE.search(provider_name.lower()) is not None
 
 
 def is_high_threshold_entity(provider_name: str) -> bool:
@@ -705,10 +754,12 @@ def is_high_threshold_entity(provider_name: str) -> bool:
     """
     if not provider_name:
         return False
-    for pattern in _HIGH_THRESHOLD_PATTERNS:
-        if pattern.search(provider_name):
-            return True
-    return False
+    return _HIGH_THRESHOLD_RE.search(provider_name) is not None
+
+
+# Shared read-only default for records without a risk score, so hot loops
+# don't allocate a fresh dict on every .get("risk_score", ...) miss
+_NO_RISK = MappingProxyType({})
 
 
 # Minimum evidence thresholds for high-threshold entities
@@ -766,6 +817,18 @@ def compute_risk_score(signals: list[dict], total_paid: float) -> dict:
     return {"score": score, "tier": tier, "factors": factors}
 
 
+@lru_cache(maxsize=65536)
+def _money(amount: float) -> str:
+    """Format a dollar amount as ``$1,234.56``; repeated amounts hit the cache."""
+    return f"${amount:,.2f}"
+
+
+@lru_cache(maxsize=65536, typed=True)
+def _num(n: int) -> str:
+    """Format a count with thousands separators."""
+    return f"{n:,}"
+
+
 def generate_case_narrative(provider: dict) -> str:
     """Generate a plain-English case narrative for a flagged provider."""
     name = provider["provider_name"]
@@ -779,7 +842,7 @@ def generate_case_narrative(provider: dict) -> str:
     parts = []
     parts.append(
         f"{name} (NPI: {npi}) is a Medicaid-enrolled {entity} provider "
-        f"based in {state} with ${total_paid:,.2f} in total billing."
+        f"based in {state} with {_money(total_paid)} in total billing."
     )
 
     signal_descriptions = []
@@ -787,195 +850,255 @@ def generate_case_narrative(provider: dict) -> str:
         stype = sig["signal_type"]
         sev = sig["severity"]
         ev = sig["evidence"]
-
-        if stype == "excluded_provider":
-            signal_descriptions.append(
-                f"This provider appears on the OIG exclusion list (excluded {ev.get('exclusion_date', 'unknown date')}) "
-                f"yet continued billing Medicaid for {ev.get('total_claims_after_exclusion', 0):,} claims "
-                f"totaling ${ev.get('total_paid_after_exclusion', 0):,.2f}."
-            )
-        elif stype == "billing_outlier":
-            signal_descriptions.append(
-                f"Their billing of ${ev.get('total_paid', 0):,.2f} is {ev.get('ratio_to_median', 0):.1f}x "
-                f"the median for their specialty ({ev.get('taxonomy_code', 'unknown')}) in {ev.get('state', 'their state')}, "
-                f"exceeding the 99th percentile of ${ev.get('peer_99th_percentile', 0):,.2f}."
-            )
-        elif stype == "rapid_escalation":
-            signal_descriptions.append(
-                f"As a newly enumerated provider (since {ev.get('enumeration_date', 'unknown')}), "
-                f"their billing escalated at a peak 3-month growth rate of {ev.get('peak_3_month_growth_rate', 0):.0f}%, "
-                f"far exceeding the 200% threshold for bust-out schemes."
-            )
-        elif stype == "workforce_impossibility":
-            signal_descriptions.append(
-                f"In their peak month ({ev.get('peak_month', 'unknown')}), this organization billed "
-                f"{ev.get('peak_claims_count', 0):,} claims with {ev.get('distinct_workers_in_month', 1)} servicing providers, "
-                f"implying {ev.get('implied_claims_per_worker_hour', ev.get('implied_claims_per_hour', 0)):.1f} claims "
-                f"per worker per hour — a physically impossible volume."
-            )
-        elif stype == "shared_official":
-            signal_descriptions.append(
-                f"The authorized official ({ev.get('authorized_official_name', 'unknown')}) controls "
-                f"{ev.get('npi_count', 0)} NPIs with combined billing of ${ev.get('combined_total_paid', 0):,.2f}, "
-                f"suggesting a coordinated billing network."
-            )
-        elif stype == "geographic_implausibility":
-            signal_descriptions.append(
-                f"Provider registered in {ev.get('registered_state', 'unknown')} but only "
-                f"{ev.get('home_state_pct', 0):.1f}% of their {ev.get('total_claims', 0):,} claims "
-                f"were serviced in their home state — services are being rendered in "
-                f"{ev.get('foreign_states_count', 0)} other states, suggesting the NPI registration "
-                f"is geographically detached from actual service delivery."
-            )
-        elif stype == "address_clustering":
-            signal_descriptions.append(
-                f"This provider is part of a cluster of {ev.get('npi_count', 0)} NPIs registered at "
-                f"zip code {ev.get('zip_code', 'unknown')} with combined billing of "
-                f"${ev.get('combined_total_paid', 0):,.2f}, indicating a potential ghost office operation."
-            )
-        elif stype == "upcoding":
-            signal_descriptions.append(
-                f"This provider bills high-complexity E&M codes {ev.get('high_level_percentage', 0):.1f}% of the time, "
-                f"compared to a peer average of {ev.get('peer_avg_high_level_percentage', 0):.1f}% — "
-                f"a pattern consistent with systematic upcoding."
-            )
-        elif stype == "concurrent_billing":
-            signal_descriptions.append(
-                f"This individual provider billed in {ev.get('max_states_in_single_month', 0)} different states "
-                f"within a single month, which is physically impossible without telehealth or identity theft."
-            )
-        elif stype == "burst_enrollment_network":
-            signal_descriptions.append(
-                f"This provider is part of a cluster of {ev.get('npi_count', 0)} organizations "
-                f"registered in the same quarter ({ev.get('enrollment_quarter', 'unknown')}) with identical "
-                f"taxonomy ({ev.get('taxonomy_code', 'unknown')}) in {ev.get('state', 'unknown')}, "
-                f"with combined billing of ${ev.get('combined_total_paid', 0):,.2f} — "
-                f"a pattern consistent with coordinated shell entity registration."
-            )
-        elif stype == "coordinated_billing_ramp":
-            signal_descriptions.append(
-                f"This provider belongs to a network of {ev.get('network_npi_count', 0)} NPIs "
-                f"controlled by {ev.get('authorized_official_name', 'the same official')}, "
-                f"where {ev.get('peaking_npi_count', 0)} NPIs peaked billing within "
-                f"{ev.get('peak_spread_months', 0)} month(s) — a coordination fingerprint "
-                f"indicating a synchronized bust-out scheme."
-            )
-        elif stype == "phantom_servicing_hub":
-            signal_descriptions.append(
-                f"The servicing provider NPI {ev.get('servicing_npi', 'unknown')} appears across "
-                f"{ev.get('billing_npi_count', 0)} distinct billing entities with "
-                f"${ev.get('total_paid_through_hub', 0):,.2f} in total payments — "
-                f"suggesting a phantom referral hub or kickback arrangement."
-            )
-        elif stype == "network_beneficiary_dilution":
-            signal_descriptions.append(
-                f"The network controlled by {ev.get('authorized_official_name', 'the same official')} "
-                f"({ev.get('network_npi_count', 0)} NPIs) shows {ev.get('claims_per_beneficiary', 0):.1f} "
-                f"claims per beneficiary — indicating the same small group of beneficiaries "
-                f"is being recycled across multiple shell entities."
-            )
-        elif stype == "caregiver_density_anomaly":
-            census_detail = ""
-            if "census_ratio_to_state_median" in ev:
-                census_detail = (
-                    f" Census data shows only {ev.get('census_vulnerable_population', 0):,} "
-                    f"elderly/disabled residents in this zip, yet billing is "
-                    f"{ev.get('census_ratio_to_state_median', 0):.1f}x the state median per vulnerable person."
+        ev_get = ev.get
+
+        match stype:
+            case "excluded_provider":
+                signal_descriptions.append(
+                    f"This provider appears on the OIG exclusion list (excluded {ev_get('exclusion_date', 'unknown date')}) "
+                    f"yet continued billing Medicaid for {_num(ev_get('total_claims_after_exclusion', 0))} claims "
+                    f"totaling {_money(ev_get('total_paid_after_exclusion', 0))}."
+                )
+            case "billing_outlier":
+                signal_descriptions.append(
+                    f"Their billing of {_money(ev_get('total_paid', 0))} is {ev_get('ratio_to_median', 0):.1f}x "
+                    f"the median for their specialty ({ev_get('taxonomy_code', 'unknown')}) in {ev_get('state', 'their state')}, "
+                    f"exceeding the 99th percentile of {_money(ev_get('peer_99th_percentile', 0))}."
+                )
+            case "rapid_escalation":
+                signal_descriptions.append(
+                    f"As a newly enumerated provider (since {ev_get('enumeration_date', 'unknown')}), "
+                    f"their billing escalated at a peak 3-month growth rate of {ev_get('peak_3_month_growth_rate', 0):.0f}%, "
+                    f"far exceeding the 200% threshold for bust-out schemes."
+                )
+            case "workforce_impossibility":
+                signal_descriptions.append(
+                    f"In their peak month ({ev_get('peak_month', 'unknown')}), this organization billed "
+                    f"{_num(ev_get('peak_claims_count', 0))} claims with {ev_get('distinct_workers_in_month', 1)} servicing providers, "
+                    f"implying {ev_get('implied_claims_per_worker_hour', ev_get('implied_claims_per_hour', 0)):.1f} claims "
+                    f"per worker per hour — a physically impossible volume."
+                )
+            case "shared_official":
+                signal_descriptions.append(
+                    f"The authorized official ({ev_get('authorized_official_name', 'unknown')}) controls "
+                    f"{ev_get('npi_count', 0)} NPIs with combined billing of {_money(ev_get('combined_total_paid', 0))}, "
+                    f"suggesting a coordinated billing network."
+                )
+            case "geographic_implausibility":
+                signal_descriptions.append(
+                    f"Provider registered in {ev_get('registered_state', 'unknown')} but only "
+                    f"{ev_get('home_state_pct', 0):.1f}% of their {_num(ev_get('total_claims', 0))} claims "
+                    f"were serviced in their home state — services are being rendered in "
+                    f"{ev_get('foreign_states_count', 0)} other states, suggesting the NPI registration "
+                    f"is geographically detached from actual service delivery."
+                )
+            case "address_clustering":
+                signal_descriptions.append(
+                    f"This provider is part of a cluster of {ev_get('npi_count', 0)} NPIs registered at "
+                    f"zip code {ev_get('zip_code', 'unknown')} with combined billing of "
+                    f"{_money(ev_get('combined_total_paid', 0))}, indicating a potential ghost office operation."
+                )
+            case "upcoding":
+                signal_descriptions.append(
+                    f"This provider bills high-complexity E&M codes {ev_get('high_level_percentage', 0):.1f}% of the time, "
+                    f"compared to a peer average of {ev_get('peer_avg_high_level_percentage', 0):.1f}% — "
+                    f"a pattern consistent with systematic upcoding."
+                )
+            case "concurrent_billing":
+                signal_descriptions.append(
+                    f"This individual provider billed in {ev_get('max_states_in_single_month', 0)} different states "
+                    f"within a single month, which is physically impossible without telehealth or identity theft."
+                )
+            case "burst_enrollment_network":
+                signal_descriptions.append(
+                    f"This provider is part of a cluster of {ev_get('npi_count', 0)} organizations "
+                    f"registered in the same quarter ({ev_get('enrollment_quarter', 'unknown')}) with identical "
+                    f"taxonomy ({ev_get('taxonomy_code', 'unknown')}) in {ev_get('state', 'unknown')}, "
+                    f"with combined billing of {_money(ev_get('combined_total_paid', 0))} — "
+                    f"a pattern consistent with coordinated shell entity registration."
+                )
+            case "coordinated_billing_ramp":
+                signal_descriptions.append(
+                    f"This provider belongs to a network of {ev_get('network_npi_count', 0)} NPIs "
+                    f"controlled by {ev_get('authorized_official_name', 'the same official')}, "
+                    f"where {ev_get('peaking_npi_count', 0)} NPIs peaked billing within "
+                    f"{ev_get('peak_spread_months', 0)} month(s) — a coordination fingerprint "
+                    f"indicating a synchronized bust-out scheme."
+                )
+            case "phantom_servicing_hub":
+                signal_descriptions.append(
+                    f"The servicing provider NPI {ev_get('servicing_npi', 'unknown')} appears across "
+                    f"{ev_get('billing_npi_count', 0)} distinct billing entities with "
+                    f"{_money(ev_get('total_paid_through_hub', 0))} in total payments — "
+                    f"suggesting a phantom referral hub or kickback arrangement."
+                )
+            case "network_beneficiary_dilution":
+                signal_descriptions.append(
+                    f"The network controlled by {ev_get('authorized_official_name', 'the same official')} "
+                    f"({ev_get('network_npi_count', 0)} NPIs) shows {ev_get('claims_per_beneficiary', 0):.1f} "
+                    f"claims per beneficiary — indicating the same small group of beneficiaries "
+                    f"is being recycled across multiple shell entities."
+                )
+            case "caregiver_density_anomaly":
+                census_detail = ""
+                if "census_ratio_to_state_median" in ev:
+                    census_detail = (
+                        f" Census data shows only {_num(ev_get('census_vulnerable_population', 0))} "
+                        f"elderly/disabled residents in this zip, yet billing is "
+                        f"{ev_get('census_ratio_to_state_median', 0):.1f}x the state median per vulnerable person."
+                    )
+                signal_descriptions.append(
+                    f"This provider is in zip code {ev_get('zip_code', 'unknown')} where "
+                    f"{ev_get('individual_provider_count', 0)} individual home health providers "
+                    f"serve only {ev_get('beneficiaries_per_individual_provider', 0):.1f} beneficiaries each "
+                    f"on average, with combined billing of {_money(ev_get('total_hh_paid', 0))} — "
+                    f"{ev_get('ratio_to_state_median', 0):.1f}x the state median. "
+                    f"This pattern is consistent with family member caregiver fraud rings.{census_detail}"
+                )
+            case "repetitive_service_abuse":
+                signal_descriptions.append(
+                    f"This provider billed HCPCS code {ev_get('hcpcs_code', 'unknown')} "
+                    f"{ev_get('claims_per_beneficiary', 0):.0f} times per beneficiary on average "
+                    f"({_num(ev_get('total_claims', 0))} total claims across {_num(ev_get('total_beneficiaries', 0))} "
+                    f"beneficiaries), compared to a peer 99th percentile of "
+                    f"{ev_get('peer_99th_percentile_claims_per_bene', 0):.0f} — "
+                    f"a pattern consistent with therapy mill or personal care service fabrication."
+                )
+            case "billing_monoculture":
+                signal_descriptions.append(
+                    f"This provider derives {ev_get('dominant_code_share_pct', 0):.1f}% of all claims "
+                    f"from a single procedure code ({ev_get('dominant_hcpcs_code', 'unknown')}), "
+                    f"billing {_num(ev_get('dominant_code_claims', 0))} claims of this one code out of "
+                    f"{_num(ev_get('total_claims_all_codes', 0))} total — a concentration pattern "
+                    f"associated with fraud schemes built around a single high-reimbursement service."
+                )
+            case "billing_bust_out":
+                signal_descriptions.append(
+                    f"This provider's billing peaked at {_money(ev_get('peak_paid', 0))} in "
+                    f"{ev_get('peak_month', 'unknown')} then collapsed to "
+                    f"{ev_get('post_peak_pct_of_peak', 0):.1f}% of peak within 3 months — "
+                    f"the complete ramp-and-abandon lifecycle of organized Medicaid bust-out fraud."
+                )
+            case "reimbursement_rate_anomaly":
+                signal_descriptions.append(
+                    f"This provider receives {_money(ev_get('avg_rate_per_claim', 0))} per claim for "
+                    f"HCPCS code {ev_get('hcpcs_code', 'unknown')}, which is "
+                    f"{ev_get('rate_ratio_to_median', 0):.1f}x the national median of "
+                    f"{_money(ev_get('national_median_rate', 0))} — indicating modifier abuse, "
+                    f"place-of-service fraud, or billing rate manipulation."
+                )
+            case "phantom_servicing_spread":
+                signal_descriptions.append(
+                    f"This servicing provider appears across {ev_get('distinct_billing_npis', 0)} "
+                    f"billing entities with only {_num(ev_get('total_beneficiaries', 0))} unique "
+                    f"beneficiaries across {_num(ev_get('total_claims', 0))} total claims "
+                    f"({ev_get('claims_per_beneficiary', 0):.0f} claims per beneficiary) — "
+                    f"consistent with a phantom servicing hub where most billed services were never rendered."
                 )
-            signal_descriptions.append(
-                f"This provider is in zip code {ev.get('zip_code', 'unknown')} where "
-                f"{ev.get('individual_provider_count', 0)} individual home health providers "
-                f"serve only {ev.get('beneficiaries_per_individual_provider', 0):.1f} beneficiaries each "
-                f"on average, with combined billing of ${ev.get('total_hh_paid', 0):,.2f} — "
-                f"{ev.get('ratio_to_state_median', 0):.1f}x the state median. "
-                f"This pattern is consistent with family member caregiver fraud rings.{census_detail}"
-            )
-        elif stype == "repetitive_service_abuse":
-            signal_descriptions.append(
-                f"This provider billed HCPCS code {ev.get('hcpcs_code', 'unknown')} "
-                f"{ev.get('claims_per_beneficiary', 0):.0f} times per beneficiary on average "
-                f"({ev.get('total_claims', 0):,} total claims across {ev.get('total_beneficiaries', 0):,} "
-                f"beneficiaries), compared to a peer 99th percentile of "
-                f"{ev.get('peer_99th_percentile_claims_per_bene', 0):.0f} — "
-                f"a pattern consistent with therapy mill or personal care service fabrication."
-            )
-        elif stype == "billing_monoculture":
-            signal_descriptions.append(
-                f"This provider derives {ev.get('dominant_code_share_pct', 0):.1f}% of all claims "
-                f"from a single procedure code ({ev.get('dominant_hcpcs_code', 'unknown')}), "
-                f"billing {ev.get('dominant_code_claims', 0):,} claims of this one code out of "
-                f"{ev.get('total_claims_all_codes', 0):,} total — a concentration pattern "
-                f"associated with fraud schemes built around a single high-reimbursement service."
-            )
-        elif stype == "billing_bust_out":
-            signal_descriptions.append(
-                f"This provider's billing peaked at ${ev.get('peak_paid', 0):,.2f} in "
-                f"{ev.get('peak_month', 'unknown')} then collapsed to "
-                f"{ev.get('post_peak_pct_of_peak', 0):.1f}% of peak within 3 months — "
-                f"the complete ramp-and-abandon lifecycle of organized Medicaid bust-out fraud."
-            )
-        elif stype == "reimbursement_rate_anomaly":
-            signal_descriptions.append(
-                f"This provider receives ${ev.get('avg_rate_per_claim', 0):,.2f} per claim for "
-                f"HCPCS code {ev.get('hcpcs_code', 'unknown')}, which is "
-                f"{ev.get('rate_ratio_to_median', 0):.1f}x the national median of "
-                f"${ev.get('national_median_rate', 0):,.2f} — indicating modifier abuse, "
-                f"place-of-service fraud, or billing rate manipulation."
-            )
-        elif stype == "phantom_servicing_spread":
-            signal_descriptions.append(
-                f"This servicing provider appears across {ev.get('distinct_billing_npis', 0)} "
-                f"billing entities with only {ev.get('total_beneficiaries', 0):,} unique "
-                f"beneficiaries across {ev.get('total_claims', 0):,} total claims "
-                f"({ev.get('claims_per_beneficiary', 0):.0f} claims per beneficiary) — "
-                f"consistent with a phantom servicing hub where most billed services were never rendered."
-            )
 
     if signal_descriptions:
         parts.append(" ".join(signal_descriptions))
 
     if overpayment > 0:
-        parts.append(f"Estimated total overpayment: ${overpayment:,.2f}.")
+        parts.append(f"Estimated total overpayment: {_money(overpayment)}.")
 
-    risk = provider.get("risk_score", {})
+    risk = provider.get("risk_score") or {}
     if risk:
-        parts.append(
-            f"Composite risk score: {risk.get('score', 0)}/100 ({risk.get('tier', 'unknown')} risk)."
-        )
+        score = risk.get("score", 0)
+        tier = risk.get("tier", "unknown")
+        parts.append(f"Composite risk score: {score}/100 ({tier} risk).")
 
     return " ".join(parts)
 
 
-def _batch_load_provider_info(npi_list: list[str], con) -> tuple[dict, dict]:
+PROVIDER_INFO_CHUNK_SIZE = 2000
+
+
+def _batch_load_provider_info(
+    npi_list: list[str], con, chunk_size: int = PROVIDER_INFO_CHUNK_SIZE
+) -> tuple[dict, dict]:
     """Batch-load NPPES info and spending totals for all flagged NPIs.
 
     Returns (nppes_map, totals_map) keyed by NPI string.
     This replaces the N+1 per-NPI queries that previously scanned
-    the full spending table once per flagged provider.
+    the full spending table once per flagged provider. Large NPI lists
+    are split into chunks that run concurrently, each on its own cursor.
+    """
+    nppes_map: dict = {}
+    totals_map: dict = {}
+    for _, chunk_nppes, chunk_totals in _iter_provider_info_chunks(npi_list, con, chunk_size):
+        nppes_map.update(chunk_nppes)
+        totals_map.update(chunk_totals)
+    return nppes_map, totals_map
+
+
+# Per-chunk lookup queries. Every chunk binds its NPI list to the same
+# parameterized text, so DuckDB sees one statement shape for the whole report.
+_NPPES_LOOKUP_SQL = """
+    SELECT
+        npi,
+        display_name AS provider_name,
+        CASE WHEN entity_type_code = '1' THEN 'individual' ELSE 'organization' END AS entity_type,
+        taxonomy_code,
+        state,
+        enumeration_date
+    FROM nppes
+    WHERE npi IN (SELECT UNNEST(?::VARCHAR[]))
+"""
+
+_TOTALS_LOOKUP_SQL = """
+    SELECT
+        npi,
+        COALESCE(total_paid, 0)::DOUBLE,
+        COALESCE(total_claims, 0)::BIGINT,
+        COALESCE(total_beneficiaries, 0)::BIGINT
+    FROM provider_totals
+    WHERE npi IN (SELECT UNNEST(?::VARCHAR[]))
+"""
+
+
+def _iter_provider_info_chunks(
+    npi_list: list[str], con, chunk_size: int = PROVIDER_INFO_CHUNK_SIZE
+) -> Iterator[tuple[list[str], dict, dict]]:
+    """Yield (chunk, nppes_map, totals_map) for each chunk of ``npi_list`` in order.
+
+    All chunks are queued on a thread pool up front, so a caller working
+    through one chunk's results overlaps with the queries for later chunks.
     """
     if not npi_list:
-        return {}, {}
+        return
+
+    chunks = [npi_list[i:i + chunk_size] for i in range(0, len(npi_list), chunk_size)]
+    if len(chunks) == 1:
+        yield (chunks[0], *_load_provider_info_chunk(chunks[0], con))
+        return
+
+    def load(chunk: list[str]) -> tuple[list[str], dict, dict]:
+        cur = con.cursor()
+        try:
+            return (chunk, *_load_provider_info_chunk(chunk, cur))
+        finally:
+            cur.close()
 
+    workers = min(len(chunks), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(load, chunks)
+
+
+def _load_provider_info_chunk(npi_list: list[str], con) -> tuple[dict, dict]:
+    """Load NPPES info and spending totals for one chunk of NPIs."""
     # Batch NPPES lookup
     nppes_map = {}
     try:
-        rows = con.execute("""
-            SELECT
-                npi,
-                COALESCE(org_name, first_name || ' ' || last_name) AS provider_name,
-                CASE WHEN entity_type_code = '1' THEN 'individual' ELSE 'organization' END AS entity_type,
-                taxonomy_code,
-                state,
-                enumeration_date
-            FROM nppes
-            WHERE npi IN (SELECT UNNEST(?::VARCHAR[]))
-        """, [npi_list]).fetchall()
+        rows = con.execute(_NPPES_LOOKUP_SQL, [npi_list]).fetchall()
+        # Low-cardinality columns are interned so every record shares one
+        # str object per distinct value (cheaper hashing and comparisons)
         for row in rows:
             nppes_map[row[0]] = {
                 "provider_name": row[1] or "Unknown",
-                "entity_type": row[2] or "unknown",
-                "taxonomy_code": row[3] or "Unknown",
-                "state": row[4] or "Unknown",
+                "entity_type": intern(row[2] or "unknown"),
+                "taxonomy_code": intern(row[3] or "Unknown"),
+                "state": intern(row[4] or "Unknown"),
                 "enumeration_date": str(row[5]) if row[5] else "Unknown",
             }
     except Exception:
@@ -984,20 +1107,13 @@ def _batch_load_provider_info(npi_list: list[str], con) -> tuple[dict, dict]:
     # Batch spending totals from pre-materialized provider_totals table
     totals_map = {}
     try:
-        rows = con.execute("""
-            SELECT
-                npi,
-                total_paid,
-                total_claims,
-                total_beneficiaries
-            FROM provider_totals
-            WHERE npi IN (SELECT UNNEST(?::VARCHAR[]))
-        """, [npi_list]).fetchall()
-        for row in rows:
-            totals_map[row[0]] = {
-                "total_paid": float(row[1] or 0),
-                "total_claims": int(row[2] or 0),
-                "total_beneficiaries": int(row[3] or 0),
+        rows = con.execute(_TOTALS_LOOKUP_SQL, [npi_list]).fetchall()
+        # Typed and null-filled in SQL, so values arrive as float/int
+        for npi, paid, claims, benes in rows:
+            totals_map[npi] = {
+                "total_paid": paid,
+                "total_claims": claims,
+                "total_beneficiaries": benes,
             }
     except Exception:
         pass
@@ -1010,25 +1126,27 @@ def build_provider_record(npi: str, signals: list[dict], nppes_map: dict, totals
 
     Uses pre-loaded nppes_map and totals_map instead of per-NPI queries.
     """
-    info = nppes_map.get(npi, {})
-    provider_name = info.get("provider_name", "Unknown")
-    entity_type = info.get("entity_type", "unknown")
-    taxonomy_code = info.get("taxonomy_code", "Unknown")
-    state = info.get("state", "Unknown")
-    enum_date = info.get("enumeration_date", "Unknown")
+    info_get = nppes_map.get(npi, {}).get
+    provider_name = info_get("provider_name", "Unknown")
+    entity_type = info_get("entity_type", "unknown")
+    taxonomy_code = info_get("taxonomy_code", "Unknown")
+    state = info_get("state", "Unknown")
+    enum_date = info_get("enumeration_date", "Unknown")
 
     # Override with signal-specific info if available
     for sig in signals:
-        ev = sig.get("evidence", {})
-        if "state" in ev and ev["state"]:
-            state = ev["state"]
-        if "taxonomy_code" in ev and ev["taxonomy_code"]:
-            taxonomy_code = ev["taxonomy_code"]
-
-    totals = totals_map.get(npi, {})
-    total_paid = totals.get("total_paid", 0.0)
-    total_claims = totals.get("total_claims", 0)
-    total_beneficiaries = totals.get("total_beneficiaries", 0)
+        ev_get = sig.get("evidence", {}).get
+        ev_state = ev_get("state")
+        if ev_state:
+            state = ev_state
+        ev_taxonomy = ev_get("taxonomy_code")
+        if ev_taxonomy:
+            taxonomy_code = ev_taxonomy
+
+    totals_get = totals_map.get(npi, {}).get
+    total_paid = totals_get("total_paid", 0.0)
+    total_claims = totals_get("total_claims", 0)
+    total_beneficiaries = totals_get("total_beneficiaries", 0)
 
     # Build signal list
     signal_records = []
@@ -1056,13 +1174,14 @@ def build_provider_record(npi: str, signals: list[dict], nppes_map: dict, totals
 
     # Compute composite risk score
     risk = compute_risk_score(signals, total_paid)
+    primary_type = signals[0]["signal_type"]
 
     record = {
         "npi": npi,
         "provider_name": provider_name,
         "entity_type": entity_type,
-        "taxonomy_code": taxonomy_code,
-        "state": state,
+        "taxonomy_code": intern(taxonomy_code),
+        "state": intern(state),
         "enumeration_date": enum_date,
         "total_paid_all_time": round(total_paid, 2),
         "total_claims_all_time": total_claims,
@@ -1071,9 +1190,9 @@ def build_provider_record(npi: str, signals: list[dict], nppes_map: dict, totals
         "estimated_overpayment_usd": round(total_overpayment, 2),
         "risk_score": risk,
         "fca_relevance": {
-            "claim_type": CLAIM_TYPE_MAP.get(signals[0]["signal_type"], "Unknown violation pattern"),
-            "statute_reference": STATUTE_MAP.get(signals[0]["signal_type"], "31 U.S.C. section 3729"),
-            "suggested_next_steps": NEXT_STEPS_MAP.get(signals[0]["signal_type"], [
+            "claim_type": CLAIM_TYPE_MAP.get(primary_type, "Unknown violation pattern"),
+            "statute_reference": STATUTE_MAP.get(primary_type, "31 U.S.C. section 3729"),
+            "suggested_next_steps": NEXT_STEPS_MAP.get(primary_type, [
                 "Request detailed claims data from state Medicaid agency",
                 "Verify provider information through public records",
             ]),
@@ -1086,37 +1205,57 @@ def build_provider_record(npi: str, signals: list[dict], nppes_map: dict, totals
     return record
 
 
+class _SummaryAccumulator:
+    """Incrementally aggregate executive-summary totals in a single pass."""
+
+    TOP_N = 5
+
+    def __init__(self):
+        self.total_overpayment = 0.0
+        self.tier_counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
+        self.state_counts: Counter = Counter()
+        self._top_risk: list[tuple] = []
+        self._seq = 0
+
+    def add(self, p: dict) -> None:
+        risk = p.get("risk_score", _NO_RISK)
+        self.total_overpayment += p["estimated_overpayment_usd"]
+        tier = risk.get("tier", "low")
+        self.tier_counts[tier] = self.tier_counts.get(tier, 0) + 1
+        self.state_counts[p.get("state", "Unknown")] += 1
+
+        # Min-heap of the highest scores; earlier providers win ties
+        entry = (risk.get("score", 0), -self._seq, p)
+        self._seq += 1
+        if len(self._top_risk) < self.TOP_N:
+            heapq.heappush(self._top_risk, entry)
+        elif entry[:2] > self._top_risk[0][:2]:
+            heapq.heapreplace(self._top_risk, entry)
+
+    def top_risk(self) -> list[dict]:
+        ranked = sorted(self._top_risk, key=lambda e: e[:2], reverse=True)
+        return [p for _, _, p in ranked]
+
+
 def generate_executive_summary(report: dict) -> dict:
     """Generate an executive summary section for the report."""
-    providers = report["flagged_providers"]
     signal_counts = report["signal_counts"]
 
-    total_overpayment = sum(p["estimated_overpayment_usd"] for p in providers)
-
-    # Count by risk tier
-    tier_counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
-    for p in providers:
-        tier = p.get("risk_score", {}).get("tier", "low")
-        tier_counts[tier] = tier_counts.get(tier, 0) + 1
+    acc = _SummaryAccumulator()
+    for p in report["flagged_providers"]:
+        acc.add(p)
 
     # Top states by flagged providers
-    state_counts: dict[str, int] = {}
-    for p in providers:
-        st = p.get("state", "Unknown")
-        state_counts[st] = state_counts.get(st, 0) + 1
-    top_states = sorted(state_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+    top_states = acc.state_counts.most_common(5)
 
     # Top signal types by count
     top_signals = sorted(signal_counts.items(), key=lambda x: x[1], reverse=True)
 
-    # Highest-risk providers
-    top_risk = sorted(providers, key=lambda p: p.get("risk_score", {}).get("score", 0), reverse=True)[:5]
-
     return {
         "total_providers_scanned": report["total_providers_scanned"],
         "total_providers_flagged": report["total_providers_flagged"],
-        "total_estimated_overpayment_usd": round(total_overpayment, 2),
-        "risk_tier_distribution": tier_counts,
+        "total_estimated_overpayment_usd": round(acc.total_overpayment, 2),
+        "risk_tier_distribution": acc.tier_counts,
         "top_states_by_flags": [{"state": s, "count": c} for s, c in top_states],
         "signal_type_summary": [{"signal": s, "count": c} for s, c in top_signals],
         "highest_risk_providers": [
@@ -1128,12 +1267,41 @@ def generate_executive_summary(report: dict) -> dict:
                 "signal_count": len(p["signals"]),
                 "estimated_overpayment_usd": p["estimated_overpayment_usd"],
             }
-            for p in top_risk
+            for p in acc.top_risk()
         ],
     }
 
 
-METHODOLOGY = {
+def _freeze(obj):
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+def _mappingproxy_from_dict(d: dict) -> MappingProxyType:
+    return MappingProxyType(d)
+
+
+def _reduce_mappingproxy(proxy):
+    return _mappingproxy_from_dict, (dict(proxy),)
+
+
+# Let frozen report sections cross process boundaries (see write_all_reports)
+copyreg.pickle(MappingProxyType, _reduce_mappingproxy)
+
+
+def _json_default(obj):
+    """JSON fallback: expand frozen mappings, stringify anything else."""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    return str(obj)
+
+
+# Built once and shared read-only by every report
+METHODOLOGY = _freeze({
     "overview": (
         "This tool cross-references three federal datasets — CMS Medicaid Provider Spending (227M rows), "
         "OIG LEIE Exclusion List, and CMS NPPES NPI Registry — to detect 19 categories of fraud signals "
@@ -1265,7 +1433,7 @@ METHODOLOGY = {
             "low": "0-24 — monitor and reassess in next cycle",
         },
     },
-}
+})
 
 
 def _select_top_providers(
@@ -1273,47 +1441,45 @@ def _select_top_providers(
 ) -> list[dict]:
     """Select top providers guaranteeing minimum representation per signal type.
 
+    Accepts providers in any order and ranks them by risk score descending
+    (overpayment as tiebreaker) without sorting the full list.
+
     Strategy:
-    1. First, guarantee at least min_per_signal providers for each signal type
-       (taking the highest-risk providers for each signal).
+    1. Keep a bounded min-heap of size min_per_signal per signal type, so each
+       type retains its highest-risk providers in O(N log K).
     2. Fill remaining slots with the highest-risk providers overall.
     3. Return at most max_providers, sorted by risk score descending.
     """
-    if len(providers) <= max_providers:
-        return providers
+    # Precomputed sort keys; the negated index resolves ties in input order,
+    # as a stable sort would, and lets sorted key tuples map back to providers
+    keys = [
+        (p.get("risk_score", _NO_RISK).get("score", 0), p["estimated_overpayment_usd"], -i)
+        for i, p in enumerate(providers)
+    ]
+    rank = keys.__getitem__
 
-    selected_npis: set[str] = set()
+    if len(providers) <= max_providers:
+        return [providers[-k[2]] for k in sorted(keys, reverse=True)]
 
     # Phase 1: Guarantee min_per_signal per signal type
-    signal_type_providers: dict[str, list[dict]] = {}
-    for p in providers:
-        for sig in p["signals"]:
-            stype = sig["signal_type"]
-            if stype not in signal_type_providers:
-                signal_type_providers[stype] = []
-            signal_type_providers[stype].append(p)
-
-    for stype, stype_providers in signal_type_providers.items():
-        # Deduplicate by NPI (providers already sorted by risk score)
-        seen_npis: set[str] = set()
-        count = 0
-        for p in stype_providers:
-            if p["npi"] not in seen_npis and p["npi"] not in selected_npis:
-                selected_npis.add(p["npi"])
-                seen_npis.add(p["npi"])
-                count += 1
-                if count >= min_per_signal:
-                    break
+    per_sig_heaps: dict[str, list] = {}
+    for i, p in enumerate(providers):
+        key = keys[i]
+        for stype in {sig["signal_type"] for sig in p["signals"]}:
+            h = per_sig_heaps.setdefault(stype, [])
+            if len(h) < min_per_signal:
+                heapq.heappush(h, (key, i))
+            elif key > h[0][0]:
+                heapq.heapreplace(h, (key, i))
+    selected: set[int] = {i for h in per_sig_heaps.values() for _, i in h}
 
     # Phase 2: Fill remaining slots with highest-risk providers
-    for p in providers:
-        if len(selected_npis) >= max_providers:
+    for i in heapq.nlargest(max_providers, range(len(providers)), key=rank):
+        if len(selected) >= max_providers:
             break
-        selected_npis.add(p["npi"])
+        selected.add(i)
 
-    # Return selected providers in original risk-score order
-    result = [p for p in providers if p["npi"] in selected_npis]
-    return result
+    return [providers[-k[2]] for k in sorted((keys[i] for i in selected), reverse=True)]
 
 
 def generate_report(signal_results: dict, con, total_providers_scanned: int) -> dict:
@@ -1327,53 +1493,43 @@ def generate_report(signal_results: dict, con, total_providers_scanned: int) ->
     for signal_type, signals in signal_results.items():
         signal_counts[signal_type] = len(signals)
         for sig in signals:
+            sig["signal_type"] = intern(sig["signal_type"])
+            sig["severity"] = intern(sig["severity"])
             npi = sig["npi"]
             if npi not in npi_signals:
                 npi_signals[npi] = []
             npi_signals[npi].append(sig)
 
-    # Batch-load all provider info and spending totals (replaces N+1 queries)
-    all_npis = list(npi_signals.keys())
-    nppes_map, totals_map = _batch_load_provider_info(all_npis, con)
-
-    # Filter out known legitimate entities and unresolvable NPIs before building records.
+    # Batch-load all provider info and spending totals (replaces N+1 queries).
+    # Records for each chunk are built while later chunks are still querying.
+    # Filter out known legitimate entities and unresolvable NPIs while building records.
     # High-threshold entities (tribal/government) are only excluded if they lack
     # exceptional evidence (3+ distinct signal types with at least 1 high severity).
-    excluded_npis = set()
+    flagged_providers = []
+    filtered_count = 0
     high_threshold_kept = 0
-    for npi in list(npi_signals.keys()):
-        info = nppes_map.get(npi, {})
-        name = info.get("provider_name", "")
-        if not name or is_known_legitimate_entity(name):
-            excluded_npis.add(npi)
-        elif is_high_threshold_entity(name):
-            signals_for_npi = npi_signals[npi]
-            distinct_types = set(s["signal_type"] for s in signals_for_npi)
-            has_high = any(s["severity"] == "high" for s in signals_for_npi)
-            if len(distinct_types) >= HIGH_THRESHOLD_MIN_SIGNAL_TYPES and has_high:
+    for chunk, nppes_map, totals_map in _iter_provider_info_chunks(list(npi_signals), con):
+        for npi in chunk:
+            signals = npi_signals[npi]
+            name = nppes_map.get(npi, {}).get("provider_name", "")
+            if not name or is_known_legitimate_entity(name):
+                filtered_count += 1
+                continue
+            if is_high_threshold_entity(name):
+                distinct_types = {s["signal_type"] for s in signals}
+                has_high = any(s["severity"] == "high" for s in signals)
+                if len(distinct_types) < HIGH_THRESHOLD_MIN_SIGNAL_TYPES or not has_high:
+                    filtered_count += 1
+                    continue
                 high_threshold_kept += 1  # exceptional evidence — keep on report
-            else:
-                excluded_npis.add(npi)
-    if excluded_npis:
-        print(f"  Filtered {len(excluded_npis)} known legitimate entities from flagged results")
+            flagged_providers.append(build_provider_record(npi, signals, nppes_map, totals_map))
+    if filtered_count:
+        print(f"  Filtered {filtered_count} known legitimate entities from flagged results")
     if high_threshold_kept:
         print(f"  Kept {high_threshold_kept} tribal/government entities with exceptional evidence")
 
-    # Build provider records
-    flagged_providers = []
-    for npi, signals in npi_signals.items():
-        if npi in excluded_npis:
-            continue
-        provider = build_provider_record(npi, signals, nppes_map, totals_map)
-        flagged_providers.append(provider)
-
-    # Sort by risk score descending (then overpayment as tiebreaker)
-    flagged_providers.sort(
-        key=lambda p: (p.get("risk_score", {}).get("score", 0), p["estimated_overpayment_usd"]),
-        reverse=True,
-    )
-
-    # Select top 5000 providers, guaranteeing at least 100 per signal type
+    # Select top 5000 providers by risk score (then overpayment as tiebreaker),
+    # guaranteeing at least 100 per signal type
     flagged_providers = _select_top_providers(flagged_providers, max_providers=5000, min_per_signal=100)
 
     report = {
@@ -1393,10 +1549,42 @@ def generate_report(signal_results: dict, con, total_providers_scanned: int) ->
     return report
 
 
-def write_report(report: dict, output_path: str) -> None:
-    """Write the report to a JSON file."""
-    with open(output_path, "w") as f:
-        json.dump(report, f, indent=2, default=str)
+def _dump_json(obj, pretty: bool = False) -> bytes:
+    """Serialize a report to UTF-8 JSON, using orjson when installed.
+
+    Output is compact by default; ``pretty`` indents by two spaces.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_json_default, option=option)
+    # ensure_ascii=False writes raw UTF-8 like orjson, so the file's bytes
+    # don't depend on which backend is installed
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default).encode()
+    return json.dumps(
+        obj, separators=(",", ":"), ensure_ascii=False, default=_json_default
+    ).encode()
+
+
+def _open_output(path: str):
+    """Open ``path`` for binary writing, gzip-compressed if it ends in ``.gz``.
+
+    Level 1 keeps compression cheap next to the disk bandwidth it saves.
+    """
+    if path.endswith(".gz"):
+        return gzip.open(path, "wb", compresslevel=1)
+    return open(path, "wb")
+
+
+def write_report(report: dict, output_path: str, pretty: bool = False) -> None:
+    """Write the report to a JSON file (compact unless ``pretty``).
+
+    A ``.gz`` suffix on ``output_path`` writes the JSON gzip-compressed.
+    """
+    with _open_output(output_path) as f:
+        f.write(_dump_json(report, pretty))
     print(f"\nReport written to: {output_path}")
     print(f"  Providers scanned: {report['total_providers_scanned']:,}")
     print(f"  Providers flagged: {report['total_providers_flagged']:,}")
@@ -1405,31 +1593,75 @@ def write_report(report: dict, output_path: str) -> None:
 
     summary = report.get("executive_summary", {})
     if summary:
-        print(f"\n  Total estimated overpayment: ${summary.get('total_estimated_overpayment_usd', 0):,.2f}")
+        print(f"\n  Total estimated overpayment: {_money(summary.get('total_estimated_overpayment_usd', 0))}")
         tiers = summary.get("risk_tier_distribution", {})
         print(f"  Risk tiers: {tiers.get('critical', 0)} critical, {tiers.get('high', 0)} high, "
               f"{tiers.get('medium', 0)} medium, {tiers.get('low', 0)} low")
 
 
+# Badge/border color per risk tier, shared by both HTML reports
+TIER_COLORS: Final[dict[str, str]] = {"critical": "#dc2626", "high": "#ea580c", "medium": "#ca8a04", "low": "#16a34a"}
+DEFAULT_TIER_COLOR: Final = "#64748b"
+
+
+@lru_cache(maxsize=4096, typed=True)
 def _esc(text: str) -> str:
-    """HTML-escape a string."""
+    """HTML-escape a low-cardinality string (tiers, signal types, states)."""
     return html_lib.escape(str(text))
 
 
+def _esc_nocache(text: str) -> str:
+    """HTML-escape a high-cardinality string (names, NPIs, narratives)."""
+    # Values are almost always str already; skip the str() call for them
+    return html_lib.escape(text if type(text) is str else str(text))
+
+
 def write_html_report(report: dict, output_path: str) -> None:
     """Write an HTML version of the report."""
+    _write_html_lines(output_path, _iter_html_report(report))
+    print(f"HTML report written to: {output_path}")
+
+
+# Write buffer for the HTML reports; a 1 MiB buffer cuts the number of
+# write() syscalls roughly 128x versus the default 8 KiB.
+HTML_WRITE_BUFFER_SIZE: Final = 1 << 20
+
+
+def _write_html_lines(output_path: str, lines: Iterator[str]) -> None:
+    """Stream newline-separated HTML sections to disk as they are produced.
+
+    Only the current section and the file buffer are held in memory, rather
+    than the fully joined document. A ``.gz`` suffix on ``output_path``
+    writes the HTML gzip-compressed.
+    """
+    if output_path.endswith(".gz"):
+        out = gzip.open(output_path, "wt", compresslevel=1, encoding="utf-8")
+    else:
+        out = open(output_path, "w", encoding="utf-8", buffering=HTML_WRITE_BUFFER_SIZE)
+    with out as f:
+        write = f.write
+        first = next(lines, None)
+        if first is None:
+            return
+        write(first)
+        for line in lines:
+            write("\n")
+            write(line)
+
+
+def _iter_html_report(report: dict) -> Iterator[str]:
+    """Yield the main HTML report section by section."""
     summary = report.get("executive_summary", {})
     providers = report.get("flagged_providers", [])
 
-    tier_colors = {"critical": "#dc2626", "high": "#ea580c", "medium": "#ca8a04", "low": "#16a34a"}
+    tier_colors = TIER_COLORS
 
-    lines = []
-    lines.append("<!DOCTYPE html>")
-    lines.append('<html lang="en"><head><meta charset="UTF-8">')
-    lines.append('<meta name="viewport" content="width=device-width,initial-scale=1">')
-    lines.append(f"<title>Medicaid Fraud Signal Report — {_esc(report.get('generated_at', ''))}</title>")
-    lines.append("<style>")
-    lines.append("""
+    yield "<!DOCTYPE html>"
+    yield '<html lang="en"><head><meta charset="UTF-8">'
+    yield '<meta name="viewport" content="width=device-width,initial-scale=1">'
+    yield f"<title>Medicaid Fraud Signal Report — {_esc(report.get('generated_at', ''))}</title>"
+    yield "<style>"
+    yield ("""
 body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
        max-width: 1200px; margin: 0 auto; padding: 20px; background: #f8fafc; color: #1e293b; }
 h1 { color: #0f172a; border-bottom: 3px solid #2563eb; padding-bottom: 10px; }
@@ -1459,133 +1691,148 @@ tr:hover { background: #f1f5f9; }
 .score-fill { height: 100%; border-radius: 4px; }
 footer { margin-top: 40px; padding-top: 20px; border-top: 1px solid #e2e8f0; color: #94a3b8; font-size: 0.85em; }
 """)
-    lines.append("</style></head><body>")
+    yield "</style></head><body>"
 
     # Header
-    lines.append(f"<h1>Medicaid Fraud Signal Detection Report</h1>")
-    lines.append(f"<p>Generated: {_esc(report.get('generated_at', 'Unknown'))} | "
-                 f"Tool Version: {_esc(report.get('tool_version', ''))}</p>")
+    yield f"<h1>Medicaid Fraud Signal Detection Report</h1>"
+    yield (f"<p>Generated: {_esc(report.get('generated_at', 'Unknown'))} | "
+           f"Tool Version: {_esc(report.get('tool_version', ''))}</p>")
 
     # Executive Summary
-    lines.append("<h2>Executive Summary</h2>")
-    lines.append('<div class="summary-grid">')
-    lines.append(f'<div class="summary-card"><div class="label">Providers Scanned</div>'
-                 f'<div class="value">{summary.get("total_providers_scanned", 0):,}</div></div>')
-    lines.append(f'<div class="summary-card"><div class="label">Providers Flagged</div>'
-                 f'<div class="value">{summary.get("total_providers_flagged", 0):,}</div></div>')
-    lines.append(f'<div class="summary-card"><div class="label">Est. Overpayment</div>'
-                 f'<div class="value">${summary.get("total_estimated_overpayment_usd", 0):,.0f}</div></div>')
+    yield "<h2>Executive Summary</h2>"
+    yield '<div class="summary-grid">'
+    yield (f'<div class="summary-card"><div class="label">Providers Scanned</div>'
+           f'<div class="value">{summary.get("total_providers_scanned", 0):,}</div></div>')
+    yield (f'<div class="summary-card"><div class="label">Providers Flagged</div>'
+           f'<div class="value">{summary.get("total_providers_flagged", 0):,}</div></div>')
+    yield (f'<div class="summary-card"><div class="label">Est. Overpayment</div>'
+           f'<div class="value">${summary.get("total_estimated_overpayment_usd", 0):,.0f}</div></div>')
     critical_count = summary.get("risk_tier_distribution", {}).get("critical", 0)
-    lines.append(f'<div class="summary-card"><div class="label">Critical Risk</div>'
-                 f'<div class="value" style="color:#dc2626">{critical_count}</div></div>')
-    lines.append('</div>')
+    yield (f'<div class="summary-card"><div class="label">Critical Risk</div>'
+           f'<div class="value" style="color:#dc2626">{critical_count}</div></div>')
+    yield '</div>'
 
     # Risk tier distribution
     tiers = summary.get("risk_tier_distribution", {})
-    lines.append("<h3>Risk Tier Distribution</h3>")
-    lines.append("<table><tr><th>Tier</th><th>Count</th></tr>")
+    yield "<h3>Risk Tier Distribution</h3>"
+    yield "<table><tr><th>Tier</th><th>Count</th></tr>"
     for tier in ["critical", "high", "medium", "low"]:
-        color = tier_colors.get(tier, "#64748b")
+        color = tier_colors.get(tier, DEFAULT_TIER_COLOR)
         count = tiers.get(tier, 0)
-        lines.append(f'<tr><td><span class="tier-badge" style="background:{color}">{_esc(tier)}</span></td>'
-                     f"<td>{count}</td></tr>")
-    lines.append("</table>")
+        yield (f'<tr><td><span class="tier-badge" style="background:{color}">{_esc(tier)}</span></td>'
+               f"<td>{count}</td></tr>")
+    yield "</table>"
 
     # Signal type summary
-    lines.append("<h3>Signal Type Summary</h3>")
-    lines.append("<table><tr><th>Signal</th><th>Flags</th></tr>")
+    yield "<h3>Signal Type Summary</h3>"
+    yield "<table><tr><th>Signal</th><th>Flags</th></tr>"
     for item in summary.get("signal_type_summary", []):
-        lines.append(f"<tr><td>{_esc(item['signal'])}</td><td>{item['count']}</td></tr>")
-    lines.append("</table>")
+        yield f"<tr><td>{_esc(item['signal'])}</td><td>{item['count']}</td></tr>"
+    yield "</table>"
 
     # Top states
     top_states = summary.get("top_states_by_flags", [])
     if top_states:
-        lines.append("<h3>Top States by Flags</h3>")
-        lines.append("<table><tr><th>State</th><th>Flagged Providers</th></tr>")
+        yield "<h3>Top States by Flags</h3>"
+        yield "<table><tr><th>State</th><th>Flagged Providers</th></tr>"
         for item in top_states:
-            lines.append(f"<tr><td>{_esc(item['state'])}</td><td>{item['count']}</td></tr>")
-        lines.append("</table>")
+            yield f"<tr><td>{_esc(item['state'])}</td><td>{item['count']}</td></tr>"
+        yield "</table>"
 
     # Highest-risk providers table
-    lines.append("<h3>Highest-Risk Providers</h3>")
-    lines.append("<table><tr><th>NPI</th><th>Name</th><th>Score</th><th>Tier</th>"
-                 "<th>Signals</th><th>Est. Overpayment</th></tr>")
+    yield "<h3>Highest-Risk Providers</h3>"
+    yield ("<table><tr><th>NPI</th><th>Name</th><th>Score</th><th>Tier</th>"
+           "<th>Signals</th><th>Est. Overpayment</th></tr>")
     for p in summary.get("highest_risk_providers", []):
         tier = p.get("risk_tier", "low")
-        color = tier_colors.get(tier, "#64748b")
-        lines.append(
-            f'<tr><td>{_esc(p["npi"])}</td><td>{_esc(p["provider_name"])}</td>'
+        color = tier_colors.get(tier, DEFAULT_TIER_COLOR)
+        yield (
+            f'<tr><td>{_esc_nocache(p["npi"])}</td><td>{_esc_nocache(p["provider_name"])}</td>'
             f'<td>{p["risk_score"]}</td>'
             f'<td><span class="tier-badge" style="background:{color}">{_esc(tier)}</span></td>'
             f'<td>{p["signal_count"]}</td>'
-            f'<td>${p["estimated_overpayment_usd"]:,.2f}</td></tr>'
+            f'<td>{_money(p["estimated_overpayment_usd"])}</td></tr>'
         )
-    lines.append("</table>")
+    yield "</table>"
 
     # Provider details
-    lines.append("<h2>Flagged Provider Details</h2>")
-    for p in providers[:5000]:  # Top 5000 in HTML
-        tier = p.get("risk_score", {}).get("tier", "low")
-        score = p.get("risk_score", {}).get("score", 0)
-        color = tier_colors.get(tier, "#64748b")
-
-        lines.append(f'<div class="provider-card {_esc(tier)}">')
-        lines.append(f'<h3>{_esc(p["provider_name"])} — NPI: {_esc(p["npi"])}</h3>')
-        lines.append(f'<p><strong>State:</strong> {_esc(p["state"])} | '
-                     f'<strong>Type:</strong> {_esc(p["entity_type"])} | '
-                     f'<strong>Taxonomy:</strong> {_esc(p["taxonomy_code"])} | '
-                     f'<strong>Total Billing:</strong> ${p["total_paid_all_time"]:,.2f}</p>')
-
-        # Risk score bar
-        lines.append(f'<p><strong>Risk Score:</strong> {score}/100 '
-                     f'<span class="tier-badge" style="background:{color}">{_esc(tier)}</span></p>')
-        lines.append(f'<div class="score-bar"><div class="score-fill" '
-                     f'style="width:{score}%;background:{color}"></div></div>')
-
-        # Signals
-        lines.append("<p><strong>Signals:</strong> ")
-        for sig in p["signals"]:
-            lines.append(f'<span class="signal-tag">{_esc(sig["signal_type"])} ({_esc(sig["severity"])})</span>')
-        lines.append("</p>")
-
-        # Overpayment
-        lines.append(f'<p><strong>Estimated Overpayment:</strong> ${p["estimated_overpayment_usd"]:,.2f}</p>')
-
-        # Case narrative
-        narrative = p.get("case_narrative", "")
-        if narrative:
-            lines.append(f'<div class="narrative">{_esc(narrative)}</div>')
-
-        # FCA relevance
-        fca = p.get("fca_relevance", {})
-        if fca:
-            lines.append(f'<p><strong>FCA Claim Type:</strong> {_esc(fca.get("claim_type", ""))}</p>')
-            lines.append(f'<p><strong>Statute:</strong> {_esc(fca.get("statute_reference", ""))}</p>')
-            steps = fca.get("suggested_next_steps", [])
-            if steps:
-                lines.append("<p><strong>Next Steps:</strong></p><ol>")
-                for step in steps:
-                    lines.append(f"<li>{_esc(step)}</li>")
-                lines.append("</ol>")
-
-        lines.append("</div>")
+    yield "<h2>Flagged Provider Details</h2>"
+    for p in islice(providers, 5000):  # Top 5000 in HTML
+        yield _render_provider_card(p, tier_colors)
 
     if len(providers) > 5000:
-        lines.append(f"<p><em>Showing top 5,000 of {len(providers)} flagged providers. "
-                     f"See JSON report for complete data.</em></p>")
+        yield (f"<p><em>Showing top 5,000 of {len(providers)} flagged providers. "
+               f"See JSON report for complete data.</em></p>")
 
     # Footer
-    lines.append("<footer>")
-    lines.append(f"<p>Medicaid Fraud Signal Detection Engine v{_esc(report.get('tool_version', ''))} | "
-                 f"Report generated {_esc(report.get('generated_at', ''))} | "
-                 f"Data sources: HHS STOP Medicaid Spending, OIG LEIE, CMS NPPES</p>")
-    lines.append("</footer></body></html>")
-
-    html_content = "\n".join(lines)
-    with open(output_path, "w") as f:
-        f.write(html_content)
-    print(f"HTML report written to: {output_path}")
+    yield "<footer>"
+    yield (f"<p>Medicaid Fraud Signal Detection Engine v{_esc(report.get('tool_version', ''))} | "
+           f"Report generated {_esc(report.get('generated_at', ''))} | "
+           f"Data sources: HHS STOP Medicaid Spending, OIG LEIE, CMS NPPES</p>")
+    yield "</footer></body></html>"
+
+
+# Provider detail card, filled with one format_map() call per provider.
+# Optional blocks ({signal_tags}, {narrative}, {fca}) carry their own
+# leading newlines so absent blocks leave no blank lines behind.
+_PROVIDER_CARD_TEMPLATE: Final = (
+    '<div class="provider-card {tier}">\n'
+    '<h3>{name} — NPI: {npi}</h3>\n'
+    '<p><strong>State:</strong> {state} | '
+    '<strong>Type:</strong> {entity_type} | '
+    '<strong>Taxonomy:</strong> {taxonomy} | '
+    '<strong>Total Billing:</strong> {total_paid}</p>\n'
+    '<p><strong>Risk Score:</strong> {score}/100 '
+    '<span class="tier-badge" style="background:{color}">{tier}</span></p>\n'
+    '<div class="score-bar"><div class="score-fill" '
+    'style="width:{score}%;background:{color}"></div></div>\n'
+    '<p><strong>Signals:</strong> {signal_tags}\n'
+    '</p>\n'
+    '<p><strong>Estimated Overpayment:</strong> {overpayment}</p>'
+    '{narrative}{fca}\n'
+    '</div>'
+)
+
+
+def _render_provider_card(p: dict, tier_colors: dict) -> str:
+    """Render one provider detail card from the precompiled card template."""
+    risk = p.get("risk_score", _NO_RISK)
+    tier = risk.get("tier", "low")
+
+    narrative = p.get("case_narrative", "")
+    fca = p.get("fca_relevance", {})
+    fca_html = ""
+    if fca:
+        fca_html = (
+            f'\n<p><strong>FCA Claim Type:</strong> {_esc(fca.get("claim_type", ""))}</p>'
+            f'\n<p><strong>Statute:</strong> {_esc(fca.get("statute_reference", ""))}</p>'
+        )
+        steps = fca.get("suggested_next_steps", [])
+        if steps:
+            fca_html += (
+                "\n<p><strong>Next Steps:</strong></p><ol>"
+                + "".join(f"\n<li>{_esc(step)}</li>" for step in steps)
+                + "\n</ol>"
+            )
+
+    return _PROVIDER_CARD_TEMPLATE.format_map({
+        "tier": _esc(tier),
+        "name": _esc_nocache(p["provider_name"]),
+        "npi": _esc_nocache(p["npi"]),
+        "state": _esc(p["state"]),
+        "entity_type": _esc(p["entity_type"]),
+        "taxonomy": _esc(p["taxonomy_code"]),
+        "total_paid": _money(p["total_paid_all_time"]),
+        "score": risk.get("score", 0),
+        "color": tier_colors.get(tier, DEFAULT_TIER_COLOR),
+        "signal_tags": "".join(
+            f'\n<span class="signal-tag">{_esc(sig["signal_type"])} ({_esc(sig["severity"])})</span>'
+            for sig in p["signals"]
+        ),
+        "overpayment": _money(p["estimated_overpayment_usd"]),
+        "narrative": f'\n<div class="narrative">{_esc_nocache(narrative)}</div>' if narrative else "",
+        "fca": fca_html,
+    })
 
 
 # ---------------------------------------------------------------------------
@@ -1593,7 +1840,7 @@ footer { margin-top: 40px; padding-top: 20px; border-top: 1px solid #e2e8f0; col
 # ---------------------------------------------------------------------------
 
 # Signal types that indicate coordinated group fraud
-FOF_SIGNAL_TYPES = {
+FOF_SIGNAL_TYPES = frozenset({
     "burst_enrollment_network",
     "coordinated_billing_ramp",
     "phantom_servicing_hub",
@@ -1601,7 +1848,12 @@ FOF_SIGNAL_TYPES = {
     "shared_official",
     "address_clustering",
     "phantom_servicing_spread",
-}
+})
+
+
+# Risk tiers in ascending precedence, for picking a network's highest tier
+TIER_NAMES = ("low", "medium", "high", "critical")
+TIER_RANK = {tier: rank for rank, tier in enumerate(TIER_NAMES)}
 
 
 def _extract_network_key(provider: dict) -> str:
@@ -1622,6 +1874,42 @@ def _extract_network_key(provider: dict) -> str:
     return f"standalone:{provider['npi']}"
 
 
+class _NetworkAccumulator:
+    """Running aggregates for one FOF network while its members are grouped."""
+
+    __slots__ = (
+        "members", "paid", "overpayment", "states", "types",
+        "max_risk", "tier_rank", "covid_sigs", "total_sigs",
+    )
+
+    def __init__(self):
+        self.members: list[dict] = []
+        self.paid = 0.0
+        self.overpayment = 0.0
+        self.states: set[str] = set()
+        self.types: set[str] = set()
+        self.max_risk = 0
+        self.tier_rank = 0
+        self.covid_sigs = 0
+        self.total_sigs = 0
+
+    def add(self, p: dict, types_seen: set[str], covid_sigs: int) -> None:
+        risk = p.get("risk_score", _NO_RISK)
+        self.members.append(p)
+        self.paid += p["total_paid_all_time"]
+        self.overpayment += p["estimated_overpayment_usd"]
+        self.states.add(p["state"])
+        self.types |= types_seen
+        score = risk.get("score", 0)
+        if score > self.max_risk:
+            self.max_risk = score
+        rank = TIER_RANK.get(risk.get("tier", "low"), 0)
+        if rank > self.tier_rank:
+            self.tier_rank = rank
+        self.covid_sigs += covid_sigs
+        self.total_sigs += len(p["signals"])
+
+
 def generate_fof_report(report: dict) -> dict:
     """Extract Feeding Our Future-style network fraud findings from the main report.
 
@@ -1629,43 +1917,42 @@ def generate_fof_report(report: dict) -> dict:
     """
     providers = report.get("flagged_providers", [])
 
-    # Filter to providers with at least one FOF-related signal
-    fof_providers = []
+    # Single pass over providers: keep those with at least one FOF-related
+    # signal and fold each straight into its network's running aggregates
+    networks: dict[str, _NetworkAccumulator] = {}
     for p in providers:
-        fof_signals = [s for s in p["signals"] if s["signal_type"] in FOF_SIGNAL_TYPES]
-        if fof_signals:
-            fof_providers.append(p)
+        types_seen = set()
+        covid_sigs = 0
+        for s in p["signals"]:
+            stype = s["signal_type"]
+            if stype in FOF_SIGNAL_TYPES:
+                types_seen.add(stype)
+            if s.get("evidence", {}).get("covid_era_flag"):
+                covid_sigs += 1
+        if not types_seen:
+            continue
 
-    # Group into networks
-    networks: dict[str, list[dict]] = {}
-    for p in fof_providers:
         key = _extract_network_key(p)
-        if key not in networks:
-            networks[key] = []
-        networks[key].append(p)
+        agg = networks.get(key)
+        if agg is None:
+            agg = networks[key] = _NetworkAccumulator()
+        agg.add(p, types_seen, covid_sigs)
 
     # Build network summaries
     network_summaries = []
-    for key, members in networks.items():
+    covid_counts: dict[str, tuple[int, int]] = {}
+    for key, agg in networks.items():
+        members = agg.members
         npis = [m["npi"] for m in members]
-        combined_paid = sum(m["total_paid_all_time"] for m in members)
-        combined_overpayment = sum(m["estimated_overpayment_usd"] for m in members)
-        states = sorted(set(m["state"] for m in members if m["state"] != "Unknown"))
-        signal_types_present = sorted(set(
-            s["signal_type"] for m in members for s in m["signals"]
-            if s["signal_type"] in FOF_SIGNAL_TYPES
-        ))
-        max_risk = max((m.get("risk_score", {}).get("score", 0) for m in members), default=0)
-        max_tier = "low"
-        for m in members:
-            t = m.get("risk_score", {}).get("tier", "low")
-            if t == "critical":
-                max_tier = "critical"
-                break
-            if t == "high" and max_tier not in ("critical",):
-                max_tier = "high"
-            if t == "medium" and max_tier == "low":
-                max_tier = "medium"
+        combined_paid = agg.paid
+        combined_overpayment = agg.overpayment
+        states_set = agg.states
+        states_set.discard("Unknown")
+        states = sorted(states_set)
+        signal_types_present = sorted(agg.types)
+        max_risk = agg.max_risk
+        max_tier = TIER_NAMES[agg.tier_rank]
+        covid_counts[key] = (agg.covid_sigs, agg.total_sigs)
 
         # Extract network label
         if key.startswith("official:"):
@@ -1723,6 +2010,11 @@ def generate_fof_report(report: dict) -> dict:
     actionable = []
     below_threshold_count = 0
     below_threshold_overpayment = 0.0
+    # Summary totals and histograms accumulate as networks pass the filter
+    total_overpayment = 0.0
+    total_providers_in_networks = 0
+    by_type: Counter = Counter()
+    by_tier: Counter = Counter()
 
     for n in network_summaries:
         # Criterion 1: risk tier
@@ -1745,32 +2037,27 @@ def generate_fof_report(report: dict) -> dict:
                 below_threshold_overpayment += n["combined_estimated_overpayment"]
                 continue
 
-        # Criterion 4: not COVID-dominated
-        total_sigs = 0
-        covid_sigs = 0
-        for m in n["members"]:
-            for s in m["signals"]:
-                total_sigs += 1
-                if s.get("evidence", {}).get("covid_era_flag"):
-                    covid_sigs += 1
-        if total_sigs > 0 and covid_sigs / total_sigs >= 0.75:
+        # Criterion 5: 2+ distinct FOF signal types (corroboration)
+        if len(n["signal_types_detected"]) < 2:
             below_threshold_count += 1
             below_threshold_overpayment += n["combined_estimated_overpayment"]
             continue
 
-        # Criterion 5: 2+ distinct FOF signal types (corroboration)
-        if len(n["signal_types_detected"]) < 2:
+        # Criterion 4: not COVID-dominated (checked last; needs a lookup and a ratio)
+        covid_sigs, total_sigs = covid_counts[n["network_key"]]
+        if total_sigs > 0 and covid_sigs / total_sigs >= 0.75:
             below_threshold_count += 1
             below_threshold_overpayment += n["combined_estimated_overpayment"]
             continue
 
         actionable.append(n)
+        total_overpayment += n["combined_estimated_overpayment"]
+        total_providers_in_networks += n["member_count"]
+        by_type[n["network_type"]] += 1
+        by_tier[n["highest_risk_tier"]] += 1
 
     network_summaries = actionable
 
-    total_overpayment = sum(n["combined_estimated_overpayment"] for n in network_summaries)
-    total_providers_in_networks = sum(n["member_count"] for n in network_summaries)
-
     fof_report = {
         "generated_at": report.get("generated_at", ""),
         "tool_version": report.get("tool_version", ""),
@@ -1787,59 +2074,216 @@ def generate_fof_report(report: dict) -> dict:
             "total_networks_detected": len(network_summaries),
             "total_providers_in_networks": total_providers_in_networks,
             "total_estimated_network_overpayment": round(total_overpayment, 2),
-            "networks_by_type": {},
-            "tier_distribution": {"critical": 0, "high": 0, "medium": 0, "low": 0},
+            "networks_by_type": dict(by_type),
+            "tier_distribution": {t: by_tier[t] for t in ("critical", "high", "medium", "low")},
             "below_threshold_networks": below_threshold_count,
             "below_threshold_estimated_overpayment": round(below_threshold_overpayment, 2),
         },
         "networks": network_summaries,
     }
 
-    # Count by network type and tier
-    for n in network_summaries:
-        ntype = n["network_type"]
-        fof_report["summary"]["networks_by_type"][ntype] = (
-            fof_report["summary"]["networks_by_type"].get(ntype, 0) + 1
-        )
-        fof_report["summary"]["tier_distribution"][n["highest_risk_tier"]] += 1
-
     return fof_report
 
 
-def write_fof_report(report: dict, output_path: str) -> None:
-    """Write the FOF network fraud report to JSON."""
-    fof = generate_fof_report(report)
-    with open(output_path, "w") as f:
-        json.dump(fof, f, indent=2, default=str)
+def write_fof_report(
+    report: dict, output_path: str, fof: dict | None = None, pretty: bool = False
+) -> None:
+    """Write the FOF network fraud report to JSON (compact unless ``pretty``).
+
+    Pass a precomputed ``fof`` (from generate_fof_report) to skip rebuilding it.
+    """
+    if fof is None:
+        fof = generate_fof_report(report)
+    write_fof_json(fof, output_path, pretty)
+
+
+def write_fof_json(fof: dict, output_path: str, pretty: bool = False) -> None:
+    """Write a generate_fof_report() result to JSON (compact unless ``pretty``).
+
+    A ``.gz`` suffix on ``output_path`` writes the JSON gzip-compressed.
+    """
+    with _open_output(output_path) as f:
+        f.write(_dump_json(fof, pretty))
 
     print(f"\nFOF Network Report written to: {output_path}")
     print(f"  Actionable networks: {fof['summary']['total_networks_detected']}")
     print(f"  Providers in networks: {fof['summary']['total_providers_in_networks']}")
-    print(f"  Est. network overpayment: ${fof['summary']['total_estimated_network_overpayment']:,.2f}")
+    print(f"  Est. network overpayment: {_money(fof['summary']['total_estimated_network_overpayment'])}")
     below = fof["summary"].get("below_threshold_networks", 0)
     below_op = fof["summary"].get("below_threshold_estimated_overpayment", 0)
     if below:
-        print(f"  Below-threshold networks filtered: {below} (${below_op:,.2f})")
+        print(f"  Below-threshold networks filtered: {below} ({_money(below_op)})")
     by_type = fof["summary"]["networks_by_type"]
     for ntype, count in sorted(by_type.items(), key=lambda x: x[1], reverse=True):
         print(f"    {ntype}: {count}")
 
 
-def write_fof_html_report(report: dict, output_path: str) -> None:
-    """Write an HTML version of the FOF network fraud report."""
-    fof = generate_fof_report(report)
+# Top-networks summary row and network detail card, each filled with one
+# format_map() call over the network's shared field dict (see
+# _escape_network_fields) plus its own keys. As with the provider card,
+# optional blocks ({signals}, {member_rows}, {more_members}, {narratives})
+# carry their own leading newlines.
+_NETWORK_ROW_TEMPLATE: Final = (
+    '<tr><td>{i}</td>'
+    '<td>{label}</td>'
+    '<td>{members}</td>'
+    '<td>{top_states}</td>'
+    '<td>${paid:,.0f}</td>'
+    '<td style="font-weight:600">${overpayment:,.0f}</td>'
+    '<td><span class="tier-badge" style="background:{color}">{tier}</span></td>'
+    '</tr>'
+)
+
+_NETWORK_CARD_TEMPLATE: Final = (
+    '<div class="network-card {tier}">\n'
+    '<h3>#{i}. {label}</h3>\n'
+    '<p><strong>Type:</strong> {network_type} | '
+    '<strong>Members:</strong> {members} | '
+    '<strong>States:</strong> {states} | '
+    '<strong>Risk:</strong> '
+    '<span class="tier-badge" style="background:{color}">{tier}</span></p>\n'
+    '<p><strong>Combined Billing:</strong> {paid_usd} | '
+    '<strong>Est. Overpayment:</strong> '
+    '<span style="color:#dc2626;font-weight:600">{overpayment_usd}</span></p>'
+    '{signals}\n'
+    '<table class="member-table"><tr><th>NPI</th><th>Name</th>'
+    '<th>State</th><th>Billing</th><th>Overpayment</th><th>Risk Score</th></tr>'
+    '{member_rows}{more_members}\n'
+    '</table>{narratives}\n'
+    '</div>'
+)
+
+
+def _score_of(member: dict) -> int:
+    """Composite risk score of a provider record, 0 when it has none."""
+    return member.get("risk_score", _NO_RISK).get("score", 0)
+
+
+def _tier_color_map(networks: Iterable[dict], tier_colors: dict[str, str]) -> dict[str, str]:
+    """Map each risk tier present in ``networks`` to its badge color."""
+    return {
+        tier: tier_colors.get(tier, DEFAULT_TIER_COLOR)
+        for tier in {n["highest_risk_tier"] for n in networks}
+    }
+
+
+def _escape_network_fields(n: dict, color_of: dict[str, str]) -> dict:
+    """Escape the display fields shared by a network's summary row and card.
+
+    ``color_of`` is a tier-to-color map from _tier_color_map. The card
+    renderer adds its own keys to the returned dict and formats it in place.
+    """
+    tier = n["highest_risk_tier"]
+    return {
+        "tier": _esc(tier),
+        "color": color_of[tier],
+        "label": _esc_nocache(n["network_label"]),
+        "network_type": _esc(n["network_type"]),
+        "states": _esc(", ".join(n["states"])),
+        "members": n["member_count"],
+        "paid": n["combined_total_paid"],
+        "overpayment": n["combined_estimated_overpayment"],
+    }
+
+
+def _render_network_card(i: int, n: dict, tier_colors: dict, fields: dict | None = None) -> str:
+    """Render one FOF network detail card from the precompiled card template.
+
+    ``fields`` are the network's pre-escaped display fields, computed here
+    when not supplied. The card's own keys are added to that dict in place.
+    """
+    esc, esc_nocache, score_of = _esc, _esc_nocache, _score_of
+    if fields is None:
+        fields = _escape_network_fields(n, _tier_color_map((n,), tier_colors))
+    members = n["members"]
+
+    more = len(members) - 50
+    sigs = n["signal_types_detected"]
+    # Only rank members for narratives when at least one has a narrative
+    if any(m.get("case_narrative") for m in members):
+        top_members = heapq.nlargest(3, members, key=score_of)
+    else:
+        top_members = ()
+
+    fields.update({
+        "i": i,
+        "paid_usd": _money(fields["paid"]),
+        "overpayment_usd": _money(fields["overpayment"]),
+        "signals": (
+            "\n<p><strong>Signals:</strong> "
+            + "".join(f'\n<span class="signal-tag">{esc(st)}</span>' for st in sigs)
+            + "\n</p>"
+        ) if sigs else "",
+        "member_rows": "".join(
+            f'\n<tr><td>{esc_nocache(m["npi"])}</td>'
+            f'<td>{esc_nocache(m["provider_name"])}</td>'
+            f'<td>{esc(m["state"])}</td>'
+            f'<td>${m["total_paid_all_time"]:,.0f}</td>'
+            f'<td>${m["estimated_overpayment_usd"]:,.0f}</td>'
+            f'<td>{score_of(m)}</td></tr>'
+            for m in islice(members, 50)
+        ),
+        "more_members": (
+            f'\n<tr><td colspan="6"><em>... and {more} more members</em></td></tr>' if more > 0 else ""
+        ),
+        "narratives": "".join(
+            f'\n<div class="narrative"><strong>{esc_nocache(m["provider_name"])}:</strong> '
+            f'{esc_nocache(m["case_narrative"])}</div>'
+            for m in top_members if m.get("case_narrative", "")
+        ),
+    })
+    return _NETWORK_CARD_TEMPLATE.format_map(fields)
+
+
+def _render_network_cards(
+    networks: Iterable[dict], tier_colors: dict, start: int = 1, fields: list[dict] | None = None
+) -> str:
+    """Render a run of network cards, numbered from ``start``, as one section.
+
+    ``fields`` optionally holds each network's pre-escaped display fields.
+    map() drives the per-card calls from C rather than a Python-level loop.
+
+    Cards render in-process: at the 500-card cap rendering takes about as
+    long as pickling the member lists out to worker processes would, and the
+    whole FOF HTML writer already runs in its own process under
+    write_all_reports.
+    """
+    if fields is None:
+        networks = list(networks)
+        color_of = _tier_color_map(networks, tier_colors)
+        fields = [_escape_network_fields(n, color_of) for n in networks]
+    return "\n".join(map(_render_network_card, count(start), networks, repeat(tier_colors), fields))
+
+
+def write_fof_html_report(report: dict, output_path: str, fof: dict | None = None) -> None:
+    """Write an HTML version of the FOF network fraud report.
+
+    Pass a precomputed ``fof`` (from generate_fof_report) to skip rebuilding it.
+    """
+    if fof is None:
+        fof = generate_fof_report(report)
+    write_fof_html(fof, output_path)
+
+
+def write_fof_html(fof: dict, output_path: str) -> None:
+    """Write a generate_fof_report() result as an HTML report."""
+    _write_html_lines(output_path, _iter_fof_html_report(fof))
+    print(f"FOF HTML report written to: {output_path}")
+
+
+def _iter_fof_html_report(fof: dict) -> Iterator[str]:
+    """Yield the FOF network HTML report section by section."""
     summary = fof["summary"]
     networks = fof["networks"]
 
-    tier_colors = {"critical": "#dc2626", "high": "#ea580c", "medium": "#ca8a04", "low": "#16a34a"}
+    tier_colors = TIER_COLORS
 
-    lines = []
-    lines.append("<!DOCTYPE html>")
-    lines.append('<html lang="en"><head><meta charset="UTF-8">')
-    lines.append('<meta name="viewport" content="width=device-width,initial-scale=1">')
-    lines.append(f"<title>Network Fraud Report (FOF Pattern) — {_esc(fof.get('generated_at', ''))}</title>")
-    lines.append("<style>")
-    lines.append("""
+    yield "<!DOCTYPE html>"
+    yield '<html lang="en"><head><meta charset="UTF-8">'
+    yield '<meta name="viewport" content="width=device-width,initial-scale=1">'
+    yield f"<title>Network Fraud Report (FOF Pattern) — {_esc(fof.get('generated_at', ''))}</title>"
+    yield "<style>"
+    yield ("""
 body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
        max-width: 1200px; margin: 0 auto; padding: 20px; background: #f8fafc; color: #1e293b; }
 h1 { color: #0f172a; border-bottom: 3px solid #dc2626; padding-bottom: 10px; }
@@ -1870,123 +2314,125 @@ tr:hover { background: #fef2f2; }
              line-height: 1.6; }
 footer { margin-top: 40px; padding-top: 20px; border-top: 1px solid #e2e8f0; color: #94a3b8; font-size: 0.85em; }
 """)
-    lines.append("</style></head><body>")
+    yield "</style></head><body>"
 
     # Header
-    lines.append("<h1>Coordinated Network Fraud Report</h1>")
-    lines.append(f'<p style="color:#991b1b;font-weight:600">Feeding Our Future-Style Pattern Analysis</p>')
-    lines.append(f"<p>Generated: {_esc(fof.get('generated_at', 'Unknown'))} | "
-                 f"Tool Version: {_esc(fof.get('tool_version', ''))}</p>")
-    lines.append(f'<div class="narrative"><p>{_esc(fof["description"])}</p></div>')
+    yield "<h1>Coordinated Network Fraud Report</h1>"
+    yield f'<p style="color:#991b1b;font-weight:600">Feeding Our Future-Style Pattern Analysis</p>'
+    yield (f"<p>Generated: {_esc(fof.get('generated_at', 'Unknown'))} | "
+           f"Tool Version: {_esc(fof.get('tool_version', ''))}</p>")
+    yield f'<div class="narrative"><p>{_esc(fof["description"])}</p></div>'
 
     # Summary cards
-    lines.append("<h2>Summary</h2>")
-    lines.append('<div class="summary-grid">')
-    lines.append(f'<div class="summary-card"><div class="label">Fraud Networks</div>'
-                 f'<div class="value">{summary["total_networks_detected"]:,}</div></div>')
-    lines.append(f'<div class="summary-card"><div class="label">Providers Involved</div>'
-                 f'<div class="value">{summary["total_providers_in_networks"]:,}</div></div>')
-    lines.append(f'<div class="summary-card"><div class="label">Est. Overpayment</div>'
-                 f'<div class="value" style="color:#dc2626">'
-                 f'${summary["total_estimated_network_overpayment"]:,.0f}</div></div>')
+    yield "<h2>Summary</h2>"
+    yield '<div class="summary-grid">'
+    yield (f'<div class="summary-card"><div class="label">Fraud Networks</div>'
+           f'<div class="value">{summary["total_networks_detected"]:,}</div></div>')
+    yield (f'<div class="summary-card"><div class="label">Providers Involved</div>'
+           f'<div class="value">{summary["total_providers_in_networks"]:,}</div></div>')
+    yield (f'<div class="summary-card"><div class="label">Est. Overpayment</div>'
+           f'<div class="value" style="color:#dc2626">'
+           f'${summary["total_estimated_network_overpayment"]:,.0f}</div></div>')
     critical = summary["tier_distribution"].get("critical", 0)
-    lines.append(f'<div class="summary-card"><div class="label">Critical Networks</div>'
-                 f'<div class="value" style="color:#dc2626">{critical}</div></div>')
-    lines.append('</div>')
+    yield (f'<div class="summary-card"><div class="label">Critical Networks</div>'
+           f'<div class="value" style="color:#dc2626">{critical}</div></div>')
+    yield '</div>'
 
     # Networks by type table
-    lines.append("<h3>Networks by Type</h3>")
-    lines.append("<table><tr><th>Network Type</th><th>Count</th></tr>")
-    for ntype, count in sorted(summary["networks_by_type"].items(), key=lambda x: x[1], reverse=True):
-        lines.append(f"<tr><td>{_esc(ntype)}</td><td>{count}</td></tr>")
-    lines.append("</table>")
+    yield "<h3>Networks by Type</h3>"
+    yield "<table><tr><th>Network Type</th><th>Count</th></tr>"
+    by_type = summary["networks_by_type"]
+    if by_type:
+        yield "\n".join(
+            f"<tr><td>{_esc(ntype)}</td><td>{n_networks}</td></tr>"
+            for ntype, n_networks in sorted(by_type.items(), key=lambda x: x[1], reverse=True)
+        )
+    yield "</table>"
 
     # Top networks table
-    lines.append("<h2>Top Networks by Estimated Overpayment</h2>")
-    lines.append("<table><tr><th>#</th><th>Network</th><th>Members</th><th>States</th>"
-                 "<th>Combined Billing</th><th>Est. Overpayment</th><th>Risk</th></tr>")
-    for i, n in enumerate(networks[:100], 1):
-        tier = n["highest_risk_tier"]
-        color = tier_colors.get(tier, "#64748b")
-        lines.append(
-            f'<tr><td>{i}</td>'
-            f'<td>{_esc(n["network_label"])}</td>'
-            f'<td>{n["member_count"]}</td>'
-            f'<td>{_esc(", ".join(n["states"][:5]))}</td>'
-            f'<td>${n["combined_total_paid"]:,.0f}</td>'
-            f'<td style="font-weight:600">${n["combined_estimated_overpayment"]:,.0f}</td>'
-            f'<td><span class="tier-badge" style="background:{color}">{_esc(tier)}</span></td>'
-            f'</tr>'
-        )
-    lines.append("</table>")
+    yield "<h2>Top Networks by Estimated Overpayment</h2>"
+    yield ("<table><tr><th>#</th><th>Network</th><th>Members</th><th>States</th>"
+           "<th>Combined Billing</th><th>Est. Overpayment</th><th>Risk</th></tr>")
+    # Escape each rendered network's shared fields once for both its row and card
+    # (badge colors resolved once per distinct tier)
+    color_of = _tier_color_map(islice(networks, 500), tier_colors)
+    fields = [_escape_network_fields(n, color_of) for n in islice(networks, 500)]
+    row_fmt = _NETWORK_ROW_TEMPLATE.format_map
+    esc = _esc
+    if networks:
+        # All rows in one comprehension, emitted as a single newline-joined section
+        yield "\n".join([
+            row_fmt({
+                **f,
+                "i": i,
+                # Most networks span five states or fewer: reuse the full joined list
+                "top_states": f["states"] if len(n["states"]) <= 5 else esc(", ".join(n["states"][:5])),
+            })
+            for i, n, f in zip(range(1, 101), networks, fields)
+        ])
+    yield "</table>"
 
     # Detailed network cards
-    lines.append("<h2>Network Details</h2>")
-    for i, n in enumerate(networks[:500], 1):
-        tier = n["highest_risk_tier"]
-        color = tier_colors.get(tier, "#64748b")
-
-        lines.append(f'<div class="network-card {_esc(tier)}">')
-        lines.append(f'<h3>#{i}. {_esc(n["network_label"])}</h3>')
-        lines.append(
-            f'<p><strong>Type:</strong> {_esc(n["network_type"])} | '
-            f'<strong>Members:</strong> {n["member_count"]} | '
-            f'<strong>States:</strong> {_esc(", ".join(n["states"]))} | '
-            f'<strong>Risk:</strong> '
-            f'<span class="tier-badge" style="background:{color}">{_esc(tier)}</span></p>'
-        )
-        lines.append(
-            f'<p><strong>Combined Billing:</strong> ${n["combined_total_paid"]:,.2f} | '
-            f'<strong>Est. Overpayment:</strong> '
-            f'<span style="color:#dc2626;font-weight:600">'
-            f'${n["combined_estimated_overpayment"]:,.2f}</span></p>'
-        )
-
-        # Signal types
-        lines.append("<p><strong>Signals:</strong> ")
-        for st in n["signal_types_detected"]:
-            lines.append(f'<span class="signal-tag">{_esc(st)}</span>')
-        lines.append("</p>")
-
-        # Member table
-        lines.append('<table class="member-table"><tr><th>NPI</th><th>Name</th>'
-                     '<th>State</th><th>Billing</th><th>Overpayment</th><th>Risk Score</th></tr>')
-        for m in n["members"][:50]:
-            mscore = m.get("risk_score", {}).get("score", 0)
-            lines.append(
-                f'<tr><td>{_esc(m["npi"])}</td>'
-                f'<td>{_esc(m["provider_name"])}</td>'
-                f'<td>{_esc(m["state"])}</td>'
-                f'<td>${m["total_paid_all_time"]:,.0f}</td>'
-                f'<td>${m["estimated_overpayment_usd"]:,.0f}</td>'
-                f'<td>{mscore}</td></tr>'
-            )
-        if len(n["members"]) > 50:
-            lines.append(f'<tr><td colspan="6"><em>... and {len(n["members"]) - 50} more members</em></td></tr>')
-        lines.append("</table>")
-
-        # Case narratives for top members
-        top_members = sorted(n["members"], key=lambda m: m.get("risk_score", {}).get("score", 0), reverse=True)[:3]
-        for m in top_members:
-            narrative = m.get("case_narrative", "")
-            if narrative:
-                lines.append(f'<div class="narrative"><strong>{_esc(m["provider_name"])}:</strong> '
-                             f'{_esc(narrative)}</div>')
-
-        lines.append("</div>")
+    yield "<h2>Network Details</h2>"
+    if networks:
+        yield _render_network_cards(islice(networks, len(fields)), tier_colors, fields=fields)
 
     if len(networks) > 500:
-        lines.append(f"<p><em>Showing top 500 of {len(networks)} networks. "
-                     f"See JSON report for complete data.</em></p>")
+        yield (f"<p><em>Showing top 500 of {len(networks)} networks. "
+               f"See JSON report for complete data.</em></p>")
 
     # Footer
-    lines.append("<footer>")
-    lines.append(f"<p>Medicaid Fraud Signal Detection Engine v{_esc(fof.get('tool_version', ''))} | "
-                 f"Network Fraud Analysis | Generated {_esc(fof.get('generated_at', ''))} | "
-                 f"Data sources: HHS STOP Medicaid Spending, OIG LEIE, CMS NPPES</p>")
-    lines.append("</footer></body></html>")
-
-    html_content = "\n".join(lines)
-    with open(output_path, "w") as f:
-        f.write(html_content)
-    print(f"FOF HTML report written to: {output_path}")
+    yield "<footer>"
+    yield (f"<p>Medicaid Fraud Signal Detection Engine v{_esc(fof.get('tool_version', ''))} | "
+           f"Network Fraud Analysis | Generated {_esc(fof.get('generated_at', ''))} | "
+           f"Data sources: HHS STOP Medicaid Spending, OIG LEIE, CMS NPPES</p>")
+    yield "</footer></body></html>"
+
+
+def _run_writer(writer, args: tuple) -> str:
+    """Run one report writer in a worker, returning its status output for the parent to print."""
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        writer(*args)
+    return buf.getvalue()
+
+
+def write_all_reports(
+    report: dict,
+    output_path: str,
+    html_path: str | None = None,
+    fof_json_path: str | None = None,
+    fof_html_path: str | None = None,
+    pretty: bool = False,
+) -> None:
+    """Write the JSON report plus any requested HTML/FOF outputs.
+
+    The outputs are independent and CPU-bound on serialization, so when more
+    than one is requested each writer runs in its own worker process.
+    Workers are spawned rather than forked so they don't inherit the live
+    DuckDB connection or thread-pool state, and their status lines are
+    printed by the parent in job order. JSON outputs are compact unless
+    ``pretty`` is set.
+    """
+    # Both FOF outputs share one network analysis, and their workers receive
+    # only that result rather than the full provider report
+    fof = generate_fof_report(report) if (fof_json_path or fof_html_path) else None
+
+    jobs = [(write_report, (report, output_path, pretty))]
+    if html_path:
+        jobs.append((write_html_report, (report, html_path)))
+    if fof_json_path:
+        jobs.append((write_fof_json, (fof, fof_json_path, pretty)))
+    if fof_html_path:
+        jobs.append((write_fof_html, (fof, fof_html_path)))
+
+    if len(jobs) == 1:
+        write_report(report, output_path, pretty)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=len(jobs), mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        futures = [pool.submit(_run_writer, writer, args) for writer, args in jobs]
+        for future in futures:
+            print(future.result(), end="")
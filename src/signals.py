@@ -5,7 +5,11 @@ Optimized to use pre-materialized tables:
   - provider_monthly: per-NPI per-month totals (avoids repeated monthly aggregations)
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import duckdb
+import pyarrow as pa
+import pyarrow.compute as pc
 
 # ---------------------------------------------------------------------------
 # COVID-era awareness: March 2020 through December 2021 (PHE period)
@@ -27,6 +31,73 @@ def _is_covid_era(month_str: str) -> bool:
     return COVID_START <= ym <= COVID_END
 
 
+def _cast_decimals(data):
+    """Cast decimal128 columns of an Arrow table or record batch to int64/float64.
+
+    HUGEINT sums arrive as decimal128; casting them back gives callers the
+    same ``int``/``float`` values ``fetchall()`` produced.
+    """
+    if not any(pa.types.is_decimal(f.type) for f in data.schema):
+        return data
+    columns = [
+        pc.cast(col, pa.int64() if col.type.scale == 0 else pa.float64())
+        if pa.types.is_decimal(col.type) else col
+        for col in data.columns
+    ]
+    return type(data).from_arrays(columns, names=data.schema.names)
+
+
+def _fetch_arrow(con: duckdb.DuckDBPyConnection, query: str, params=None) -> pa.Table:
+    """Run a query and return its result as an Arrow table."""
+    cursor = con.execute(query, params)
+    fetch = getattr(cursor, "to_arrow_table", None) or cursor.fetch_arrow_table
+    return _cast_decimals(fetch())
+
+
+FETCH_BATCH_ROWS = 8192
+
+
+def _fetch_batches(con: duckdb.DuckDBPyConnection, query: str, params=None,
+                   rows_per_batch: int = FETCH_BATCH_ROWS):
+    """Run a query and yield its result as a stream of Arrow record batches.
+
+    Lets a signal post-process each batch while DuckDB produces the next one,
+    instead of materializing the whole result before any work starts.
+    """
+    cursor = con.execute(query, params)
+    fetch = getattr(cursor, "to_arrow_reader", None) or cursor.fetch_record_batch
+    for batch in fetch(rows_per_batch):
+        yield _cast_decimals(batch)
+
+
+def _as_float(col, default: float = 0.0):
+    """Arrow equivalent of ``float(x or default)`` over a whole column."""
+    return pc.fill_null(pc.cast(col, pa.float64()), default)
+
+
+def _as_int(col, default: int = 0):
+    """Arrow equivalent of ``int(x or default)`` over a whole column."""
+    return pc.fill_null(pc.cast(col, pa.int64(), safe=False), default)
+
+
+def _table_exists(con: duckdb.DuckDBPyConnection, name: str) -> bool:
+    """Check the catalog for an optional table (e.g. census_zcta) without a failing probe query."""
+    return con.execute(
+        "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = ?", [name]
+    ).fetchone()[0] > 0
+
+
+def _rows(*columns, chunk_rows: int = FETCH_BATCH_ROWS):
+    """Zip Arrow columns back into per-row tuples of Python values.
+
+    A generator over zero-copy slices, so only ``chunk_rows`` rows of boxed
+    Python values exist at a time rather than a full list per column.
+    """
+    n = len(columns[0]) if columns else 0
+    for offset in range(0, n, chunk_rows):
+        yield from zip(*(col.slice(offset, chunk_rows).to_pylist() for col in columns))
+
+
 def signal_excluded_provider(con: duckdb.DuckDBPyConnection) -> list[dict]:
     """Signal 1: Excluded Provider Still Billing.
 
@@ -34,20 +105,21 @@ def signal_excluded_provider(con: duckdb.DuckDBPyConnection) -> list[dict]:
     exclusion date is before the claim month and reinstatement date is empty
     or after the claim month.
 
-    Optimized: single scan of spending joining both billing_npi and
-    servicing_npi against LEIE via UNION ALL inside the scan.
+    Optimized: the billing and servicing NPI columns are stacked with
+    UNION ALL and semi-joined against the pre-filtered leie_valid table, so
+    the NPI sanity checks run once at ingest instead of per spending row.
     """
-    results = con.execute("""
+    tbl = _fetch_arrow(con, """
         WITH spending_npis AS (
-            SELECT billing_npi AS npi, claim_month, total_paid, total_claims
-            FROM spending s
-            WHERE EXISTS (SELECT 1 FROM leie l WHERE l.npi = s.billing_npi
-                          AND l.npi IS NOT NULL AND TRIM(l.npi) != '' AND l.npi != '0000000000')
-            UNION ALL
-            SELECT servicing_npi AS npi, claim_month, total_paid, total_claims
-            FROM spending s
-            WHERE EXISTS (SELECT 1 FROM leie l WHERE l.npi = s.servicing_npi
-                          AND l.npi IS NOT NULL AND TRIM(l.npi) != '' AND l.npi != '0000000000')
+            SELECT s.npi, s.claim_month, s.total_paid, s.total_claims
+            FROM (
+                SELECT billing_npi AS npi, claim_month, total_paid, total_claims
+                FROM spending
+                UNION ALL
+                SELECT servicing_npi AS npi, claim_month, total_paid, total_claims
+                FROM spending
+            ) s
+            SEMI JOIN leie_valid l ON s.npi = l.npi
         ),
         matched AS (
             SELECT
@@ -62,9 +134,8 @@ def signal_excluded_provider(con: duckdb.DuckDBPyConnection) -> list[dict]:
                 MIN(CASE WHEN sn.claim_month >= l.excl_date THEN sn.claim_month ELSE NULL END) AS first_claim_after_exclusion,
                 MAX(CASE WHEN sn.claim_month >= l.excl_date THEN sn.claim_month ELSE NULL END) AS last_claim_after_exclusion
             FROM spending_npis sn
-            JOIN leie l ON sn.npi = l.npi
-            WHERE l.excl_date IS NOT NULL
-              AND l.excl_date < sn.claim_month
+            JOIN leie_valid l ON sn.npi = l.npi
+            WHERE l.excl_date < sn.claim_month
               AND (l.rein_date IS NULL OR l.rein_date > sn.claim_month)
             GROUP BY sn.npi, l.excl_date, l.excl_type, l.lastname, l.firstname, l.busname
         )
@@ -82,29 +153,29 @@ def signal_excluded_provider(con: duckdb.DuckDBPyConnection) -> list[dict]:
         FROM matched
         GROUP BY npi, excl_date, excl_type, lastname, firstname, busname
         ORDER BY total_paid_after_exclusion DESC
-    """).fetchall()
-
-    columns = ["npi", "excl_date", "excl_type", "lastname", "firstname", "busname",
-                "total_paid_after_exclusion", "total_claims_after_exclusion",
-                "first_claim_after_exclusion", "last_claim_after_exclusion"]
+    """)
 
     signals = []
-    for row in results:
-        d = dict(zip(columns, row))
+    for (npi, excl_date, excl_type, lastname, firstname, busname,
+         paid_after, claims_after, first_claim, last_claim) in _rows(
+            tbl["npi"], tbl["excl_date"], tbl["excl_type"], tbl["lastname"],
+            tbl["firstname"], tbl["busname"], _as_float(tbl["total_paid_after_exclusion"]),
+            _as_int(tbl["total_claims_after_exclusion"]), tbl["first_claim_after_exclusion"],
+            tbl["last_claim_after_exclusion"]):
         signals.append({
             "signal_type": "excluded_provider",
             "severity": "critical",
-            "npi": d["npi"],
+            "npi": npi,
             "evidence": {
-                "exclusion_date": str(d["excl_date"]),
-                "exclusion_type": d["excl_type"],
-                "provider_name": f"{d['firstname'] or ''} {d['lastname'] or ''} {d['busname'] or ''}".strip(),
-                "total_paid_after_exclusion": float(d["total_paid_after_exclusion"] or 0),
-                "total_claims_after_exclusion": int(d["total_claims_after_exclusion"] or 0),
-                "first_claim_after_exclusion": str(d["first_claim_after_exclusion"]),
-                "last_claim_after_exclusion": str(d["last_claim_after_exclusion"]),
+                "exclusion_date": str(excl_date),
+                "exclusion_type": excl_type,
+                "provider_name": f"{firstname or ''} {lastname or ''} {busname or ''}".strip(),
+                "total_paid_after_exclusion": paid_after,
+                "total_claims_after_exclusion": claims_after,
+                "first_claim_after_exclusion": str(first_claim),
+                "last_claim_after_exclusion": str(last_claim),
             },
-            "estimated_overpayment_usd": float(d["total_paid_after_exclusion"] or 0),
+            "estimated_overpayment_usd": paid_after,
         })
     return signals
 
@@ -117,31 +188,36 @@ def signal_billing_outlier(con: duckdb.DuckDBPyConnection) -> list[dict]:
 
     Optimized: reads from pre-materialized provider_totals table.
     """
-    results = con.execute("""
+    batches = _fetch_batches(con, """
         WITH provider_with_nppes AS (
             SELECT
-                pt.npi,
-                pt.total_paid AS provider_total_paid,
-                pt.total_claims AS provider_total_claims,
-                pt.total_beneficiaries AS provider_total_beneficiaries,
-                n.taxonomy_code,
-                n.state,
-                n.entity_type_code,
-                COALESCE(n.org_name, n.first_name || ' ' || n.last_name) AS provider_name
-            FROM provider_totals pt
-            LEFT JOIN nppes n ON pt.npi = n.npi
+                npi,
+                total_paid AS provider_total_paid,
+                total_claims AS provider_total_claims,
+                total_beneficiaries AS provider_total_beneficiaries,
+                taxonomy_code,
+                state,
+                entity_type_code,
+                provider_name
+            FROM provider_enriched
         ),
-        peer_stats AS (
+        peer_quantiles AS (
+            -- Both cut points come from one sort of each peer group. Exact
+            -- quantiles are kept on purpose: approx_quantile returns the group
+            -- maximum as p99 for small groups, which would hide the outlier.
             SELECT
                 taxonomy_code,
                 state,
-                PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY provider_total_paid) AS peer_median,
-                PERCENTILE_CONT(0.99) WITHIN GROUP (ORDER BY provider_total_paid) AS peer_p99,
+                QUANTILE_CONT(provider_total_paid, [0.5, 0.99]) AS q,
                 COUNT(*) AS peer_count
             FROM provider_with_nppes
             WHERE taxonomy_code IS NOT NULL AND state IS NOT NULL
             GROUP BY taxonomy_code, state
             HAVING COUNT(*) >= 5
+        ),
+        peer_stats AS (
+            SELECT taxonomy_code, state, q[1] AS peer_median, q[2] AS peer_p99, peer_count
+            FROM peer_quantiles
         )
         SELECT
             p.npi,
@@ -159,33 +235,35 @@ def signal_billing_outlier(con: duckdb.DuckDBPyConnection) -> list[dict]:
         JOIN peer_stats ps ON p.taxonomy_code = ps.taxonomy_code AND p.state = ps.state
         WHERE p.provider_total_paid > ps.peer_p99
         ORDER BY p.provider_total_paid DESC
-    """).fetchall()
-
-    columns = ["npi", "provider_name", "entity_type_code", "taxonomy_code", "state",
-                "provider_total_paid", "provider_total_claims", "peer_median", "peer_p99",
-                "peer_count", "ratio_to_median"]
+    """)
 
     signals = []
-    for row in results:
-        d = dict(zip(columns, row))
-        ratio = float(d["ratio_to_median"] or 0)
-        severity = "high" if ratio > 5 else "medium"
-        overpayment = max(0, float(d["provider_total_paid"] or 0) - float(d["peer_p99"] or 0))
-        signals.append({
-            "signal_type": "billing_outlier",
-            "severity": severity,
-            "npi": d["npi"],
-            "evidence": {
-                "total_paid": float(d["provider_total_paid"] or 0),
-                "taxonomy_code": d["taxonomy_code"],
-                "state": d["state"],
-                "peer_median": float(d["peer_median"] or 0),
-                "peer_99th_percentile": float(d["peer_p99"] or 0),
-                "ratio_to_median": round(ratio, 2),
-                "peer_count": int(d["peer_count"] or 0),
-            },
-            "estimated_overpayment_usd": round(overpayment, 2),
-        })
+    for tbl in batches:
+        total_paid = _as_float(tbl["provider_total_paid"])
+        peer_p99 = _as_float(tbl["peer_p99"])
+        ratio = _as_float(tbl["ratio_to_median"])
+        severity = pc.if_else(pc.greater(ratio, 5), "high", "medium")
+        overpayment = pc.max_element_wise(pc.subtract(total_paid, peer_p99), 0.0)
+
+        for npi, taxonomy_code, state, paid, median, p99, peer_count, ratio, severity, overpayment in _rows(
+                tbl["npi"], tbl["taxonomy_code"], tbl["state"], total_paid,
+                _as_float(tbl["peer_median"]), peer_p99, _as_int(tbl["peer_count"]),
+                ratio, severity, overpayment):
+            signals.append({
+                "signal_type": "billing_outlier",
+                "severity": severity,
+                "npi": npi,
+                "evidence": {
+                    "total_paid": paid,
+                    "taxonomy_code": taxonomy_code,
+                    "state": state,
+                    "peer_median": median,
+                    "peer_99th_percentile": p99,
+                    "ratio_to_median": round(ratio, 2),
+                    "peer_count": peer_count,
+                },
+                "estimated_overpayment_usd": round(overpayment, 2),
+            })
     return signals
 
 
@@ -195,27 +273,21 @@ def signal_rapid_escalation(con: duckdb.DuckDBPyConnection) -> list[dict]:
     Providers enumerated within 24 months before their first billing month.
     Flag if any rolling 3-month average growth rate exceeds 200%.
 
-    Optimized: uses provider_monthly instead of re-aggregating spending.
+    Optimized: uses provider_monthly and provider_first_bill instead of
+    re-aggregating spending.
     """
-    results = con.execute("""
-        WITH provider_first_bill AS (
-            SELECT
-                npi,
-                MIN(claim_month) AS first_bill_month
-            FROM provider_monthly
-            GROUP BY npi
-        ),
-        new_providers AS (
+    tbl = _fetch_arrow(con, """
+        WITH new_providers AS (
             SELECT
                 pfb.npi,
                 pfb.first_bill_month,
                 n.enumeration_date,
-                COALESCE(n.org_name, n.first_name || ' ' || n.last_name) AS provider_name,
+                n.provider_name,
                 n.entity_type_code,
                 n.taxonomy_code,
                 n.state
             FROM provider_first_bill pfb
-            JOIN nppes n ON pfb.npi = n.npi
+            JOIN provider_enriched n ON pfb.npi = n.npi
             WHERE n.enumeration_date IS NOT NULL
               AND n.enumeration_date >= CAST(pfb.first_bill_month AS DATE) - INTERVAL '24 months'
               AND n.enumeration_date < CAST(pfb.first_bill_month AS DATE)
@@ -230,22 +302,28 @@ def signal_rapid_escalation(con: duckdb.DuckDBPyConnection) -> list[dict]:
             JOIN new_providers np ON pm.npi = np.npi
         ),
         first_12 AS (
-            SELECT * FROM monthly_paid WHERE month_num <= 12
+            SELECT npi, claim_month, month_paid, month_num
+            FROM monthly_paid
+            WHERE month_num <= 12
         ),
-        with_growth AS (
+        lagged AS (
             SELECT
                 npi,
                 claim_month,
                 month_paid,
                 month_num,
-                LAG(month_paid) OVER (PARTITION BY npi ORDER BY month_num) AS prev_paid,
+                LAG(month_paid) OVER (PARTITION BY npi ORDER BY month_num) AS prev_paid
+            FROM first_12
+        ),
+        with_growth AS (
+            SELECT
+                *,
                 CASE
-                    WHEN LAG(month_paid) OVER (PARTITION BY npi ORDER BY month_num) > 0
-                    THEN (month_paid - LAG(month_paid) OVER (PARTITION BY npi ORDER BY month_num))
-                         / LAG(month_paid) OVER (PARTITION BY npi ORDER BY month_num) * 100.0
+                    WHEN prev_paid > 0
+                    THEN (month_paid - prev_paid) / prev_paid * 100.0
                     ELSE NULL
                 END AS growth_pct
-            FROM first_12
+            FROM lagged
         ),
         rolling_3mo AS (
             SELECT
@@ -267,6 +345,15 @@ def signal_rapid_escalation(con: duckdb.DuckDBPyConnection) -> list[dict]:
             FROM rolling_3mo
             WHERE rolling_3mo_avg_growth > 200
             GROUP BY npi
+        ),
+        npi_agg AS (
+            SELECT
+                npi,
+                LIST(month_paid ORDER BY month_num) AS monthly_amounts,
+                SUM(CASE WHEN growth_pct > 200 THEN month_paid ELSE 0 END) AS overpayment_in_growth_months
+            FROM with_growth
+            WHERE npi IN (SELECT npi FROM flagged)
+            GROUP BY npi
         )
         SELECT
             f.npi,
@@ -277,42 +364,40 @@ def signal_rapid_escalation(con: duckdb.DuckDBPyConnection) -> list[dict]:
             np.enumeration_date,
             np.first_bill_month,
             f.peak_3mo_growth,
-            (SELECT LIST(month_paid ORDER BY month_num)
-             FROM first_12 m WHERE m.npi = f.npi) AS monthly_amounts,
-            (SELECT SUM(mp.month_paid)
-             FROM monthly_paid mp
-             JOIN with_growth wg ON mp.npi = wg.npi AND mp.month_num = wg.month_num
-             WHERE mp.npi = f.npi AND wg.growth_pct > 200) AS overpayment_in_growth_months
+            a.monthly_amounts,
+            a.overpayment_in_growth_months,
+            STRFTIME(np.first_bill_month, '%Y-%m') BETWEEN ? AND ? AS covid_era
         FROM flagged f
         JOIN new_providers np ON f.npi = np.npi
+        JOIN npi_agg a ON f.npi = a.npi
         ORDER BY f.peak_3mo_growth DESC
-    """).fetchall()
+    """, [COVID_START, COVID_END])
 
-    columns = ["npi", "provider_name", "entity_type_code", "taxonomy_code", "state",
-                "enumeration_date", "first_bill_month", "peak_3mo_growth",
-                "monthly_amounts", "overpayment_in_growth_months"]
+    peak = _as_float(tbl["peak_3mo_growth"])
+    covid_era = pc.fill_null(tbl["covid_era"], False)
+    # COVID-era: new providers enrolling during pandemic often had legitimate spikes
+    severity = pc.if_else(covid_era, "low", pc.if_else(pc.greater(peak, 500), "high", "medium"))
 
     signals = []
-    for row in results:
-        d = dict(zip(columns, row))
-        peak = float(d["peak_3mo_growth"] or 0)
-        severity = "high" if peak > 500 else "medium"
+    for (npi, enumeration_date, first_bill_month, peak, monthly_amounts, severity,
+         covid_era, overpayment) in _rows(
+            tbl["npi"], tbl["enumeration_date"], tbl["first_bill_month"], peak,
+            tbl["monthly_amounts"], severity, covid_era,
+            _as_float(tbl["overpayment_in_growth_months"])):
         evidence = {
-            "enumeration_date": str(d["enumeration_date"]),
-            "first_billing_month": str(d["first_bill_month"]),
+            "enumeration_date": str(enumeration_date),
+            "first_billing_month": str(first_bill_month),
             "peak_3_month_growth_rate": round(peak, 2),
-            "monthly_amounts_first_12": [float(x) for x in (d["monthly_amounts"] or [])],
+            "monthly_amounts_first_12": [float(x) for x in (monthly_amounts or [])],
         }
-        # COVID-era: new providers enrolling during pandemic often had legitimate spikes
-        if _is_covid_era(str(d["first_bill_month"])):
-            severity = "low"
+        if covid_era:
             evidence["covid_era_flag"] = True
         signals.append({
             "signal_type": "rapid_escalation",
             "severity": severity,
-            "npi": d["npi"],
+            "npi": npi,
             "evidence": evidence,
-            "estimated_overpayment_usd": float(d["overpayment_in_growth_months"] or 0),
+            "estimated_overpayment_usd": overpayment,
         })
     return signals
 
@@ -332,7 +417,7 @@ def signal_workforce_impossibility(con: duckdb.DuckDBPyConnection) -> list[dict]
     Uses org_worker_monthly (pre-materialized in ingest) to avoid a
     full 227M-row scan at query time.
     """
-    results = con.execute("""
+    tbl = _fetch_arrow(con, """
         WITH org_monthly AS (
             SELECT
                 pm.npi,
@@ -343,29 +428,38 @@ def signal_workforce_impossibility(con: duckdb.DuckDBPyConnection) -> list[dict]
                 -- Fall back to 1 if no servicing NPI data (solo-like billing).
                 GREATEST(COALESCE(wm.distinct_workers, 1), 1) AS distinct_workers
             FROM provider_monthly pm
-            JOIN nppes n ON pm.npi = n.npi
+            JOIN provider_enriched n ON pm.npi = n.npi
             LEFT JOIN org_worker_monthly wm
                    ON pm.npi = wm.npi AND pm.claim_month = wm.claim_month
             WHERE n.entity_type_code = '2'
         ),
+        peak_rows AS (
+            -- Busiest month per worker, picked in one streaming aggregate
+            -- instead of ranking every month with a window
+            SELECT
+                npi,
+                ARG_MAX(
+                    {'claim_month': claim_month, 'month_claims': month_claims,
+                     'month_paid': month_paid, 'distinct_workers': distinct_workers},
+                    month_claims / distinct_workers
+                ) AS peak
+            FROM org_monthly
+            GROUP BY npi
+        ),
         peak_months AS (
             SELECT
                 npi,
-                claim_month AS peak_month,
-                month_claims AS peak_claims,
-                month_paid AS peak_month_paid,
-                distinct_workers,
+                peak.claim_month AS peak_month,
+                peak.month_claims AS peak_claims,
+                peak.month_paid AS peak_month_paid,
+                peak.distinct_workers AS distinct_workers,
                 -- Per-worker hourly rate: total claims / workers / 22 days / 8 hrs
-                month_claims / distinct_workers / 22.0 / 8.0 AS claims_per_worker_hour,
-                ROW_NUMBER() OVER (
-                    PARTITION BY npi
-                    ORDER BY month_claims / distinct_workers DESC
-                ) AS rn
-            FROM org_monthly
+                peak.month_claims / peak.distinct_workers / 22.0 / 8.0 AS claims_per_worker_hour
+            FROM peak_rows
         )
         SELECT
             pm.npi,
-            COALESCE(n.org_name, n.first_name || ' ' || n.last_name) AS provider_name,
+            n.provider_name,
             n.entity_type_code,
             n.taxonomy_code,
             n.state,
@@ -373,46 +467,46 @@ def signal_workforce_impossibility(con: duckdb.DuckDBPyConnection) -> list[dict]
             pm.peak_claims,
             pm.peak_month_paid,
             pm.distinct_workers,
-            pm.claims_per_worker_hour
+            pm.claims_per_worker_hour,
+            STRFTIME(pm.peak_month, '%Y-%m') BETWEEN ? AND ? AS covid_era
         FROM peak_months pm
-        JOIN nppes n ON pm.npi = n.npi
-        WHERE pm.rn = 1
-          AND pm.claims_per_worker_hour > 6.0
+        JOIN provider_enriched n ON pm.npi = n.npi
+        WHERE pm.claims_per_worker_hour > 6.0
         ORDER BY pm.claims_per_worker_hour DESC
-    """).fetchall()
-
-    columns = ["npi", "provider_name", "entity_type_code", "taxonomy_code", "state",
-                "peak_month", "peak_claims", "peak_month_paid", "distinct_workers",
-                "claims_per_worker_hour"]
+    """, [COVID_START, COVID_END])
+
+    peak_claims = _as_int(tbl["peak_claims"])
+    workers = _as_int(tbl["distinct_workers"], 1)
+    max_reasonable = pc.multiply(workers, 6 * 8 * 22)  # 6 claims/hr × 8 hrs × 22 days × workers
+    excess = pc.max_element_wise(pc.subtract(peak_claims, max_reasonable), 0)
+    peak_paid = _as_float(tbl["peak_month_paid"])
+    has_claims = pc.greater(peak_claims, 0)
+    cost_per_claim = pc.if_else(
+        has_claims, pc.divide(peak_paid, pc.if_else(has_claims, peak_claims, 1)), 0.0)
+    overpayment = pc.multiply(excess, cost_per_claim)
+    rate = _as_float(tbl["claims_per_worker_hour"])
+    covid_era = pc.fill_null(tbl["covid_era"], False)
+    # COVID-era: telehealth legitimately allows higher patient volumes
+    severity = pc.if_else(covid_era, "low", pc.if_else(pc.greater(rate, 20), "high", "medium"))
 
     signals = []
-    for row in results:
-        d = dict(zip(columns, row))
-        peak_claims = int(d["peak_claims"] or 0)
-        workers = int(d["distinct_workers"] or 1)
-        max_reasonable = workers * 6 * 8 * 22  # 6 claims/hr × 8 hrs × 22 days × workers
-        excess = max(0, peak_claims - max_reasonable)
-        peak_paid = float(d["peak_month_paid"] or 0)
-        cost_per_claim = peak_paid / peak_claims if peak_claims > 0 else 0
-        overpayment = excess * cost_per_claim
-        rate = float(d["claims_per_worker_hour"] or 0)
-        severity = "high" if rate > 20 else "medium"
+    for npi, peak_month, peak_claims, workers, peak_paid, rate, severity, overpayment, covid_era in _rows(
+            tbl["npi"], tbl["peak_month"], peak_claims, workers, peak_paid, rate,
+            severity, overpayment, covid_era):
         evidence = {
-            "peak_month": str(d["peak_month"]),
+            "peak_month": str(peak_month),
             "peak_claims_count": peak_claims,
             "distinct_workers_in_month": workers,
             "implied_claims_per_worker_hour": round(rate, 2),
             "total_paid_peak_month": round(peak_paid, 2),
         }
-        # COVID-era: telehealth legitimately allows higher patient volumes
-        if _is_covid_era(str(d["peak_month"])):
-            severity = "low"
+        if covid_era:
             evidence["covid_era_flag"] = True
 
         signals.append({
             "signal_type": "workforce_impossibility",
             "severity": severity,
-            "npi": d["npi"],
+            "npi": npi,
             "evidence": evidence,
             "estimated_overpayment_usd": round(overpayment, 2),
         })
@@ -433,87 +527,64 @@ def signal_shared_official(con: duckdb.DuckDBPyConnection) -> list[dict]:
     out name-collision false positives — unrelated providers sharing a common
     name like "Michael Morris" are typically scattered across different states.
 
-    Optimized: reads from pre-materialized provider_totals table.
+    Optimized: reads from pre-materialized official_networks and
+    provider_totals tables.
     """
-    results = con.execute("""
+    tbl = _fetch_arrow(con, """
         WITH official_with_paid AS (
             SELECT
-                UPPER(TRIM(n.auth_official_last)) AS official_last,
-                UPPER(TRIM(n.auth_official_first)) AS official_first,
-                n.npi,
-                n.org_name,
-                n.state,
+                on_net.official_last,
+                on_net.official_first,
+                on_net.npi,
+                on_net.org_name,
+                on_net.state,
                 COALESCE(pt.total_paid, 0) AS total_paid
-            FROM nppes n
-            LEFT JOIN provider_totals pt ON n.npi = pt.npi
-            WHERE n.auth_official_last IS NOT NULL
-              AND TRIM(n.auth_official_last) != ''
-              AND n.auth_official_first IS NOT NULL
-              AND TRIM(n.auth_official_first) != ''
-        ),
-        -- Per-official state concentration: how many NPIs share the most-common state
-        state_concentration AS (
-            SELECT
-                official_last,
-                official_first,
-                MAX(state_npi_count) AS max_state_npis
-            FROM (
-                SELECT
-                    official_last,
-                    official_first,
-                    state,
-                    COUNT(DISTINCT npi) AS state_npi_count
-                FROM official_with_paid
-                WHERE state IS NOT NULL AND TRIM(state) != ''
-                GROUP BY official_last, official_first, state
-            )
-            GROUP BY official_last, official_first
+            FROM official_networks on_net
+            LEFT JOIN provider_totals pt ON on_net.npi = pt.npi
         )
         SELECT
-            owp.official_last,
-            owp.official_first,
-            COUNT(DISTINCT owp.npi) AS npi_count,
-            LIST(DISTINCT owp.npi) AS npi_list,
-            LIST(DISTINCT owp.org_name) AS org_names,
-            SUM(owp.total_paid) AS combined_total_paid,
-            sc.max_state_npis
-        FROM official_with_paid owp
-        JOIN state_concentration sc
-          ON owp.official_last = sc.official_last
-         AND owp.official_first = sc.official_first
-        GROUP BY owp.official_last, owp.official_first, sc.max_state_npis
-        HAVING COUNT(DISTINCT owp.npi) BETWEEN 5 AND 50
-          AND SUM(owp.total_paid) > 1000000
-          AND sc.max_state_npis >= 3
+            official_first || ' ' || official_last AS official_name,
+            COUNT(DISTINCT npi) AS npi_count,
+            -- One nppes row per NPI, so a plain LIST is already distinct
+            LIST(npi) AS npi_list,
+            LIST(DISTINCT org_name) AS org_names,
+            SUM(total_paid) AS combined_total_paid,
+            -- State concentration: how many NPIs share the most-common state,
+            -- taken from a per-official state histogram in the same pass
+            LIST_MAX(MAP_VALUES(
+                HISTOGRAM(state) FILTER (WHERE state IS NOT NULL AND TRIM(state) != '')
+            )) AS max_state_npis
+        FROM official_with_paid
+        GROUP BY official_last, official_first
+        HAVING COUNT(DISTINCT npi) BETWEEN 5 AND 50
+          AND SUM(total_paid) > 1000000
+          AND max_state_npis >= 3
         ORDER BY combined_total_paid DESC
-    """).fetchall()
-
-    columns = ["official_last", "official_first", "npi_count", "npi_list",
-                "org_names", "combined_total_paid", "max_state_npis"]
+    """)
+
+    # Name is concatenated in SQL and the primary NPI taken column-wise, so
+    # the loop below only assembles dicts
+    primary_npi = pc.fill_null(pc.list_element(tbl["npi_list"], 0), "UNKNOWN")
+    combined = _as_float(tbl["combined_total_paid"])
+    npi_count = _as_int(tbl["npi_count"])
+    severity = pc.if_else(pc.greater(combined, 5_000_000), "high", "medium")
+    # Overpayment estimate: 20% of combined billing for networks with 5+ entities
+    # Conservative — based on DOJ settlement data showing shell networks average 20-40% fraud
+    overpayment = pc.multiply(combined, pc.if_else(pc.greater_equal(npi_count, 10), 0.2, 0.1))
 
     signals = []
-    for row in results:
-        d = dict(zip(columns, row))
-        combined = float(d["combined_total_paid"] or 0)
-        severity = "high" if combined > 5_000_000 else "medium"
-
-        # Build per-NPI breakdown
-        npi_list = d["npi_list"] if isinstance(d["npi_list"], list) else []
-
-        # Overpayment estimate: 20% of combined billing for networks with 5+ entities
-        # Conservative — based on DOJ settlement data showing shell networks average 20-40% fraud
-        npi_count = int(d["npi_count"] or 0)
-        overpayment = combined * 0.2 if npi_count >= 10 else combined * 0.1
-
+    for official_name, npi, npi_count, npi_list, org_names, combined, severity, overpayment in _rows(
+            tbl["official_name"], primary_npi, npi_count, tbl["npi_list"],
+            tbl["org_names"], combined, severity, overpayment):
         signals.append({
             "signal_type": "shared_official",
             "severity": severity,
-            "npi": npi_list[0] if npi_list else "UNKNOWN",
+            "npi": npi,
             "evidence": {
-                "authorized_official_name": f"{d['official_first']} {d['official_last']}",
+                "authorized_official_name": official_name,
                 "npi_count": npi_count,
-                "controlled_npis": npi_list,
-                "organization_names": d["org_names"] if isinstance(d["org_names"], list) else [],
+                "controlled_npis": npi_list or [],
+                "organization_names": org_names or [],
                 "combined_total_paid": round(combined, 2),
             },
             "estimated_overpayment_usd": round(overpayment, 2),
@@ -541,10 +612,10 @@ def signal_geographic_implausibility(con: duckdb.DuckDBPyConnection) -> list[dic
     chains, fiscal intermediaries) legitimately operate across states and are
     excluded to avoid large volumes of false positives.
     """
-    results = con.execute("""
+    batches = _fetch_batches(con, """
         WITH billing_home AS (
             SELECT npi, state AS home_state
-            FROM nppes
+            FROM provider_enriched
             WHERE state IS NOT NULL AND TRIM(state) != ''
               AND entity_type_code = '1'
         ),
@@ -568,7 +639,7 @@ def signal_geographic_implausibility(con: duckdb.DuckDBPyConnection) -> list[dic
         )
         SELECT
             pg.npi,
-            COALESCE(n.org_name, n.first_name || ' ' || n.last_name) AS provider_name,
+            n.provider_name,
             n.entity_type_code,
             n.taxonomy_code,
             pg.home_state,
@@ -576,47 +647,48 @@ def signal_geographic_implausibility(con: duckdb.DuckDBPyConnection) -> list[dic
             pg.total_paid,
             pg.home_state_claims,
             pg.foreign_state_count,
-            pg.home_state_claims * 100.0 / NULLIF(pg.total_claims, 0) AS home_state_pct
+            pg.home_state_claims * 100.0 / pg.total_claims AS home_state_pct
         FROM provider_geo pg
-        LEFT JOIN nppes n ON pg.npi = n.npi
-        WHERE pg.home_state_claims * 100.0 / NULLIF(pg.total_claims, 0) < 10.0
+        LEFT JOIN provider_enriched n ON pg.npi = n.npi
+        -- total_claims >= 500 from the HAVING above, so no zero guard is
+        -- needed; "<10% at home" is tested without dividing
+        WHERE pg.home_state_claims * 10 < pg.total_claims
         ORDER BY pg.total_paid DESC
-    """).fetchall()
-
-    columns = ["npi", "provider_name", "entity_type_code", "taxonomy_code", "home_state",
-               "total_claims", "total_paid", "home_state_claims", "foreign_state_count",
-               "home_state_pct"]
+    """)
 
     signals = []
-    for row in results:
-        d = dict(zip(columns, row))
-        total_claims = int(d["total_claims"] or 0)
-        home_claims = int(d["home_state_claims"] or 0)
-        total_paid = float(d["total_paid"] or 0)
-        home_pct = float(d["home_state_pct"] or 0)
-        foreign_states = int(d["foreign_state_count"] or 0)
+    for tbl in batches:
+        total_paid = _as_float(tbl["total_paid"])
+        home_pct = _as_float(tbl["home_state_pct"])
+        foreign_states = _as_int(tbl["foreign_state_count"])
 
         # Overpayment: billing outside home state may be phantom — conservatively
         # flag the foreign-state proportion of payments
-        foreign_fraction = max(0, 1.0 - home_pct / 100.0)
-        overpayment = total_paid * foreign_fraction * 0.4  # 40% of foreign billing
+        foreign_fraction = pc.max_element_wise(pc.subtract(1.0, pc.divide(home_pct, 100.0)), 0.0)
+        overpayment = pc.multiply(pc.multiply(total_paid, foreign_fraction), 0.4)  # 40% of foreign billing
 
-        severity = "high" if home_pct < 2.0 and foreign_states >= 5 else "medium"
+        severity = pc.if_else(
+            pc.and_(pc.less(home_pct, 2.0), pc.greater_equal(foreign_states, 5)), "high", "medium")
 
-        signals.append({
-            "signal_type": "geographic_implausibility",
-            "severity": severity,
-            "npi": d["npi"],
-            "evidence": {
-                "registered_state": d["home_state"],
-                "home_state_claims": home_claims,
-                "total_claims": total_claims,
-                "home_state_pct": round(home_pct, 2),
-                "foreign_states_count": foreign_states,
-                "total_paid": round(total_paid, 2),
-            },
-            "estimated_overpayment_usd": round(overpayment, 2),
-        })
+        for (npi, home_state, total_claims, home_claims, total_paid, home_pct,
+             foreign_states, severity, overpayment) in _rows(
+                tbl["npi"], tbl["home_state"], _as_int(tbl["total_claims"]),
+                _as_int(tbl["home_state_claims"]), total_paid, home_pct, foreign_states,
+                severity, overpayment):
+            signals.append({
+                "signal_type": "geographic_implausibility",
+                "severity": severity,
+                "npi": npi,
+                "evidence": {
+                    "registered_state": home_state,
+                    "home_state_claims": home_claims,
+                    "total_claims": total_claims,
+                    "home_state_pct": round(home_pct, 2),
+                    "foreign_states_count": foreign_states,
+                    "total_paid": round(total_paid, 2),
+                },
+                "estimated_overpayment_usd": round(overpayment, 2),
+            })
     return signals
 
 
@@ -628,56 +700,75 @@ def signal_address_clustering(con: duckdb.DuckDBPyConnection) -> list[dict]:
     share the same zip and combined billing exceeds $5M — potential
     ghost office or mill operation.
 
-    Optimized: reads from pre-materialized provider_totals table.
+    Optimized: reads from pre-materialized provider_totals table, and only
+    for NPIs in zips that already have 10+ registrations in NPPES.
     """
-    results = con.execute("""
-        WITH zip_clusters AS (
+    tbl = _fetch_arrow(con, """
+        WITH candidate_zips AS (
+            SELECT zip_code, state
+            FROM nppes
+            WHERE zip_code IS NOT NULL
+              AND TRIM(zip_code) != ''
+            GROUP BY zip_code, state
+            HAVING COUNT(DISTINCT npi) >= 10
+        ),
+        zip_clusters AS (
             SELECT
                 n.zip_code,
                 n.state,
                 COUNT(DISTINCT n.npi) AS npi_count,
-                LIST(DISTINCT n.npi) AS npi_list,
-                LIST(DISTINCT COALESCE(n.org_name, n.first_name || ' ' || n.last_name)) AS provider_names,
+                -- One nppes row per NPI, so a plain LIST is already distinct
+                LIST(n.npi) AS npi_list,
+                LIST(DISTINCT n.display_name) AS provider_names,
                 SUM(pt.total_paid) AS combined_paid,
                 SUM(pt.total_claims) AS combined_claims
             FROM nppes n
+            SEMI JOIN candidate_zips cz
+              ON n.zip_code = cz.zip_code AND n.state IS NOT DISTINCT FROM cz.state
             JOIN provider_totals pt ON n.npi = pt.npi
-            WHERE n.zip_code IS NOT NULL
-              AND TRIM(n.zip_code) != ''
             GROUP BY n.zip_code, n.state
             HAVING COUNT(DISTINCT n.npi) >= 10
                AND SUM(pt.total_paid) > 5000000
         )
-        SELECT * FROM zip_clusters
+        SELECT
+            zip_code,
+            state,
+            npi_count,
+            npi_list[1] AS primary_npi,
+            -- Evidence keeps the first 20 of each list; truncate before fetch
+            LIST_SLICE(npi_list, 1, 20) AS clustered_npis,
+            LIST_SLICE(provider_names, 1, 20) AS provider_names,
+            combined_paid,
+            combined_claims
+        FROM zip_clusters
         ORDER BY combined_paid DESC
-    """).fetchall()
+    """)
 
-    columns = ["zip_code", "state", "npi_count", "npi_list", "provider_names",
-               "combined_paid", "combined_claims"]
+    npi_count = _as_int(tbl["npi_count"])
+    combined_paid = _as_float(tbl["combined_paid"])
+    severity = pc.if_else(pc.greater_equal(npi_count, 20), "high", "medium")
+    # Overpayment: 15% of combined billing for address clusters
+    # Ghost offices typically submit 15-30% fraudulent claims (OIG data)
+    overpayment = pc.multiply(combined_paid, 0.15)
 
     signals = []
-    for row in results:
-        d = dict(zip(columns, row))
-        npi_list = d["npi_list"] if isinstance(d["npi_list"], list) else []
-        npi_count = int(d["npi_count"] or 0)
-        combined_paid = float(d["combined_paid"] or 0)
-        severity = "high" if npi_count >= 20 else "medium"
-        # Overpayment: 15% of combined billing for address clusters
-        # Ghost offices typically submit 15-30% fraudulent claims (OIG data)
-        overpayment = combined_paid * 0.15
-
+    for (zip_code, state, npi, npi_count, npi_list, provider_names, combined_paid,
+         combined_claims, severity, overpayment) in _rows(
+            tbl["zip_code"], tbl["state"], pc.fill_null(tbl["primary_npi"], "UNKNOWN"), npi_count,
+            tbl["clustered_npis"], tbl["provider_names"], combined_paid,
+            _as_int(tbl["combined_claims"]), severity, overpayment):
         signals.append({
             "signal_type": "address_clustering",
             "severity": severity,
-            "npi": npi_list[0] if npi_list else "UNKNOWN",
+            "npi": npi,
             "evidence": {
-                "zip_code": d["zip_code"],
-                "state": d["state"],
+                "zip_code": zip_code,
+                "state": state,
                 "npi_count": npi_count,
-                "clustered_npis": npi_list[:20],
-                "provider_names": (d["provider_names"] if isinstance(d["provider_names"], list) else [])[:20],
+                "clustered_npis": npi_list or [],
+                "provider_names": provider_names or [],
                 "combined_total_paid": round(combined_paid, 2),
-                "combined_total_claims": int(d["combined_claims"] or 0),
+                "combined_total_claims": combined_claims,
             },
             "estimated_overpayment_usd": round(overpayment, 2),
         })
@@ -694,13 +785,12 @@ def signal_upcoding(con: duckdb.DuckDBPyConnection) -> list[dict]:
 
     Optimized: reads from pre-materialized spending_em table.
     """
-    results = con.execute("""
+    tbl = _fetch_arrow(con, """
         WITH provider_em AS (
             SELECT
                 s.billing_npi AS npi,
                 SUM(s.total_claims) AS total_em_claims,
-                SUM(CASE WHEN s.hcpcs_code IN ('99215','99205','99223','99233','99245','99255')
-                    THEN s.total_claims ELSE 0 END) AS high_level_claims,
+                SUM(CASE WHEN s.is_high_em THEN s.total_claims ELSE 0 END) AS high_level_claims,
                 SUM(s.total_paid) AS total_paid
             FROM spending_em s
             GROUP BY s.billing_npi
@@ -708,13 +798,16 @@ def signal_upcoding(con: duckdb.DuckDBPyConnection) -> list[dict]:
         ),
         with_nppes AS (
             SELECT
-                pe.*,
+                pe.npi,
+                pe.total_em_claims,
+                pe.high_level_claims,
+                pe.total_paid,
                 n.taxonomy_code,
                 n.state,
-                COALESCE(n.org_name, n.first_name || ' ' || n.last_name) AS provider_name,
+                n.provider_name,
                 pe.high_level_claims * 100.0 / NULLIF(pe.total_em_claims, 0) AS high_pct
             FROM provider_em pe
-            JOIN nppes n ON pe.npi = n.npi
+            JOIN provider_enriched n ON pe.npi = n.npi
         ),
         peer_avg AS (
             SELECT
@@ -737,36 +830,36 @@ def signal_upcoding(con: duckdb.DuckDBPyConnection) -> list[dict]:
             wn.total_paid,
             wn.high_pct,
             pa.avg_high_pct AS peer_avg_high_pct,
-            pa.peer_count
+            pa.peer_count,
+            CASE WHEN wn.high_pct > 90 THEN 'high' ELSE 'medium' END AS severity,
+            -- Excess high-level share over peers, at a conservative 30% uplift
+            COALESCE(wn.total_paid, 0)
+                * (GREATEST(wn.high_pct - pa.avg_high_pct, 0) / 100.0) * 0.3 AS overpayment
         FROM with_nppes wn
         JOIN peer_avg pa ON wn.taxonomy_code = pa.taxonomy_code AND wn.state = pa.state
         WHERE wn.high_pct > 80.0
           AND pa.avg_high_pct < 30.0
         ORDER BY wn.high_pct DESC
-    """).fetchall()
-
-    columns = ["npi", "provider_name", "taxonomy_code", "state", "total_em_claims",
-               "high_level_claims", "total_paid", "high_pct", "peer_avg_high_pct", "peer_count"]
+    """)
 
     signals = []
-    for row in results:
-        d = dict(zip(columns, row))
-        high_pct = float(d["high_pct"] or 0)
-        peer_avg = float(d["peer_avg_high_pct"] or 0)
-        excess_pct = max(0, high_pct - peer_avg) / 100.0
-        overpayment = float(d["total_paid"] or 0) * excess_pct * 0.3  # conservative 30% uplift
-
+    for (npi, total_em_claims, high_level_claims, total_paid, high_pct, peer_avg,
+         peer_count, severity, overpayment) in _rows(
+            tbl["npi"], _as_int(tbl["total_em_claims"]), _as_int(tbl["high_level_claims"]),
+            _as_float(tbl["total_paid"]), _as_float(tbl["high_pct"]),
+            _as_float(tbl["peer_avg_high_pct"]), _as_int(tbl["peer_count"]),
+            tbl["severity"], _as_float(tbl["overpayment"])):
         signals.append({
             "signal_type": "upcoding",
-            "severity": "high" if high_pct > 90 else "medium",
-            "npi": d["npi"],
+            "severity": severity,
+            "npi": npi,
             "evidence": {
-                "total_em_claims": int(d["total_em_claims"] or 0),
-                "high_level_claims": int(d["high_level_claims"] or 0),
+                "total_em_claims": total_em_claims,
+                "high_level_claims": high_level_claims,
                 "high_level_percentage": round(high_pct, 2),
                 "peer_avg_high_level_percentage": round(peer_avg, 2),
-                "total_paid": round(float(d["total_paid"] or 0), 2),
-                "peer_count": int(d["peer_count"] or 0),
+                "total_paid": round(total_paid, 2),
+                "peer_count": peer_count,
             },
             "estimated_overpayment_usd": round(overpayment, 2),
         })
@@ -783,18 +876,22 @@ def signal_concurrent_billing(con: duckdb.DuckDBPyConnection) -> list[dict]:
     Optimized: reads from pre-materialized serv_state_monthly table
     (avoids the heavy spending × nppes join at query time).
     """
-    results = con.execute("""
+    tbl = _fetch_arrow(con, """
         WITH npi_state_months AS (
+            -- Only flag individuals — orgs legitimately operate multi-state, so
+            -- they are dropped before aggregating (NPIs missing from NPPES stay).
+            -- serv_state_monthly has one row per (npi, month, state), so a
+            -- plain COUNT(*) is already the exact distinct state count.
             SELECT
-                npi,
-                claim_month,
-                COUNT(DISTINCT state) AS state_count,
-                LIST(DISTINCT state) AS states,
-                SUM(month_paid) AS month_paid,
-                SUM(month_claims) AS month_claims
-            FROM serv_state_monthly
-            GROUP BY npi, claim_month
-            HAVING COUNT(DISTINCT state) >= 5
+                ssm.npi,
+                ssm.claim_month,
+                COUNT(*) AS state_count,
+                SUM(ssm.month_paid) AS month_paid,
+                SUM(ssm.month_claims) AS month_claims
+            FROM serv_state_monthly ssm
+            ANTI JOIN nppes org ON ssm.npi = org.npi AND org.entity_type_code = '2'
+            GROUP BY ssm.npi, ssm.claim_month
+            HAVING COUNT(*) >= 5
         ),
         flagged AS (
             SELECT
@@ -808,46 +905,36 @@ def signal_concurrent_billing(con: duckdb.DuckDBPyConnection) -> list[dict]:
         )
         SELECT
             f.npi,
-            COALESCE(n.org_name, n.first_name || ' ' || n.last_name) AS provider_name,
-            n.entity_type_code,
-            n.taxonomy_code,
             n.state AS home_state,
             f.max_states_in_month,
             f.months_flagged,
             f.total_paid_flagged,
-            f.total_claims_flagged
+            f.total_claims_flagged,
+            CASE WHEN f.max_states_in_month >= 8 THEN 'high' ELSE 'medium' END AS severity,
+            -- An individual can only legitimately practice in 1-2 states, so
+            -- excess-state billing is likely phantom: 60% of flagged payments
+            COALESCE(f.total_paid_flagged, 0) * 0.6 AS overpayment
         FROM flagged f
         LEFT JOIN nppes n ON f.npi = n.npi
         ORDER BY f.max_states_in_month DESC
-    """).fetchall()
-
-    columns = ["npi", "provider_name", "entity_type_code", "taxonomy_code", "home_state",
-               "max_states_in_month", "months_flagged", "total_paid_flagged", "total_claims_flagged"]
+    """)
 
     signals = []
-    for row in results:
-        d = dict(zip(columns, row))
-        entity = d["entity_type_code"]
-        # Only flag individuals — orgs legitimately operate multi-state
-        if entity == '2':
-            continue
-        max_states = int(d["max_states_in_month"] or 0)
-        total_paid_flagged = float(d["total_paid_flagged"] or 0)
-        severity = "high" if max_states >= 8 else "medium"
-        # Overpayment: individual can only legitimately practice in 1-2 states
-        # Excess states billing is likely phantom — estimate 60% of flagged payments
-        overpayment = total_paid_flagged * 0.6
-
+    for (npi, home_state, max_states, months_flagged, total_paid_flagged,
+         total_claims_flagged, severity, overpayment) in _rows(
+            tbl["npi"], tbl["home_state"], _as_int(tbl["max_states_in_month"]),
+            _as_int(tbl["months_flagged"]), _as_float(tbl["total_paid_flagged"]),
+            _as_int(tbl["total_claims_flagged"]), tbl["severity"], _as_float(tbl["overpayment"])):
         signals.append({
             "signal_type": "concurrent_billing",
             "severity": severity,
-            "npi": d["npi"],
+            "npi": npi,
             "evidence": {
-                "home_state": d["home_state"],
+                "home_state": home_state,
                 "max_states_in_single_month": max_states,
-                "months_flagged": int(d["months_flagged"] or 0),
+                "months_flagged": months_flagged,
                 "total_paid_in_flagged_months": round(total_paid_flagged, 2),
-                "total_claims_in_flagged_months": int(d["total_claims_flagged"] or 0),
+                "total_claims_in_flagged_months": total_claims_flagged,
             },
             "estimated_overpayment_usd": round(overpayment, 2),
         })
@@ -862,7 +949,7 @@ def signal_burst_enrollment_network(con: duckdb.DuckDBPyConnection) -> list[dict
     This is the shell-company incorporation pattern: a fraud ring registers
     many entities in rapid succession before ramping up billing.
     """
-    results = con.execute("""
+    tbl = _fetch_arrow(con, """
         WITH org_enum AS (
             SELECT
                 n.npi,
@@ -901,38 +988,50 @@ def signal_burst_enrollment_network(con: duckdb.DuckDBPyConnection) -> list[dict
             HAVING COUNT(*) >= 4
                AND SUM(total_paid) > 500000
         )
-        SELECT * FROM quarter_clusters
+        -- Evidence keeps the first 20 of each list; truncate before fetch
+        SELECT
+            * REPLACE (
+                LIST_SLICE(npi_list, 1, 20) AS npi_list,
+                LIST_SLICE(org_names, 1, 20) AS org_names
+            ),
+            STRFTIME(enum_quarter, '%Y-%m') BETWEEN ? AND ? AS covid_era
+        FROM quarter_clusters
         ORDER BY combined_paid DESC
-    """).fetchall()
+    """, [COVID_START, COVID_END])
 
-    columns = ["taxonomy_code", "state", "enum_quarter", "npi_count", "npi_list",
-               "org_names", "combined_paid", "combined_claims", "combined_beneficiaries",
-               "earliest_enum", "latest_enum", "span_days"]
+    npi_count = _as_int(tbl["npi_count"])
+    combined_paid = _as_float(tbl["combined_paid"])
+    covid_era = pc.fill_null(tbl["covid_era"], False)
+    # COVID-era: many legitimate providers enrolled during pandemic
+    severity = pc.if_else(covid_era, "low", pc.if_else(
+        pc.or_(pc.greater_equal(npi_count, 8), pc.greater(combined_paid, 5_000_000)),
+        "high", "medium"))
+    overpayment = pc.multiply(combined_paid, 0.25)
 
     signals = []
-    for row in results:
-        d = dict(zip(columns, row))
-        npi_list = d["npi_list"] if isinstance(d["npi_list"], list) else []
-        npi_count = int(d["npi_count"] or 0)
-        combined_paid = float(d["combined_paid"] or 0)
-        severity = "high" if npi_count >= 8 or combined_paid > 5_000_000 else "medium"
-        overpayment = combined_paid * 0.25
+    for (taxonomy_code, state, npi_count, npi_list, org_names, combined_paid, combined_claims,
+         combined_benes, earliest_enum, latest_enum, span_days, covid_era, severity,
+         overpayment) in _rows(
+            tbl["taxonomy_code"], tbl["state"], npi_count,
+            tbl["npi_list"], tbl["org_names"], combined_paid,
+            _as_int(tbl["combined_claims"]), _as_int(tbl["combined_beneficiaries"]),
+            tbl["earliest_enum"], tbl["latest_enum"], _as_int(tbl["span_days"]),
+            covid_era, severity, overpayment):
+        npi_list = npi_list or []
         evidence = {
-            "taxonomy_code": d["taxonomy_code"],
-            "state": d["state"],
+            "taxonomy_code": taxonomy_code,
+            "state": state,
             "npi_count": npi_count,
-            "enrolled_npis": npi_list[:20],
-            "organization_names": (d["org_names"] if isinstance(d["org_names"], list) else [])[:20],
-            "earliest_enumeration": str(d["earliest_enum"]),
-            "latest_enumeration": str(d["latest_enum"]),
-            "enrollment_span_days": int(d["span_days"] or 0),
+            "enrolled_npis": npi_list,
+            "organization_names": org_names or [],
+            "earliest_enumeration": str(earliest_enum),
+            "latest_enumeration": str(latest_enum),
+            "enrollment_span_days": span_days,
             "combined_total_paid": round(combined_paid, 2),
-            "combined_total_claims": int(d["combined_claims"] or 0),
-            "combined_total_beneficiaries": int(d["combined_beneficiaries"] or 0),
+            "combined_total_claims": combined_claims,
+            "combined_total_beneficiaries": combined_benes,
         }
-        # COVID-era: many legitimate providers enrolled during pandemic
-        if _is_covid_era(str(d["enum_quarter"])):
-            severity = "low"
+        if covid_era:
             evidence["covid_era_flag"] = True
 
         signals.append({
@@ -951,22 +1050,12 @@ def signal_coordinated_billing_ramp(con: duckdb.DuckDBPyConnection) -> list[dict
     Detects networks (via shared authorized official) where 3+ NPIs all
     have their peak billing month within a 3-month window — a coordination
     fingerprint that individual escalation analysis misses.
+
+    Optimized: reads networks from pre-materialized official_networks and
+    network_totals tables.
     """
-    results = con.execute("""
-        WITH official_networks AS (
-            SELECT
-                UPPER(TRIM(n.auth_official_last)) || '|' || UPPER(TRIM(n.auth_official_first)) AS network_key,
-                UPPER(TRIM(n.auth_official_first)) AS official_first,
-                UPPER(TRIM(n.auth_official_last)) AS official_last,
-                n.npi,
-                n.org_name
-            FROM nppes n
-            WHERE n.auth_official_last IS NOT NULL
-              AND TRIM(n.auth_official_last) != ''
-              AND n.auth_official_first IS NOT NULL
-              AND TRIM(n.auth_official_first) != ''
-        ),
-        npi_peaks AS (
+    tbl = _fetch_arrow(con, """
+        WITH npi_peaks AS (
             SELECT
                 on_net.network_key,
                 on_net.official_first,
@@ -996,58 +1085,65 @@ def signal_coordinated_billing_ramp(con: duckdb.DuckDBPyConnection) -> list[dict
             GROUP BY network_key, official_first, official_last
             HAVING COUNT(DISTINCT npi) >= 3
         ),
-        with_totals AS (
-            SELECT
-                npa.*,
-                (SELECT SUM(pt.total_paid) FROM provider_totals pt
-                 JOIN official_networks on2 ON pt.npi = on2.npi
-                 WHERE on2.network_key = npa.network_key) AS network_total_paid,
-                (SELECT LIST(DISTINCT on2.org_name) FROM official_networks on2
-                 WHERE on2.network_key = npa.network_key) AS org_names
-            FROM network_peak_analysis npa
-            WHERE npa.peak_spread_months <= 3
-              AND npa.combined_peak_paid > 200000
+        ramp_networks AS (
+            SELECT *
+            FROM network_peak_analysis
+            WHERE peak_spread_months <= 3
+              AND combined_peak_paid > 200000
+        ),
+        -- Org names for the flagged networks only, aggregated once per network
+        -- and hash-joined back. Unlike network_totals they cover every NPI in
+        -- the network, including ones that never billed.
+        network_orgs AS (
+            SELECT on2.network_key, LIST(DISTINCT on2.org_name) AS org_names
+            FROM official_networks on2
+            SEMI JOIN ramp_networks r ON on2.network_key = r.network_key
+            GROUP BY on2.network_key
         )
-        SELECT * FROM with_totals
-        ORDER BY network_total_paid DESC
-    """).fetchall()
-
-    columns = ["network_key", "official_first", "official_last", "npis_in_network",
-               "earliest_peak", "latest_peak", "peak_spread_months", "combined_peak_paid",
-               "npi_list", "network_total_paid", "org_names"]
+        SELECT
+            -- Drop the NULLs the CASE in npi_list leaves for non-peak rows, and
+            -- keep the first 20 of each evidence list before fetch
+            r.* REPLACE (LIST_SLICE(LIST_FILTER(r.npi_list, x -> x IS NOT NULL), 1, 20) AS npi_list),
+            nt.combined_paid AS network_total_paid,
+            LIST_SLICE(no.org_names, 1, 20) AS org_names
+        FROM ramp_networks r
+        LEFT JOIN network_totals nt ON r.network_key = nt.network_key
+        LEFT JOIN network_orgs no ON r.network_key = no.network_key
+        ORDER BY nt.combined_paid DESC
+    """)
+
+    npis = _as_int(tbl["npis_in_network"])
+    spread = _as_int(tbl["peak_spread_months"])
+    network_paid = _as_float(tbl["network_total_paid"])
+    severity = pc.if_else(
+        pc.and_(pc.and_(pc.less_equal(spread, 1), pc.greater_equal(npis, 5)),
+                pc.greater(network_paid, 2_000_000)),
+        "critical",
+        pc.if_else(pc.and_(pc.less_equal(spread, 3), pc.greater_equal(npis, 3)), "high", "medium"))
+    overpayment = pc.multiply(network_paid, 0.3)
 
     signals = []
-    for row in results:
-        d = dict(zip(columns, row))
-        npi_list = d["npi_list"] if isinstance(d["npi_list"], list) else []
-        # Filter out None values from the CASE expression
-        npi_list = [x for x in npi_list if x is not None]
-        npis = int(d["npis_in_network"] or 0)
-        spread = int(d["peak_spread_months"] or 0)
-        network_paid = float(d["network_total_paid"] or 0)
-
-        if spread <= 1 and npis >= 5 and network_paid > 2_000_000:
-            severity = "critical"
-        elif spread <= 3 and npis >= 3:
-            severity = "high"
-        else:
-            severity = "medium"
-
-        overpayment = network_paid * 0.3
+    for (official_first, official_last, npis, earliest_peak, latest_peak, spread,
+         combined_peak_paid, npi_list, network_paid, org_names, severity, overpayment) in _rows(
+            tbl["official_first"], tbl["official_last"], npis,
+            tbl["earliest_peak"], tbl["latest_peak"], spread,
+            _as_float(tbl["combined_peak_paid"]), tbl["npi_list"],
+            network_paid, tbl["org_names"], severity, overpayment):
+        npi_list = npi_list or []
 
         signals.append({
             "signal_type": "coordinated_billing_ramp",
             "severity": severity,
             "npi": npi_list[0] if npi_list else "UNKNOWN",
             "evidence": {
-                "authorized_official_name": f"{d['official_first']} {d['official_last']}",
+                "authorized_official_name": f"{official_first} {official_last}",
                 "npis_in_network": npis,
-                "network_npis": npi_list[:20],
-                "organization_names": (d["org_names"] if isinstance(d["org_names"], list) else [])[:20],
-                "earliest_peak_month": str(d["earliest_peak"]),
-                "latest_peak_month": str(d["latest_peak"]),
+                "network_npis": npi_list,
+                "organization_names": org_names or [],
+                "earliest_peak_month": str(earliest_peak),
+                "latest_peak_month": str(latest_peak),
                 "peak_spread_months": spread,
-                "combined_peak_paid": round(float(d["combined_peak_paid"] or 0), 2),
+                "combined_peak_paid": round(combined_peak_paid, 2),
                 "network_total_paid": round(network_paid, 2),
             },
             "estimated_overpayment_usd": round(overpayment, 2),
@@ -1064,14 +1160,17 @@ def signal_phantom_servicing_hub(con: duckdb.DuckDBPyConnection) -> list[dict]:
 
     Optimized: reads from pre-materialized servicing_hub_totals table.
     """
-    results = con.execute("""
+    tbl = _fetch_arrow(con, """
         WITH hub_agg AS (
             SELECT
                 servicing_npi,
                 COUNT(DISTINCT billing_npi) AS distinct_billing_npis,
                 SUM(total_paid) AS total_paid,
                 SUM(total_claims) AS total_claims,
-                SUM(total_beneficiaries) AS total_beneficiaries
+                SUM(total_beneficiaries) AS total_beneficiaries,
+                -- One servicing_hub_totals row per (servicing, billing) pair,
+                -- so a plain LIST is already distinct
+                LIST(billing_npi) AS billing_npi_list
             FROM servicing_hub_totals
             GROUP BY servicing_npi
             HAVING COUNT(DISTINCT billing_npi) >= 5
@@ -1081,54 +1180,47 @@ def signal_phantom_servicing_hub(con: duckdb.DuckDBPyConnection) -> list[dict]:
             SELECT
                 ha.*,
                 ha.total_beneficiaries * 1.0 / NULLIF(ha.total_claims, 0) AS bene_claim_ratio,
-                COALESCE(n.org_name, n.first_name || ' ' || n.last_name) AS servicing_provider_name,
-                n.entity_type_code,
+                n.display_name AS servicing_provider_name,
                 n.taxonomy_code,
-                n.state,
-                (SELECT LIST(DISTINCT sht.billing_npi)
-                 FROM servicing_hub_totals sht
-                 WHERE sht.servicing_npi = ha.servicing_npi) AS billing_npi_list
+                n.state
             FROM hub_agg ha
             LEFT JOIN nppes n ON ha.servicing_npi = n.npi
         )
-        SELECT * FROM hub_details
+        SELECT
+            * REPLACE (LIST_SLICE(billing_npi_list, 1, 20) AS billing_npi_list),
+            CASE
+                WHEN distinct_billing_npis >= 15
+                  OR (distinct_billing_npis >= 10 AND COALESCE(bene_claim_ratio, 0) < 0.1)
+                    THEN 'critical'
+                WHEN distinct_billing_npis >= 10 OR total_paid > 2000000 THEN 'high'
+                ELSE 'medium'
+            END AS severity,
+            COALESCE(total_paid, 0) * 0.35 AS overpayment
+        FROM hub_details
         ORDER BY total_paid DESC
-    """).fetchall()
-
-    columns = ["servicing_npi", "distinct_billing_npis", "total_paid", "total_claims",
-               "total_beneficiaries", "bene_claim_ratio", "servicing_provider_name",
-               "entity_type_code", "taxonomy_code", "state", "billing_npi_list"]
+    """)
 
     signals = []
-    for row in results:
-        d = dict(zip(columns, row))
-        billing_count = int(d["distinct_billing_npis"] or 0)
-        total_paid = float(d["total_paid"] or 0)
-        bene_ratio = float(d["bene_claim_ratio"] or 0)
-        billing_npi_list = d["billing_npi_list"] if isinstance(d["billing_npi_list"], list) else []
-
-        if billing_count >= 15 or (billing_count >= 10 and bene_ratio < 0.1):
-            severity = "critical"
-        elif billing_count >= 10 or total_paid > 2_000_000:
-            severity = "high"
-        else:
-            severity = "medium"
-
-        overpayment = total_paid * 0.35
-
+    for (servicing_npi, billing_count, total_paid, total_claims, total_benes, bene_ratio,
+         provider_name, taxonomy_code, state, billing_npi_list, severity, overpayment) in _rows(
+            tbl["servicing_npi"], _as_int(tbl["distinct_billing_npis"]),
+            _as_float(tbl["total_paid"]), _as_int(tbl["total_claims"]),
+            _as_int(tbl["total_beneficiaries"]), _as_float(tbl["bene_claim_ratio"]),
+            tbl["servicing_provider_name"], tbl["taxonomy_code"], tbl["state"],
+            tbl["billing_npi_list"], tbl["severity"], _as_float(tbl["overpayment"])):
         signals.append({
             "signal_type": "phantom_servicing_hub",
             "severity": severity,
-            "npi": d["servicing_npi"],
+            "npi": servicing_npi,
             "evidence": {
-                "servicing_provider_name": d["servicing_provider_name"] or "Unknown",
-                "taxonomy_code": d["taxonomy_code"],
-                "state": d["state"],
+                "servicing_provider_name": provider_name or "Unknown",
+                "taxonomy_code": taxonomy_code,
+                "state": state,
                 "distinct_billing_npis": billing_count,
-                "billing_npi_list": billing_npi_list[:20],
+                "billing_npi_list": billing_npi_list or [],
                 "total_paid_through_hub": round(total_paid, 2),
-                "total_claims": int(d["total_claims"] or 0),
-                "total_beneficiaries": int(d["total_beneficiaries"] or 0),
+                "total_claims": total_claims,
+                "total_beneficiaries": total_benes,
                 "beneficiary_claim_ratio": round(bene_ratio, 4),
             },
             "estimated_overpayment_usd": round(overpayment, 2),
@@ -1143,102 +1235,94 @@ def signal_network_beneficiary_dilution(con: duckdb.DuckDBPyConnection) -> list[
     network-wide beneficiary-to-claims ratio. Flags networks where
     combined unique beneficiaries are very low relative to combined claims,
     suggesting beneficiary recycling across shell entities.
+
+    Optimized: reads per-network totals from pre-materialized network_totals table.
     """
-    results = con.execute("""
-        WITH official_networks AS (
+    tbl = _fetch_arrow(con, """
+        WITH network_candidates AS (
             SELECT
-                UPPER(TRIM(n.auth_official_last)) || '|' || UPPER(TRIM(n.auth_official_first)) AS network_key,
-                UPPER(TRIM(n.auth_official_first)) AS official_first,
-                UPPER(TRIM(n.auth_official_last)) AS official_last,
-                n.npi,
-                n.org_name
-            FROM nppes n
-            WHERE n.auth_official_last IS NOT NULL
-              AND TRIM(n.auth_official_last) != ''
-              AND n.auth_official_first IS NOT NULL
-              AND TRIM(n.auth_official_first) != ''
+                *,
+                combined_beneficiaries * 1.0 / NULLIF(combined_claims, 0) AS network_bene_ratio,
+                combined_claims * 1.0 / NULLIF(combined_beneficiaries, 0) AS claims_per_bene
+            FROM network_totals
+            WHERE npi_count >= 3
+              AND combined_paid > 500000
+              AND combined_claims > 0
         ),
-        network_totals AS (
+        peer_quantiles AS (
+            -- Both bene-ratio cut points come from one sort. Exact quantiles
+            -- are kept on purpose: approx_quantile snaps to sample values on
+            -- small inputs, which would shift the reported peer medians.
             SELECT
-                on_net.network_key,
-                on_net.official_first,
-                on_net.official_last,
-                COUNT(DISTINCT on_net.npi) AS npi_count,
-                LIST(DISTINCT on_net.npi) AS npi_list,
-                LIST(DISTINCT on_net.org_name) AS org_names,
-                SUM(pt.total_paid) AS combined_paid,
-                SUM(pt.total_claims) AS combined_claims,
-                SUM(pt.total_beneficiaries) AS combined_beneficiaries,
-                SUM(pt.total_beneficiaries) * 1.0 / NULLIF(SUM(pt.total_claims), 0) AS network_bene_ratio,
-                SUM(pt.total_claims) * 1.0 / NULLIF(SUM(pt.total_beneficiaries), 0) AS claims_per_bene
-            FROM official_networks on_net
-            JOIN provider_totals pt ON on_net.npi = pt.npi
-            GROUP BY on_net.network_key, on_net.official_first, on_net.official_last
-            HAVING COUNT(DISTINCT on_net.npi) >= 3
-               AND SUM(pt.total_paid) > 500000
-               AND SUM(pt.total_claims) > 0
+                QUANTILE_CONT(network_bene_ratio, [0.1, 0.5]) AS bene_ratio_q,
+                QUANTILE_CONT(claims_per_bene, 0.5) AS median_claims_per_bene
+            FROM network_candidates
         ),
         peer_stats AS (
             SELECT
-                PERCENTILE_CONT(0.1) WITHIN GROUP (ORDER BY network_bene_ratio) AS p10_bene_ratio,
-                PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY network_bene_ratio) AS median_bene_ratio,
-                PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY claims_per_bene) AS median_claims_per_bene
-            FROM network_totals
+                bene_ratio_q[1] AS p10_bene_ratio,
+                bene_ratio_q[2] AS median_bene_ratio,
+                -- A missing or zero median falls back to 1 claim per beneficiary
+                COALESCE(NULLIF(median_claims_per_bene, 0), 1) AS median_claims_per_bene
+            FROM peer_quantiles
         )
         SELECT
-            nt.*,
+            -- Evidence keeps the first 20 of each list; truncate before fetch
+            nt.* REPLACE (
+                LIST_SLICE(nt.npi_list, 1, 20) AS npi_list,
+                LIST_SLICE(nt.org_names, 1, 20) AS org_names
+            ),
             ps.p10_bene_ratio,
             ps.median_bene_ratio,
-            ps.median_claims_per_bene
-        FROM network_totals nt
+            ps.median_claims_per_bene,
+            CASE
+                WHEN COALESCE(nt.claims_per_bene, 0) > 100 AND nt.combined_paid > 2000000
+                    THEN 'critical'
+                WHEN COALESCE(nt.claims_per_bene, 0) > 50
+                  OR (COALESCE(nt.network_bene_ratio, 0) < 0.02 AND nt.npi_count >= 5)
+                    THEN 'high'
+                ELSE 'medium'
+            END AS severity,
+            -- Excess claims above the peer median rate × avg cost per claim,
+            -- capped at 80% of billing; half of billing when no rate applies.
+            -- combined_claims > 0 is guaranteed by network_candidates.
+            CASE
+                WHEN nt.combined_beneficiaries > 0 AND ps.median_claims_per_bene > 0
+                    THEN LEAST(
+                        GREATEST(nt.combined_claims
+                                 - nt.combined_beneficiaries * ps.median_claims_per_bene, 0)
+                            * (nt.combined_paid / nt.combined_claims),
+                        nt.combined_paid * 0.8)
+                ELSE nt.combined_paid * 0.5
+            END AS overpayment
+        FROM network_candidates nt
         CROSS JOIN peer_stats ps
         WHERE nt.claims_per_bene > 50
            OR nt.network_bene_ratio < ps.p10_bene_ratio
         ORDER BY nt.combined_paid DESC
-    """).fetchall()
-
-    columns = ["network_key", "official_first", "official_last", "npi_count",
-               "npi_list", "org_names", "combined_paid", "combined_claims",
-               "combined_beneficiaries", "network_bene_ratio", "claims_per_bene",
-               "p10_bene_ratio", "median_bene_ratio", "median_claims_per_bene"]
+    """)
 
     signals = []
-    for row in results:
-        d = dict(zip(columns, row))
-        npi_list = d["npi_list"] if isinstance(d["npi_list"], list) else []
-        npi_count = int(d["npi_count"] or 0)
-        combined_paid = float(d["combined_paid"] or 0)
-        combined_claims = int(d["combined_claims"] or 0)
-        combined_benes = int(d["combined_beneficiaries"] or 0)
-        claims_per_bene = float(d["claims_per_bene"] or 0)
-        bene_ratio = float(d["network_bene_ratio"] or 0)
-        median_cpb = float(d["median_claims_per_bene"] or 1)
-
-        if claims_per_bene > 100 and combined_paid > 2_000_000:
-            severity = "critical"
-        elif claims_per_bene > 50 or (bene_ratio < 0.02 and npi_count >= 5):
-            severity = "high"
-        else:
-            severity = "medium"
-
-        # Overpayment: excess claims above peer median rate × avg cost per claim
-        if combined_benes > 0 and median_cpb > 0:
-            expected_claims = combined_benes * median_cpb
-            excess_claims = max(0, combined_claims - expected_claims)
-            cost_per_claim = combined_paid / combined_claims if combined_claims > 0 else 0
-            overpayment = min(excess_claims * cost_per_claim, combined_paid * 0.8)
-        else:
-            overpayment = combined_paid * 0.5
+    for (official_first, official_last, npi_count, npi_list, org_names, combined_paid,
+         combined_claims, combined_benes, claims_per_bene, bene_ratio, median_cpb,
+         severity, overpayment) in _rows(
+            tbl["official_first"], tbl["official_last"], _as_int(tbl["npi_count"]),
+            tbl["npi_list"], tbl["org_names"], _as_float(tbl["combined_paid"]),
+            _as_int(tbl["combined_claims"]), _as_int(tbl["combined_beneficiaries"]),
+            _as_float(tbl["claims_per_bene"]), _as_float(tbl["network_bene_ratio"]),
+            _as_float(tbl["median_claims_per_bene"]), tbl["severity"],
+            _as_float(tbl["overpayment"])):
+        npi_list = npi_list or []
 
         signals.append({
             "signal_type": "network_beneficiary_dilution",
             "severity": severity,
             "npi": npi_list[0] if npi_list else "UNKNOWN",
             "evidence": {
-                "authorized_official_name": f"{d['official_first']} {d['official_last']}",
+                "authorized_official_name": f"{official_first} {official_last}",
                 "npi_count": npi_count,
-                "network_npis": npi_list[:20],
-                "organization_names": (d["org_names"] if isinstance(d["org_names"], list) else [])[:20],
+                "network_npis": npi_list,
+                "organization_names": org_names or [],
                 "combined_total_paid": round(combined_paid, 2),
                 "combined_total_claims": combined_claims,
                 "combined_total_beneficiaries": combined_benes,
@@ -1265,15 +1349,7 @@ def signal_caregiver_density_anomaly(con: duckdb.DuckDBPyConnection) -> list[dic
     census_zcta table exists, comparing actual billing to demographic
     expectations (elderly + disabled population).
     """
-    # Check if census enrichment is available
-    has_census = False
-    try:
-        con.execute("SELECT 1 FROM census_zcta LIMIT 1")
-        has_census = True
-    except Exception:
-        pass
-
-    if has_census:
+    if _table_exists(con, "census_zcta"):
         query = """
             WITH zip_agg AS (
                 SELECT
@@ -1290,21 +1366,22 @@ def signal_caregiver_density_anomaly(con: duckdb.DuckDBPyConnection) -> list[dic
                 GROUP BY zip_code, state
                 HAVING SUM(hh_paid) >= 100000
             ),
-            state_medians AS (
+            zip_stats AS (
+                -- State median and zip count as window aggregates over zip_agg,
+                -- instead of a grouped CTE joined back on state. NULL states
+                -- never matched that join, so they are excluded here too.
                 SELECT
-                    state,
-                    PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY total_hh_paid) AS median_hh_paid,
-                    COUNT(*) AS zips_in_state
+                    *,
+                    QUANTILE_CONT(total_hh_paid, 0.5) OVER (PARTITION BY state) AS median_hh_paid,
+                    COUNT(*) OVER (PARTITION BY state) AS zips_in_state
                 FROM zip_agg
-                GROUP BY state
-                HAVING COUNT(*) >= 3
+                WHERE state IS NOT NULL
+                QUALIFY COUNT(*) OVER (PARTITION BY state) >= 3
             ),
             with_census AS (
                 SELECT
                     za.*,
-                    sm.median_hh_paid,
-                    sm.zips_in_state,
-                    za.total_hh_paid / NULLIF(sm.median_hh_paid, 0) AS ratio_to_state_median,
+                    za.total_hh_paid / NULLIF(za.median_hh_paid, 0) AS ratio_to_state_median,
                     za.individual_provider_count * 1.0 / NULLIF(za.provider_count, 0) AS individual_ratio,
                     za.total_hh_beneficiaries * 1.0 / NULLIF(za.individual_provider_count, 0) AS benes_per_individual,
                     c.total_population,
@@ -1312,8 +1389,7 @@ def signal_caregiver_density_anomaly(con: duckdb.DuckDBPyConnection) -> list[dic
                     c.disability_count,
                     (c.population_65_plus + c.disability_count) AS vulnerable_population,
                     za.total_hh_paid * 1.0 / NULLIF(c.population_65_plus + c.disability_count, 0) AS paid_per_vulnerable
-                FROM zip_agg za
-                JOIN state_medians sm ON za.state = sm.state
+                FROM zip_stats za
                 LEFT JOIN census_zcta c ON LEFT(za.zip_code, 5) = c.zcta
             ),
             census_state_medians AS (
@@ -1326,7 +1402,8 @@ def signal_caregiver_density_anomaly(con: duckdb.DuckDBPyConnection) -> list[dic
                 HAVING COUNT(*) >= 3
             )
             SELECT
-                wc.*,
+                -- Only the first 20 provider names reach the evidence
+                wc.* REPLACE (LIST_SLICE(wc.provider_names, 1, 20) AS provider_names),
                 csm.median_paid_per_vulnerable,
                 wc.paid_per_vulnerable / NULLIF(csm.median_paid_per_vulnerable, 0) AS census_ratio
             FROM with_census wc
@@ -1353,20 +1430,22 @@ def signal_caregiver_density_anomaly(con: duckdb.DuckDBPyConnection) -> list[dic
                 GROUP BY zip_code, state
                 HAVING SUM(hh_paid) >= 100000
             ),
-            state_medians AS (
+            zip_stats AS (
+                -- State median and zip count as window aggregates over zip_agg,
+                -- instead of a grouped CTE joined back on state. NULL states
+                -- never matched that join, so they are excluded here too.
                 SELECT
-                    state,
-                    PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY total_hh_paid) AS median_hh_paid,
-                    COUNT(*) AS zips_in_state
+                    *,
+                    QUANTILE_CONT(total_hh_paid, 0.5) OVER (PARTITION BY state) AS median_hh_paid,
+                    COUNT(*) OVER (PARTITION BY state) AS zips_in_state
                 FROM zip_agg
-                GROUP BY state
-                HAVING COUNT(*) >= 3
+                WHERE state IS NOT NULL
+                QUALIFY COUNT(*) OVER (PARTITION BY state) >= 3
             )
             SELECT
-                za.*,
-                sm.median_hh_paid,
-                sm.zips_in_state,
-                za.total_hh_paid / NULLIF(sm.median_hh_paid, 0) AS ratio_to_state_median,
+                -- Only the first 20 provider names reach the evidence
+                za.* REPLACE (LIST_SLICE(za.provider_names, 1, 20) AS provider_names),
+                za.total_hh_paid / NULLIF(za.median_hh_paid, 0) AS ratio_to_state_median,
                 za.individual_provider_count * 1.0 / NULLIF(za.provider_count, 0) AS individual_ratio,
                 za.total_hh_beneficiaries * 1.0 / NULLIF(za.individual_provider_count, 0) AS benes_per_individual,
                 NULL::INTEGER AS total_population,
@@ -1376,65 +1455,61 @@ def signal_caregiver_density_anomaly(con: duckdb.DuckDBPyConnection) -> list[dic
                 NULL::DOUBLE AS paid_per_vulnerable,
                 NULL::DOUBLE AS median_paid_per_vulnerable,
                 NULL::DOUBLE AS census_ratio
-            FROM zip_agg za
-            JOIN state_medians sm ON za.state = sm.state
-            WHERE za.total_hh_paid / NULLIF(sm.median_hh_paid, 0) > 3.0
+            FROM zip_stats za
+            WHERE za.total_hh_paid / NULLIF(za.median_hh_paid, 0) > 3.0
               AND za.individual_provider_count * 1.0 / NULLIF(za.provider_count, 0) > 0.5
               AND za.total_hh_beneficiaries * 1.0 / NULLIF(za.individual_provider_count, 0) < 5.0
             ORDER BY za.total_hh_paid DESC
         """
 
-    results = con.execute(query).fetchall()
+    tbl = _fetch_arrow(con, query)
 
-    columns = [
-        "zip_code", "state", "provider_count", "individual_provider_count",
-        "total_hh_paid", "total_hh_claims", "total_hh_beneficiaries",
-        "npi_list", "provider_names",
-        "median_hh_paid", "zips_in_state", "ratio_to_state_median",
-        "individual_ratio", "benes_per_individual",
-        "total_population", "population_65_plus", "disability_count",
-        "vulnerable_population", "paid_per_vulnerable",
-        "median_paid_per_vulnerable", "census_ratio",
-    ]
+    total_hh_paid = _as_float(tbl["total_hh_paid"])
+    median = _as_float(tbl["median_hh_paid"])
+    ratio = _as_float(tbl["ratio_to_state_median"])
+    # Severity: high if billing > 5x state median or census_ratio > 5
+    severity = pc.if_else(
+        pc.or_(pc.or_(pc.greater(ratio, 5.0),
+                      pc.greater(_as_float(tbl["census_ratio"]), 5.0)),
+               pc.greater(total_hh_paid, 500000)),
+        "high", "medium")
+    # Overpayment: excess above state median × 40%
+    overpayment = pc.multiply(pc.max_element_wise(pc.subtract(total_hh_paid, median), 0.0), 0.4)
 
     signals = []
-    for row in results:
-        d = dict(zip(columns, row))
-        npi_list = d["npi_list"] if isinstance(d["npi_list"], list) else []
-        total_hh_paid = float(d["total_hh_paid"] or 0)
-        ratio = float(d["ratio_to_state_median"] or 0)
-        median = float(d["median_hh_paid"] or 0)
-        benes_per_indiv = float(d["benes_per_individual"] or 0)
-        census_ratio = float(d["census_ratio"] or 0) if d["census_ratio"] else None
-
-        # Severity: high if billing > 5x state median or census_ratio > 5
-        if ratio > 5.0 or (census_ratio and census_ratio > 5.0) or total_hh_paid > 500000:
-            severity = "high"
-        else:
-            severity = "medium"
-
-        # Overpayment: excess above state median × 40%
-        overpayment = max(0, total_hh_paid - median) * 0.4
+    for (zip_code, state, provider_count, individual_count, individual_ratio, total_hh_paid,
+         total_hh_claims, total_hh_benes, benes_per_indiv, median, ratio, npi_list,
+         provider_names, vulnerable_population, paid_per_vulnerable, census_ratio,
+         severity, overpayment) in _rows(
+            tbl["zip_code"], tbl["state"], _as_int(tbl["provider_count"]),
+            _as_int(tbl["individual_provider_count"]), _as_float(tbl["individual_ratio"]),
+            total_hh_paid, _as_int(tbl["total_hh_claims"]),
+            _as_int(tbl["total_hh_beneficiaries"]), _as_float(tbl["benes_per_individual"]),
+            median, ratio,
+            tbl["npi_list"], tbl["provider_names"], _as_int(tbl["vulnerable_population"]),
+            _as_float(tbl["paid_per_vulnerable"]), tbl["census_ratio"], severity, overpayment):
+        npi_list = npi_list or []
+        census_ratio = float(census_ratio) if census_ratio else None
 
         evidence = {
-            "zip_code": d["zip_code"],
-            "state": d["state"],
-            "provider_count": int(d["provider_count"] or 0),
-            "individual_provider_count": int(d["individual_provider_count"] or 0),
-            "individual_provider_ratio": round(float(d["individual_ratio"] or 0), 2),
+            "zip_code": zip_code,
+            "state": state,
+            "provider_count": provider_count,
+            "individual_provider_count": individual_count,
+            "individual_provider_ratio": round(individual_ratio, 2),
             "total_hh_paid": round(total_hh_paid, 2),
-            "total_hh_claims": int(d["total_hh_claims"] or 0),
-            "total_hh_beneficiaries": int(d["total_hh_beneficiaries"] or 0),
+            "total_hh_claims": total_hh_claims,
+            "total_hh_beneficiaries": total_hh_benes,
             "beneficiaries_per_individual_provider": round(benes_per_indiv, 2),
             "state_median_hh_paid": round(median, 2),
             "ratio_to_state_median": round(ratio, 2),
             "flagged_npis": npi_list[:20],
-            "provider_names": (d["provider_names"] if isinstance(d["provider_names"], list) else [])[:20],
+            "provider_names": provider_names or [],
         }
 
         if census_ratio is not None:
-            evidence["census_vulnerable_population"] = int(d["vulnerable_population"] or 0)
-            evidence["paid_per_vulnerable_person"] = round(float(d["paid_per_vulnerable"] or 0), 2)
+            evidence["census_vulnerable_population"] = vulnerable_population
+            evidence["paid_per_vulnerable_person"] = round(paid_per_vulnerable, 2)
             evidence["census_ratio_to_state_median"] = round(census_ratio, 2)
 
         # Emit one signal per flagged NPI in the zip
@@ -1489,7 +1564,7 @@ def signal_repetitive_service_abuse(con: duckdb.DuckDBPyConnection) -> list[dict
             cp.p99_claims_per_bene,
             cp.median_claims_per_bene,
             cp.peer_count,
-            COALESCE(n.org_name, n.first_name || ' ' || n.last_name) AS provider_name,
+            n.display_name AS provider_name,
             n.state,
             n.taxonomy_code
         FROM code_level cl
@@ -1498,23 +1573,22 @@ def signal_repetitive_service_abuse(con: duckdb.DuckDBPyConnection) -> list[dict
         WHERE cl.claims_per_bene > cp.p99_claims_per_bene
         ORDER BY cl.claims_per_bene DESC
     """
-    results = con.execute(query).fetchall()
-    columns = [
-        "npi", "hcpcs_code", "total_claims", "total_beneficiaries", "total_paid",
-        "claims_per_bene", "p99_claims_per_bene", "median_claims_per_bene",
-        "peer_count", "provider_name", "state", "taxonomy_code",
-    ]
+    tbl = _fetch_arrow(con, query)
 
-    signals = []
-    for row in results:
-        d = dict(zip(columns, row))
-        claims_per_bene = float(d["claims_per_bene"] or 0)
-        p99 = float(d["p99_claims_per_bene"] or 0)
-        total_claims = int(d["total_claims"] or 0)
-        total_benes = int(d["total_beneficiaries"] or 0)
-        total_paid = float(d["total_paid"] or 0)
+    claims_per_bene = _as_float(tbl["claims_per_bene"])
+    p99 = _as_float(tbl["p99_claims_per_bene"])
+    severity = pc.if_else(
+        pc.and_(pc.greater(p99, 0), pc.greater(claims_per_bene, pc.multiply(p99, 3))),
+        "high", "medium")
 
-        severity = "high" if p99 > 0 and claims_per_bene > p99 * 3 else "medium"
+    signals = []
+    for (npi, hcpcs_code, total_claims, total_benes, total_paid, claims_per_bene, p99,
+         median_cpb, peer_count, state, taxonomy_code, severity) in _rows(
+            tbl["npi"], tbl["hcpcs_code"], _as_int(tbl["total_claims"]),
+            _as_int(tbl["total_beneficiaries"]), _as_float(tbl["total_paid"]),
+            claims_per_bene, p99,
+            _as_float(tbl["median_claims_per_bene"]), _as_int(tbl["peer_count"]),
+            tbl["state"], tbl["taxonomy_code"], severity):
 
         excess_claims = max(0, total_claims - (p99 * total_benes))
         cost_per_claim = total_paid / max(total_claims, 1)
@@ -1523,18 +1597,18 @@ def signal_repetitive_service_abuse(con: duckdb.DuckDBPyConnection) -> list[dict
         signals.append({
             "signal_type": "repetitive_service_abuse",
             "severity": severity,
-            "npi": d["npi"],
+            "npi": npi,
             "evidence": {
-                "hcpcs_code": d["hcpcs_code"],
+                "hcpcs_code": hcpcs_code,
                 "total_claims": total_claims,
                 "total_beneficiaries": total_benes,
                 "claims_per_beneficiary": round(claims_per_bene, 1),
                 "peer_99th_percentile_claims_per_bene": round(p99, 1),
-                "peer_median_claims_per_bene": round(float(d["median_claims_per_bene"] or 0), 1),
-                "peer_count": int(d["peer_count"] or 0),
+                "peer_median_claims_per_bene": round(median_cpb, 1),
+                "peer_count": peer_count,
                 "total_paid": round(total_paid, 2),
-                "state": d["state"],
-                "taxonomy_code": d["taxonomy_code"],
+                "state": state,
+                "taxonomy_code": taxonomy_code,
             },
             "estimated_overpayment_usd": round(overpayment, 2),
         })
@@ -1580,7 +1654,7 @@ def signal_billing_monoculture(con: duckdb.DuckDBPyConnection) -> list[dict]:
             cs.total_paid AS dominant_code_paid,
             cs.grand_total_claims,
             cs.grand_total_paid,
-            COALESCE(n.org_name, n.first_name || ' ' || n.last_name) AS provider_name,
+            n.display_name AS provider_name,
             n.state,
             n.taxonomy_code
         FROM code_shares cs
@@ -1589,41 +1663,41 @@ def signal_billing_monoculture(con: duckdb.DuckDBPyConnection) -> list[dict]:
           AND cs.code_share_pct > 85.0
         ORDER BY cs.code_share_pct DESC
     """
-    results = con.execute(query).fetchall()
-    columns = [
-        "npi", "dominant_code", "code_share_pct", "dominant_code_claims",
-        "dominant_code_paid", "grand_total_claims", "grand_total_paid",
-        "provider_name", "state", "taxonomy_code",
-    ]
+    tbl = _fetch_arrow(con, query)
+
+    share = _as_float(tbl["code_share_pct"])
+    grand_paid = _as_float(tbl["grand_total_paid"])
+    severity = pc.if_else(
+        pc.and_(pc.greater(share, 95), pc.greater(grand_paid, 500000)), "high", "medium")
 
     signals = []
-    for row in results:
-        d = dict(zip(columns, row))
-        share = float(d["code_share_pct"] or 0)
-        grand_paid = float(d["grand_total_paid"] or 0)
+    for (npi, dominant_code, share, dominant_claims, dominant_paid, grand_claims,
+         grand_paid, state, taxonomy_code, severity) in _rows(
+            tbl["npi"], tbl["dominant_code"], share,
+            _as_int(tbl["dominant_code_claims"]), _as_float(tbl["dominant_code_paid"]),
+            _as_int(tbl["grand_total_claims"]), grand_paid,
+            tbl["state"], tbl["taxonomy_code"], severity):
 
         # COVID-era: skip if dominant code is a COVID HCPCS — not suspicious
-        if d["dominant_code"] in COVID_HCPCS:
+        if dominant_code in COVID_HCPCS:
             continue
 
-        severity = "high" if share > 95 and grand_paid > 500000 else "medium"
-
         excess_share = (share - 85.0) / 100.0
         overpayment = grand_paid * excess_share * 0.25
 
         signals.append({
             "signal_type": "billing_monoculture",
             "severity": severity,
-            "npi": d["npi"],
+            "npi": npi,
             "evidence": {
-                "dominant_hcpcs_code": d["dominant_code"],
+                "dominant_hcpcs_code": dominant_code,
                 "dominant_code_share_pct": round(share, 1),
-                "dominant_code_claims": int(d["dominant_code_claims"] or 0),
-                "dominant_code_paid": round(float(d["dominant_code_paid"] or 0), 2),
-                "total_claims_all_codes": int(d["grand_total_claims"] or 0),
+                "dominant_code_claims": dominant_claims,
+                "dominant_code_paid": round(dominant_paid, 2),
+                "total_claims_all_codes": grand_claims,
                 "total_paid_all_codes": round(grand_paid, 2),
-                "state": d["state"],
-                "taxonomy_code": d["taxonomy_code"],
+                "state": state,
+                "taxonomy_code": taxonomy_code,
             },
             "estimated_overpayment_usd": round(overpayment, 2),
         })
@@ -1697,50 +1771,51 @@ def signal_billing_bust_out(con: duckdb.DuckDBPyConnection) -> list[dict]:
         SELECT
             pp.npi, pp.peak_month, pp.peak_paid, pp.peak_claims, pp.total_months,
             pp.post_3mo_paid, pp.post_peak_pct_of_peak, pp.avg_pre_3mo_paid,
-            COALESCE(n.org_name, n.first_name || ' ' || n.last_name) AS provider_name,
-            n.state, n.taxonomy_code, n.entity_type_code
+            n.display_name AS provider_name,
+            n.state, n.taxonomy_code, n.entity_type_code,
+            STRFTIME(pp.peak_month, '%Y-%m') BETWEEN ? AND ? AS covid_era
         FROM pre_peak pp
         LEFT JOIN nppes n ON pp.npi = n.npi
         ORDER BY pp.peak_paid DESC
     """
-    results = con.execute(query).fetchall()
-    columns = [
-        "npi", "peak_month", "peak_paid", "peak_claims", "total_months",
-        "post_3mo_paid", "post_peak_pct_of_peak", "avg_pre_3mo_paid",
-        "provider_name", "state", "taxonomy_code", "entity_type_code",
-    ]
+    tbl = _fetch_arrow(con, query, [COVID_START, COVID_END])
 
-    signals = []
-    for row in results:
-        d = dict(zip(columns, row))
-        peak_paid = float(d["peak_paid"] or 0)
-        avg_pre = float(d["avg_pre_3mo_paid"] or 0)
+    peak_paid = _as_float(tbl["peak_paid"])
+    covid_era = pc.fill_null(tbl["covid_era"], False)
+    # COVID-era: many providers ramped for COVID then legitimately wound down
+    severity = pc.if_else(
+        covid_era, "low", pc.if_else(pc.greater(peak_paid, 500000), "high", "medium"))
 
-        severity = "high" if peak_paid > 500000 else "medium"
+    signals = []
+    for (npi, peak_month, peak_paid, peak_claims, total_months, post_3mo_paid,
+         post_peak_pct, avg_pre, state, taxonomy_code, severity, covid_era) in _rows(
+            tbl["npi"], tbl["peak_month"], peak_paid,
+            _as_int(tbl["peak_claims"]), _as_int(tbl["total_months"]),
+            _as_float(tbl["post_3mo_paid"]), _as_float(tbl["post_peak_pct_of_peak"]),
+            _as_float(tbl["avg_pre_3mo_paid"]), tbl["state"], tbl["taxonomy_code"],
+            severity, covid_era):
 
         overpayment = (avg_pre * 3 + peak_paid) * 0.4
 
-        peak_month_str = str(d["peak_month"])[:10] if d["peak_month"] else "unknown"
+        peak_month_str = str(peak_month)[:10] if peak_month else "unknown"
         evidence = {
             "peak_month": peak_month_str,
             "peak_paid": round(peak_paid, 2),
-            "peak_claims": int(d["peak_claims"] or 0),
+            "peak_claims": peak_claims,
             "avg_pre_3_months_paid": round(avg_pre, 2),
-            "post_peak_3_month_paid": round(float(d["post_3mo_paid"] or 0), 2),
-            "post_peak_pct_of_peak": round(float(d["post_peak_pct_of_peak"] or 0), 2),
-            "total_billing_months": int(d["total_months"] or 0),
-            "state": d["state"],
-            "taxonomy_code": d["taxonomy_code"],
+            "post_peak_3_month_paid": round(post_3mo_paid, 2),
+            "post_peak_pct_of_peak": round(post_peak_pct, 2),
+            "total_billing_months": total_months,
+            "state": state,
+            "taxonomy_code": taxonomy_code,
         }
-        # COVID-era: many providers ramped for COVID then legitimately wound down
-        if _is_covid_era(peak_month_str):
-            severity = "low"
+        if covid_era:
             evidence["covid_era_flag"] = True
 
         signals.append({
             "signal_type": "billing_bust_out",
             "severity": severity,
-            "npi": d["npi"],
+            "npi": npi,
             "evidence": evidence,
             "estimated_overpayment_usd": round(overpayment, 2),
         })
@@ -1778,7 +1853,7 @@ def signal_reimbursement_rate_anomaly(con: duckdb.DuckDBPyConnection) -> list[di
             cr.npi, cr.hcpcs_code, cr.total_paid, cr.total_claims,
             cr.avg_rate_per_claim, ns.median_rate, ns.p99_rate, ns.peer_count,
             cr.avg_rate_per_claim / NULLIF(ns.median_rate, 0) AS rate_ratio_to_median,
-            COALESCE(n.org_name, n.first_name || ' ' || n.last_name) AS provider_name,
+            n.display_name AS provider_name,
             n.state, n.taxonomy_code
         FROM code_rates cr
         JOIN national_stats ns ON cr.hcpcs_code = ns.hcpcs_code
@@ -1786,47 +1861,46 @@ def signal_reimbursement_rate_anomaly(con: duckdb.DuckDBPyConnection) -> list[di
         WHERE cr.avg_rate_per_claim > ns.median_rate * 3.0
         ORDER BY rate_ratio_to_median DESC
     """
-    results = con.execute(query).fetchall()
-    columns = [
-        "npi", "hcpcs_code", "total_paid", "total_claims",
-        "avg_rate_per_claim", "median_rate", "p99_rate", "peer_count",
-        "rate_ratio_to_median", "provider_name", "state", "taxonomy_code",
-    ]
+    tbl = _fetch_arrow(con, query)
+
+    avg_rate = _as_float(tbl["avg_rate_per_claim"])
+    p99_rate = _as_float(tbl["p99_rate"])
+    ratio = _as_float(tbl["rate_ratio_to_median"])
+    severity = pc.if_else(
+        pc.or_(pc.greater(ratio, 10),
+               pc.and_(pc.greater(ratio, 5), pc.greater(avg_rate, p99_rate))),
+        "high", "medium")
 
     signals = []
-    for row in results:
-        d = dict(zip(columns, row))
+    for (npi, hcpcs_code, total_paid, total_claims, avg_rate, median_rate, p99_rate,
+         peer_count, ratio, state, taxonomy_code, severity) in _rows(
+            tbl["npi"], tbl["hcpcs_code"], _as_float(tbl["total_paid"]),
+            _as_int(tbl["total_claims"]), avg_rate,
+            _as_float(tbl["median_rate"]), p99_rate,
+            _as_int(tbl["peer_count"]), ratio,
+            tbl["state"], tbl["taxonomy_code"], severity):
         # COVID-era: skip COVID HCPCS — CMS set unusual rates for these
-        if d["hcpcs_code"] in COVID_HCPCS:
+        if hcpcs_code in COVID_HCPCS:
             continue
 
-        ratio = float(d["rate_ratio_to_median"] or 0)
-        avg_rate = float(d["avg_rate_per_claim"] or 0)
-        median_rate = float(d["median_rate"] or 0)
-        p99_rate = float(d["p99_rate"] or 0)
-        total_claims = int(d["total_claims"] or 0)
-        total_paid = float(d["total_paid"] or 0)
-
-        severity = "high" if ratio > 10 or (ratio > 5 and avg_rate > p99_rate) else "medium"
-
         excess_per_claim = max(0, avg_rate - median_rate)
         overpayment = excess_per_claim * total_claims * 0.7
 
         signals.append({
             "signal_type": "reimbursement_rate_anomaly",
             "severity": severity,
-            "npi": d["npi"],
+            "npi": npi,
             "evidence": {
-                "hcpcs_code": d["hcpcs_code"],
+                "hcpcs_code": hcpcs_code,
                 "total_claims": total_claims,
                 "total_paid": round(total_paid, 2),
                 "avg_rate_per_claim": round(avg_rate, 2),
                 "national_median_rate": round(median_rate, 2),
                 "national_p99_rate": round(p99_rate, 2),
-                "peer_count": int(d["peer_count"] or 0),
+                "peer_count": peer_count,
                 "rate_ratio_to_median": round(ratio, 1),
-                "state": d["state"],
-                "taxonomy_code": d["taxonomy_code"],
+                "state": state,
+                "taxonomy_code": taxonomy_code,
             },
             "estimated_overpayment_usd": round(overpayment, 2),
         })
@@ -1873,7 +1947,7 @@ def signal_phantom_servicing_spread(con: duckdb.DuckDBPyConnection) -> list[dict
             hs.claims_per_bene,
             bl.p10_bene_ratio,
             bl.median_bene_ratio,
-            COALESCE(n.org_name, n.first_name || ' ' || n.last_name) AS provider_name,
+            n.display_name AS provider_name,
             n.taxonomy_code,
             n.state
         FROM hub_spread hs
@@ -1883,24 +1957,21 @@ def signal_phantom_servicing_spread(con: duckdb.DuckDBPyConnection) -> list[dict
            OR (bl.p10_bene_ratio IS NOT NULL AND hs.bene_claim_ratio < bl.p10_bene_ratio)
         ORDER BY hs.total_paid DESC
     """
-    results = con.execute(query).fetchall()
-    columns = [
-        "servicing_npi", "distinct_billing_npis", "total_paid", "total_claims",
-        "total_beneficiaries", "bene_claim_ratio", "claims_per_bene",
-        "p10_bene_ratio", "median_bene_ratio", "provider_name",
-        "taxonomy_code", "state",
-    ]
+    tbl = _fetch_arrow(con, query)
 
-    signals = []
-    for row in results:
-        d = dict(zip(columns, row))
-        claims_per_bene = float(d["claims_per_bene"] or 0)
-        total_paid = float(d["total_paid"] or 0)
-        total_claims = int(d["total_claims"] or 0)
-        total_benes = int(d["total_beneficiaries"] or 0)
-        p10_ratio = float(d["p10_bene_ratio"] or 0) if d["p10_bene_ratio"] else 0
+    claims_per_bene = _as_float(tbl["claims_per_bene"])
+    severity = pc.if_else(pc.greater(claims_per_bene, 200), "high", "medium")
 
-        severity = "high" if claims_per_bene > 200 else "medium"
+    signals = []
+    for (servicing_npi, distinct_billing_npis, total_paid, total_claims, total_benes,
+         bene_claim_ratio, claims_per_bene, p10_bene_ratio, provider_name, taxonomy_code,
+         state, severity) in _rows(
+            tbl["servicing_npi"], _as_int(tbl["distinct_billing_npis"]),
+            _as_float(tbl["total_paid"]), _as_int(tbl["total_claims"]),
+            _as_int(tbl["total_beneficiaries"]), _as_float(tbl["bene_claim_ratio"]),
+            claims_per_bene, tbl["p10_bene_ratio"], tbl["provider_name"],
+            tbl["taxonomy_code"], tbl["state"], severity):
+        p10_ratio = float(p10_bene_ratio or 0) if p10_bene_ratio else 0
 
         if total_benes > 0 and p10_ratio > 0:
             expected_claims = total_benes * (1.0 / p10_ratio)
@@ -1915,24 +1986,24 @@ def signal_phantom_servicing_spread(con: duckdb.DuckDBPyConnection) -> list[dict
             SELECT LIST(DISTINCT billing_npi)
             FROM servicing_hub_totals
             WHERE servicing_npi = ?
-        """, [d["servicing_npi"]]).fetchone()[0] or []
+        """, [servicing_npi]).fetchone()[0] or []
 
         signals.append({
             "signal_type": "phantom_servicing_spread",
             "severity": severity,
-            "npi": d["servicing_npi"],
+            "npi": servicing_npi,
             "evidence": {
-                "servicing_provider_name": d["provider_name"],
-                "distinct_billing_npis": int(d["distinct_billing_npis"] or 0),
+                "servicing_provider_name": provider_name,
+                "distinct_billing_npis": distinct_billing_npis,
                 "billing_npi_list": billing_list[:20],
                 "total_paid": round(total_paid, 2),
                 "total_claims": total_claims,
                 "total_beneficiaries": total_benes,
-                "bene_claim_ratio": round(float(d["bene_claim_ratio"] or 0), 4),
+                "bene_claim_ratio": round(bene_claim_ratio, 4),
                 "claims_per_beneficiary": round(claims_per_bene, 1),
                 "p10_bene_ratio_baseline": round(p10_ratio, 4),
-                "taxonomy_code": d["taxonomy_code"],
-                "state": d["state"],
+                "taxonomy_code": taxonomy_code,
+                "state": state,
             },
             "estimated_overpayment_usd": round(overpayment, 2),
         })
@@ -1989,102 +2060,61 @@ def compute_cross_signal_correlations(signal_results: dict[str, list[dict]]) ->
     }
 
 
-def run_all_signals(con: duckdb.DuckDBPyConnection) -> dict[str, list[dict]]:
-    """Run all 19 signals and return results grouped by type."""
-    print("\n[1/19] Signal: Excluded Provider Still Billing...")
-    excluded = signal_excluded_provider(con)
-    print(f"  Found {len(excluded)} flags")
-
-    print("[2/19] Signal: Billing Volume Outlier...")
-    outlier = signal_billing_outlier(con)
-    print(f"  Found {len(outlier)} flags")
-
-    print("[3/19] Signal: Rapid Billing Escalation...")
-    escalation = signal_rapid_escalation(con)
-    print(f"  Found {len(escalation)} flags")
-
-    print("[4/19] Signal: Workforce Impossibility...")
-    workforce = signal_workforce_impossibility(con)
-    print(f"  Found {len(workforce)} flags")
-
-    print("[5/19] Signal: Shared Authorized Official...")
-    official = signal_shared_official(con)
-    print(f"  Found {len(official)} flags")
-
-    print("[6/19] Signal: Geographic Implausibility...")
-    geo = signal_geographic_implausibility(con)
-    print(f"  Found {len(geo)} flags")
-
-    print("[7/19] Signal: Address Clustering...")
-    clustering = signal_address_clustering(con)
-    print(f"  Found {len(clustering)} flags")
-
-    print("[8/19] Signal: Upcoding Detection...")
-    upcoding = signal_upcoding(con)
-    print(f"  Found {len(upcoding)} flags")
-
-    print("[9/19] Signal: Concurrent Billing Across States...")
-    concurrent = signal_concurrent_billing(con)
-    print(f"  Found {len(concurrent)} flags")
-
-    print("[10/19] Signal: Burst Enrollment Network...")
-    burst = signal_burst_enrollment_network(con)
-    print(f"  Found {len(burst)} flags")
-
-    print("[11/19] Signal: Coordinated Billing Ramp...")
-    ramp = signal_coordinated_billing_ramp(con)
-    print(f"  Found {len(ramp)} flags")
-
-    print("[12/19] Signal: Phantom Servicing Hub...")
-    phantom = signal_phantom_servicing_hub(con)
-    print(f"  Found {len(phantom)} flags")
-
-    print("[13/19] Signal: Network Beneficiary Dilution...")
-    dilution = signal_network_beneficiary_dilution(con)
-    print(f"  Found {len(dilution)} flags")
-
-    print("[14/19] Signal: Family Caregiver Density Anomaly...")
-    caregiver = signal_caregiver_density_anomaly(con)
-    print(f"  Found {len(caregiver)} flags")
-
-    print("[15/19] Signal: Repetitive Service Abuse...")
-    repetitive = signal_repetitive_service_abuse(con)
-    print(f"  Found {len(repetitive)} flags")
-
-    print("[16/19] Signal: Billing Monoculture...")
-    monoculture = signal_billing_monoculture(con)
-    print(f"  Found {len(monoculture)} flags")
-
-    print("[17/19] Signal: Billing Bust-Out...")
-    bust_out = signal_billing_bust_out(con)
-    print(f"  Found {len(bust_out)} flags")
+# Run order, result key and progress label for every signal.
+SIGNALS = (
+    ("excluded_provider", "Excluded Provider Still Billing", signal_excluded_provider),
+    ("billing_outlier", "Billing Volume Outlier", signal_billing_outlier),
+    ("rapid_escalation", "Rapid Billing Escalation", signal_rapid_escalation),
+    ("workforce_impossibility", "Workforce Impossibility", signal_workforce_impossibility),
+    ("shared_official", "Shared Authorized Official", signal_shared_official),
+    ("geographic_implausibility", "Geographic Implausibility", signal_geographic_implausibility),
+    ("address_clustering", "Address Clustering", signal_address_clustering),
+    ("upcoding", "Upcoding Detection", signal_upcoding),
+    ("concurrent_billing", "Concurrent Billing Across States", signal_concurrent_billing),
+    ("burst_enrollment_network", "Burst Enrollment Network", signal_burst_enrollment_network),
+    ("coordinated_billing_ramp", "Coordinated Billing Ramp", signal_coordinated_billing_ramp),
+    ("phantom_servicing_hub", "Phantom Servicing Hub", signal_phantom_servicing_hub),
+    ("network_beneficiary_dilution", "Network Beneficiary Dilution", signal_network_beneficiary_dilution),
+    ("caregiver_density_anomaly", "Family Caregiver Density Anomaly", signal_caregiver_density_anomaly),
+    ("repetitive_service_abuse", "Repetitive Service Abuse", signal_repetitive_service_abuse),
+    ("billing_monoculture", "Billing Monoculture", signal_billing_monoculture),
+    ("billing_bust_out", "Billing Bust-Out", signal_billing_bust_out),
+    ("reimbursement_rate_anomaly", "Reimbursement Rate Anomaly", signal_reimbursement_rate_anomaly),
+    ("phantom_servicing_spread", "Phantom Servicing Spread", signal_phantom_servicing_spread),
+)
+
+# Signal queries in flight at once. DuckDB already parallelizes inside each
+# query, so a few concurrent queries are enough to fill the gaps left by
+# the small ones without oversubscribing the shared thread pool.
+SIGNAL_WORKERS = 4
+
+
+def _run_signal(con: duckdb.DuckDBPyConnection, fn) -> list[dict]:
+    """Run one signal on its own cursor so concurrent queries don't share state."""
+    cur = con.cursor()
+    try:
+        return fn(cur)
+    finally:
+        cur.close()
 
-    print("[18/19] Signal: Reimbursement Rate Anomaly...")
-    rate_anomaly = signal_reimbursement_rate_anomaly(con)
-    print(f"  Found {len(rate_anomaly)} flags")
 
-    print("[19/19] Signal: Phantom Servicing Spread...")
-    spread = signal_phantom_servicing_spread(con)
-    print(f"  Found {len(spread)} flags")
+def run_all_signals(con: duckdb.DuckDBPyConnection) -> dict[str, list[dict]]:
+    """Run all 19 signals and return results grouped by type.
 
-    return {
-        "excluded_provider": excluded,
-        "billing_outlier": outlier,
-        "rapid_escalation": escalation,
-        "workforce_impossibility": workforce,
-        "shared_official": official,
-        "geographic_implausibility": geo,
-        "address_clustering": clustering,
-        "upcoding": upcoding,
-        "concurrent_billing": concurrent,
-        "burst_enrollment_network": burst,
-        "coordinated_billing_ramp": ramp,
-        "phantom_servicing_hub": phantom,
-        "network_beneficiary_dilution": dilution,
-        "caregiver_density_anomaly": caregiver,
-        "repetitive_service_abuse": repetitive,
-        "billing_monoculture": monoculture,
-        "billing_bust_out": bust_out,
-        "reimbursement_rate_anomaly": rate_anomaly,
-        "phantom_servicing_spread": spread,
-    }
+    Signals are independent read-only queries, so they run concurrently on
+    separate cursors. Progress is reported as each signal finishes, and the
+    returned dict keeps signal order regardless of completion order.
+    """
+    total = len(SIGNALS)
+    with ThreadPoolExecutor(max_workers=SIGNAL_WORKERS) as pool:
+        futures = {
+            pool.submit(_run_signal, con, fn): (key, label)
+            for key, label, fn in SIGNALS
+        }
+        finished = {}
+        print()
+        for i, future in enumerate(as_completed(futures), 1):
+            key, label = futures[future]
+            finished[key] = future.result()
+            print(f"[{i}/{total}] Signal: {label}... {len(finished[key])} flags")
+    return {key: finished[key] for key, _, _ in SIGNALS}
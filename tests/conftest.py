@@ -239,6 +239,13 @@ def con():
         ALTER TABLE leie ADD COLUMN rein_date DATE;
         UPDATE leie SET rein_date = CASE WHEN LENGTH(TRIM(rein_date_raw)) = 8 THEN TRY_STRPTIME(rein_date_raw, '%Y%m%d') ELSE NULL END;
     """)
+    c.execute("""
+        CREATE TABLE leie_valid AS
+        SELECT npi, excl_date, excl_type, rein_date, lastname, firstname, busname
+        FROM leie
+        WHERE npi IS NOT NULL AND TRIM(npi) != '' AND npi != '0000000000'
+          AND excl_date IS NOT NULL
+    """)
 
     # Create NPPES table
     c.execute("""
@@ -359,6 +366,15 @@ def con():
             ('1900000006', '2', 'Spread Client 6', NULL, NULL, 'TX', '75007', '207Q00000X', '2018-06-01'::DATE, NULL, NULL)
         ) AS t(npi, entity_type_code, org_name, last_name, first_name, state, zip_code, taxonomy_code, enumeration_date, auth_official_last, auth_official_first)
     """)
+    c.execute("""
+        ALTER TABLE nppes ADD COLUMN display_name VARCHAR;
+        ALTER TABLE nppes ADD COLUMN auth_official_last_norm VARCHAR;
+        ALTER TABLE nppes ADD COLUMN auth_official_first_norm VARCHAR;
+        UPDATE nppes SET
+            display_name = COALESCE(org_name, first_name || ' ' || last_name),
+            auth_official_last_norm = NULLIF(UPPER(TRIM(auth_official_last)), ''),
+            auth_official_first_norm = NULLIF(UPPER(TRIM(auth_official_first)), '');
+    """)
 
     # Pre-compute materialized aggregation tables (matches production ingest)
     c.execute("""
@@ -371,6 +387,16 @@ def con():
         FROM spending
         GROUP BY billing_npi
     """)
+    c.execute("""
+        CREATE TABLE provider_enriched AS
+        SELECT
+            pt.npi, pt.total_paid, pt.total_claims, pt.total_beneficiaries,
+            n.taxonomy_code, n.state, n.entity_type_code, n.zip_code, n.enumeration_date,
+            n.auth_official_first, n.auth_official_last, n.org_name,
+            n.display_name AS provider_name
+        FROM provider_totals pt
+        LEFT JOIN nppes n ON pt.npi = n.npi
+    """)
 
     c.execute("""
         CREATE TABLE provider_code_totals AS
@@ -395,10 +421,48 @@ def con():
         FROM spending
         GROUP BY billing_npi, claim_month
     """)
+    c.execute("""
+        CREATE TABLE provider_first_bill AS
+        SELECT npi, MIN(claim_month) AS first_bill_month
+        FROM provider_monthly
+        GROUP BY npi
+    """)
+
+    c.execute("""
+        CREATE TABLE official_networks AS
+        SELECT
+            auth_official_last_norm || '|' || auth_official_first_norm AS network_key,
+            auth_official_first_norm AS official_first,
+            auth_official_last_norm AS official_last,
+            npi,
+            org_name,
+            state
+        FROM nppes
+        WHERE auth_official_last_norm IS NOT NULL
+          AND auth_official_first_norm IS NOT NULL
+    """)
+
+    c.execute("""
+        CREATE TABLE network_totals AS
+        SELECT
+            on_net.network_key,
+            on_net.official_first,
+            on_net.official_last,
+            COUNT(DISTINCT on_net.npi) AS npi_count,
+            LIST(DISTINCT on_net.npi) AS npi_list,
+            LIST(DISTINCT on_net.org_name) AS org_names,
+            SUM(pt.total_paid) AS combined_paid,
+            SUM(pt.total_claims) AS combined_claims,
+            SUM(pt.total_beneficiaries) AS combined_beneficiaries
+        FROM official_networks on_net
+        JOIN provider_totals pt ON on_net.npi = pt.npi
+        GROUP BY on_net.network_key, on_net.official_first, on_net.official_last
+    """)
 
     c.execute("""
         CREATE TABLE spending_em AS
-        SELECT billing_npi, hcpcs_code, total_claims, total_paid
+        SELECT billing_npi, hcpcs_code, total_claims, total_paid,
+               hcpcs_code IN ('99215','99205','99223','99233','99245','99255') AS is_high_em
         FROM spending
         WHERE hcpcs_code IN (
             '99201','99202','99203','99204','99205',
@@ -458,7 +522,7 @@ def con():
             n.state,
             n.npi,
             n.entity_type_code,
-            COALESCE(n.org_name, n.first_name || ' ' || n.last_name) AS provider_name,
+            n.display_name AS provider_name,
             SUM(sh.total_paid) AS hh_paid,
             SUM(sh.total_claims) AS hh_claims,
             SUM(sh.unique_beneficiaries) AS hh_beneficiaries
@@ -466,7 +530,7 @@ def con():
         JOIN nppes n ON sh.billing_npi = n.npi
         WHERE n.zip_code IS NOT NULL AND TRIM(n.zip_code) != ''
         GROUP BY n.zip_code, n.state, n.npi, n.entity_type_code,
-                 COALESCE(n.org_name, n.first_name || ' ' || n.last_name)
+                 n.display_name
     """)
 
     c.execute("""
@@ -2,7 +2,12 @@
 
 import sys
 import os
+import json
+import gzip
 import tempfile
+
+import pytest
+
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.signals import (
@@ -29,6 +34,9 @@ from src.signals import (
 )
 from src.output import (
     generate_report,
+    write_report,
+    write_fof_report,
+    write_all_reports,
     write_html_report,
     compute_risk_score,
     generate_case_narrative,
@@ -39,6 +47,10 @@ from src.output import (
     NEXT_STEPS_MAP,
     CLAIM_TYPE_MAP,
     METHODOLOGY,
+    _select_top_providers,
+    _batch_load_provider_info,
+    _render_network_cards,
+    _dump_json,
 )
 from src.signals import compute_cross_signal_correlations, _is_covid_era, COVID_HCPCS
 
@@ -178,6 +190,15 @@ class TestSignalSharedOfficial:
             if r["evidence"]["combined_total_paid"] > 0:
                 assert r["estimated_overpayment_usd"] > 0
 
+    def test_shared_official_requires_state_concentration(self, con):
+        """No more than two NPIs per state means a likely name collision, not a network."""
+        states = ["CA", "CA", "TX", "TX", "NY"]
+        for npi, state in zip(["6666666661", "6666666662", "6666666663", "6666666664", "6666666665"], states):
+            con.execute("UPDATE nppes SET state = ? WHERE npi = ?", [state, npi])
+            con.execute("UPDATE official_networks SET state = ? WHERE npi = ?", [state, npi])
+        results = signal_shared_official(con)
+        assert not any("ROBERT SMITH" in r["evidence"]["authorized_official_name"] for r in results)
+
 
 class TestSignalGeographicImplausibility:
     """Signal 6: Geographic Implausibility (multi-state billing mismatch)."""
@@ -309,6 +330,12 @@ class TestSignalConcurrentBilling:
         # 5555555555 is an org (entity_type_code=2)
         assert "5555555555" not in npis
 
+    def test_multi_state_organization_not_flagged(self, con):
+        """The same multi-state billing pattern is excluded once the NPI is an org."""
+        con.execute("UPDATE nppes SET entity_type_code = '2' WHERE npi = '9800000001'")
+        results = signal_concurrent_billing(con)
+        assert "9800000001" not in [r["npi"] for r in results]
+
 
 class TestSignalBurstEnrollmentNetwork:
     """Signal 10: Burst Enrollment Network."""
@@ -926,6 +953,105 @@ class TestOutputGeneration:
                 score_b = providers[i + 1].get("risk_score", {}).get("score", 0)
                 assert score_a >= score_b
 
+    def test_write_all_reports_writes_every_output(self, con):
+        signal_results = run_all_signals(con)
+        report = generate_report(signal_results, con, 100)
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = {name: os.path.join(tmp, name)
+                     for name in ("r.json", "r.html", "fof.json", "fof.html")}
+            write_all_reports(report, paths["r.json"], html_path=paths["r.html"],
+                              fof_json_path=paths["fof.json"], fof_html_path=paths["fof.html"])
+            for path in paths.values():
+                assert os.path.getsize(path) > 0
+            with open(paths["r.json"]) as f:
+                assert json.load(f)["total_providers_flagged"] == report["total_providers_flagged"]
+
+    def test_json_report_compact_by_default(self, con):
+        signal_results = run_all_signals(con)
+        report = generate_report(signal_results, con, 100)
+        with tempfile.TemporaryDirectory() as tmp:
+            compact, pretty = os.path.join(tmp, "c.json"), os.path.join(tmp, "p.json")
+            write_report(report, compact)
+            write_report(report, pretty, pretty=True)
+            with open(compact) as f:
+                compact_text = f.read()
+            with open(pretty) as f:
+                pretty_text = f.read()
+        assert "\n" not in compact_text
+        assert pretty_text.startswith('{\n  "')
+        assert json.loads(compact_text) == json.loads(pretty_text)
+
+    def test_json_fallback_matches_orjson_bytes(self, monkeypatch):
+        pytest.importorskip("orjson")
+        doc = {"provider_name": "Clínica Niño", "paid": 1234.5, "npis": ["1", "2"]}
+        for pretty in (False, True):
+            fast = _dump_json(doc, pretty)
+            monkeypatch.setattr("src.output.orjson", None)
+            assert _dump_json(doc, pretty) == fast
+            monkeypatch.undo()
+
+    def test_json_report_gzip_suffix(self, con):
+        signal_results = run_all_signals(con)
+        report = generate_report(signal_results, con, 100)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "report.json.gz")
+            write_report(report, path)
+            with gzip.open(path, "rt") as f:
+                data = json.load(f)
+        assert data["total_providers_flagged"] == report["total_providers_flagged"]
+
+    def test_html_report_gzip_suffix(self, con):
+        signal_results = run_all_signals(con)
+        report = generate_report(signal_results, con, 100)
+        with tempfile.TemporaryDirectory() as tmp:
+            plain, packed = os.path.join(tmp, "r.html"), os.path.join(tmp, "r.html.gz")
+            write_html_report(report, plain)
+            write_html_report(report, packed)
+            with open(plain, encoding="utf-8") as f, gzip.open(packed, "rt", encoding="utf-8") as g:
+                assert f.read() == g.read()
+
+    def test_fof_json_report_round_trips(self, con):
+        signal_results = run_all_signals(con)
+        report = generate_report(signal_results, con, 100)
+        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
+            path = f.name
+        try:
+            write_fof_report(report, path)
+            with open(path) as f:
+                loaded = json.load(f)
+            assert "summary" in loaded
+            assert isinstance(loaded["networks"], list)
+        finally:
+            os.unlink(path)
+
+    def test_fof_network_cards_render_members_and_narratives(self):
+        members = [
+            {"npi": f"1{j:09d}", "provider_name": f"Care <{j}> & Co", "state": "MN",
+             "total_paid_all_time": 1000.0, "estimated_overpayment_usd": 100.0,
+             "risk_score": {"score": j, "tier": "high"},
+             "case_narrative": f"Narrative {j}" if j % 2 else ""}
+            for j in range(55)
+        ]
+        network = {
+            "network_label": "Official <X>", "network_type": "shared_official_network",
+            "member_count": len(members), "members": members, "states": ["MN"],
+            "combined_total_paid": 55000.0, "combined_estimated_overpayment": 5500.0,
+            "highest_risk_tier": "high", "signal_types_detected": ["shared_official"],
+        }
+        html = _render_network_cards([network, network], {}, start=3)
+        assert html.count('<div class="network-card high">') == 2
+        assert "<h3>#3. Official &lt;X&gt;</h3>" in html and "<h3>#4." in html
+        assert "Care &lt;0&gt; &amp; Co" in html
+        assert html.count("... and 5 more members") == 2
+        # Top three scores are 54, 53, 52; only the odd ones carry narratives
+        assert "Narrative 53" in html and "Narrative 51" not in html
+        assert html.count("<strong>Signals:</strong>") == 2
+
+        bare = dict(network, signal_types_detected=[], members=members[::2])
+        bare_html = _render_network_cards([bare], {})
+        assert "<strong>Signals:</strong>" not in bare_html
+        assert 'class="narrative"' not in bare_html
+
 
 class TestCrossSignalCorrelations:
     """Test cross-signal correlation analysis."""
@@ -996,6 +1122,25 @@ class TestMethodology:
         for tier in ["critical", "high", "medium", "low"]:
             assert tier in METHODOLOGY["risk_scoring"]["tiers"]
 
+    def test_methodology_serializes_in_json_report(self, con):
+        signal_results = run_all_signals(con)
+        report = generate_report(signal_results, con, 100)
+        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
+            path = f.name
+        try:
+            write_report(report, path)
+            with open(path) as f:
+                loaded = json.load(f)
+            assert loaded["methodology"]["signals"]["upcoding"]["threshold"] == (
+                METHODOLOGY["signals"]["upcoding"]["threshold"]
+            )
+        finally:
+            os.unlink(path)
+
+    def test_methodology_is_read_only(self):
+        with pytest.raises(TypeError):
+            METHODOLOGY["signals"]["upcoding"]["threshold"] = "changed"
+
 
 class TestClaimTypeMap:
     """Test the FCA claim type mappings."""
@@ -1201,6 +1346,15 @@ class TestHtmlReportDetails:
 class TestKnownLegitimateEntityFilter:
     """Test the known legitimate entity filter to prevent false positives."""
 
+    def test_every_listed_substring_matches(self):
+        from src.output import _LEGITIMATE_ENTITY_SUBSTRINGS
+        for substring in _LEGITIMATE_ENTITY_SUBSTRINGS:
+            assert is_known_legitimate_entity(f"ZZ {substring.upper()} ZZ"), substring
+
+    def test_case_sensitive_patterns_stay_case_sensitive(self):
+        assert is_known_legitimate_entity("AUSTIN ISD")
+        assert not is_known_legitimate_entity("Jones isd therapy")
+
     def test_filters_school_districts(self):
         assert is_known_legitimate_entity("ANTIOCH UNIFIED SCHOOL DISTRICT")
         assert is_known_legitimate_entity("FAIRFIELD PUBLIC SCHOOLS")
@@ -1318,6 +1472,18 @@ class TestCovidEraAwareness:
                 f"COVID-era bust-out should be severity 'low', got '{r['severity']}'"
             )
 
+    def test_bust_out_covid_peak_flagged(self, con):
+        """The SQL-side covid_era column downgrades a peak month inside the PHE window."""
+        con.execute("""
+            UPDATE provider_monthly SET claim_month = claim_month - INTERVAL '3 years'
+            WHERE npi = '1700000001'
+        """)
+        results = signal_billing_bust_out(con)
+        r = next(r for r in results if r["npi"] == "1700000001")
+        assert r["evidence"]["peak_month"].startswith("2020-06")
+        assert r["evidence"]["covid_era_flag"] is True
+        assert r["severity"] == "low"
+
     def test_workforce_impossibility_covid_downgraded(self, con):
         results = signal_workforce_impossibility(con)
         covid_results = [r for r in results if r["evidence"].get("covid_era_flag")]
@@ -1326,6 +1492,31 @@ class TestCovidEraAwareness:
                 f"COVID-era workforce impossibility should be severity 'low', got '{r['severity']}'"
             )
 
+    def test_workforce_impossibility_covid_peak_flagged(self, con):
+        """The SQL-side covid_era column downgrades a peak month inside the PHE window."""
+        for table in ("provider_monthly", "org_worker_monthly"):
+            con.execute(f"""
+                UPDATE {table} SET claim_month = claim_month - INTERVAL '3 years'
+                WHERE npi = '5555555555'
+            """)
+        results = signal_workforce_impossibility(con)
+        r = next(r for r in results if r["npi"] == "5555555555")
+        assert r["evidence"]["peak_month"].startswith("2020-06")
+        assert r["evidence"]["covid_era_flag"] is True
+        assert r["severity"] == "low"
+
+    def test_burst_enrollment_covid_quarter_flagged(self, con):
+        """A cluster enumerated inside the PHE window is flagged in SQL and downgraded."""
+        con.execute("""
+            UPDATE nppes SET enumeration_date = enumeration_date - INTERVAL '30 months'
+            WHERE state = 'OH' AND taxonomy_code = '261QR0400X'
+        """)
+        results = signal_burst_enrollment_network(con)
+        r = next(r for r in results if r["evidence"]["state"] == "OH")
+        assert r["evidence"]["earliest_enumeration"].startswith("2020-")
+        assert r["evidence"]["covid_era_flag"] is True
+        assert r["severity"] == "low"
+
     def test_non_covid_signals_unchanged(self, con):
         """Signals outside COVID window should not be affected."""
         results = signal_rapid_escalation(con)
@@ -1334,3 +1525,57 @@ class TestCovidEraAwareness:
             assert r["severity"] in ("medium", "high"), (
                 f"Non-COVID rapid_escalation should be medium/high, got '{r['severity']}'"
             )
+
+
+class TestSelectTopProviders:
+    """Top-provider selection keeps per-signal representation under the cap."""
+
+    @staticmethod
+    def _provider(npi, score, stype):
+        return {
+            "npi": npi,
+            "risk_score": {"score": score},
+            "estimated_overpayment_usd": float(score),
+            "signals": [{"signal_type": stype}],
+        }
+
+    def test_returns_all_when_under_cap(self):
+        providers = [self._provider(str(i), 100 - i, "upcoding") for i in range(3)]
+        assert _select_top_providers(providers, max_providers=5) == providers
+
+    def test_rare_signal_type_is_represented(self):
+        providers = [self._provider(str(i), 100 - i, "upcoding") for i in range(20)]
+        providers.append(self._provider("rare", 1, "excluded_provider"))
+        selected = _select_top_providers(providers, max_providers=10, min_per_signal=2)
+        npis = [p["npi"] for p in selected]
+        assert len(selected) == 10
+        assert "rare" in npis
+        assert npis[:9] == [str(i) for i in range(9)]
+
+    def test_preserves_risk_order(self):
+        providers = [self._provider(str(i), 100 - i, "upcoding" if i % 2 else "billing_outlier")
+                     for i in range(30)]
+        selected = _select_top_providers(providers, max_providers=12, min_per_signal=3)
+        scores = [p["risk_score"]["score"] for p in selected]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_unsorted_input_matches_sorted_input(self):
+        providers = [self._provider(str(i), (i * 37) % 101, "upcoding" if i % 3 else "billing_outlier")
+                     for i in range(60)]
+        ranked = sorted(providers, key=lambda p: p["risk_score"]["score"], reverse=True)
+        assert (_select_top_providers(providers, max_providers=15, min_per_signal=4)
+                == _select_top_providers(ranked, max_providers=15, min_per_signal=4))
+
+
+class TestBatchLoadProviderInfo:
+    """Provider info loading gives the same maps whether chunked or not."""
+
+    def test_chunked_load_matches_single_batch(self, con):
+        npis = [r[0] for r in con.execute("SELECT npi FROM nppes ORDER BY npi").fetchall()]
+        single = _batch_load_provider_info(npis, con)
+        chunked = _batch_load_provider_info(npis, con, chunk_size=3)
+        assert chunked == single
+        assert set(single[0]) == set(npis)
+
+    def test_empty_list(self, con):
+        assert _batch_load_provider_info([], con) == ({}, {})